@@ -1,5 +1,6 @@
 """Extended Exchange Trading Bot Module."""
 
+from bot.event_loop import install_uvloop
 from bot.trading_bot import ExtendedTradingBot
 
-__all__ = ["ExtendedTradingBot"]
+__all__ = ["ExtendedTradingBot", "install_uvloop"]
@@ -1,16 +1,24 @@
 """Модуль работы с аккаунтом пользователя."""
 
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from x10.perpetual.accounts import AccountModel
 from x10.perpetual.balances import BalanceModel
 from x10.perpetual.orders import OpenOrderModel, OrderSide, OrderType
 from x10.perpetual.positions import PositionModel, PositionSide
 from x10.perpetual.trading_client import PerpetualTradingClient
-from x10.utils.http import WrappedApiResponse
+from x10.utils.http import ResponseStatus, WrappedApiResponse
 
 from bot.websocket_manager import WebSocketManager
 
+# Статус для ответов, собранных из кэша WebSocket
+_OK_STATUS = ResponseStatus.OK
+
+
+def _no_cached_balance() -> Optional[BalanceModel]:
+    """Источник баланса, пока кэш WebSocket недоступен."""
+    return None
+
 
 class AccountManager:
     """Менеджер для работы с аккаунтом пользователя."""
@@ -29,6 +37,18 @@ class AccountManager:
         """
         self._client = trading_client
         self._websocket_manager = websocket_manager
+        # Источник кэшированного баланса переключается при синхронизации/потере потока,
+        # чтобы горячий путь get_balance не проверял состояние менеджера на каждом вызове
+        self._cached_balance_fn: Callable[[], Optional[BalanceModel]] = _no_cached_balance
+        if websocket_manager is not None:
+            websocket_manager.subscribe_to_state_changes(self._on_websocket_state)
+
+    def _on_websocket_state(self, is_synced: bool) -> None:
+        """Переключить источник кэшированного баланса при синхронизации/потере потока."""
+        if is_synced and self._websocket_manager is not None:
+            self._cached_balance_fn = self._websocket_manager.get_cached_balance
+        else:
+            self._cached_balance_fn = _no_cached_balance
 
     async def get_user_info(self) -> WrappedApiResponse[AccountModel]:
         """
@@ -49,14 +69,12 @@ class AccountManager:
         Returns:
             WrappedApiResponse[BalanceModel]: Баланс пользователя
         """
-        # Проверяем, можно ли использовать кэш WebSocket
-        if use_cache and self._websocket_manager and self._websocket_manager.is_running:
-            cached_balance = self._websocket_manager.get_cached_balance()
+        # Кэш WebSocket: пока он не синхронизирован, _cached_balance_fn возвращает None
+        if use_cache:
+            cached_balance = self._cached_balance_fn()
             if cached_balance is not None:
                 # Возвращаем кэшированные данные в формате WrappedApiResponse
-                from x10.utils.http import ResponseStatus
-
-                return WrappedApiResponse(status=ResponseStatus.OK, data=cached_balance)
+                return WrappedApiResponse(status=_OK_STATUS, data=cached_balance)
 
         # Fallback на REST API
         return await self._client.account.get_balance()
@@ -79,26 +97,72 @@ class AccountManager:
             WrappedApiResponse[List[PositionModel]]: Список открытых позиций
         """
         # Проверяем, можно ли использовать кэш WebSocket
-        if use_cache and self._websocket_manager and self._websocket_manager.is_running:
-            cached_positions = self._websocket_manager.get_cached_positions()
-
-            # Применяем фильтры, если указаны
-            filtered_positions = cached_positions
-            if market_names:
-                filtered_positions = [p for p in filtered_positions if p.market in market_names]
-            if position_side:
-                filtered_positions = [p for p in filtered_positions if p.side == position_side]
+        wsm = self._websocket_manager
+        if use_cache and wsm is not None and wsm.is_synced:
+            # Список рынков приводим к frozenset один раз: дубликаты схлопываются,
+            # а фильтры применяются по индексам кэша без полного прохода по списку
+            market_filter = frozenset(market_names) if market_names else None
+            filtered_positions = list(
+                wsm.iter_positions(market_names=market_filter, side=position_side)
+            )
 
             # Возвращаем кэшированные данные в формате WrappedApiResponse
-            from x10.utils.http import ResponseStatus
-
-            return WrappedApiResponse(status=ResponseStatus.OK, data=filtered_positions)
+            return WrappedApiResponse(status=_OK_STATUS, data=filtered_positions)
 
         # Fallback на REST API
         return await self._client.account.get_positions(
             market_names=market_names, position_side=position_side
         )
 
+    async def has_position(self, market_name: str, use_cache: bool = True) -> bool:
+        """
+        Проверить наличие открытой позиции по рынку.
+
+        Args:
+            market_name: Название рынка
+            use_cache: Использовать кэш WebSocket, если доступен (по умолчанию True)
+
+        Returns:
+            bool: True, если позиция есть
+        """
+        wsm = self._websocket_manager
+        if use_cache and wsm is not None and wsm.is_synced:
+            return wsm.has_cached_position(market_name)
+
+        # Fallback на REST API
+        response = await self._client.account.get_positions(market_names=[market_name])
+        return bool(response.data)
+
+    async def count_positions(
+        self,
+        market_names: Optional[List[str]] = None,
+        position_side: Optional[PositionSide] = None,
+        use_cache: bool = True,
+    ) -> int:
+        """
+        Посчитать открытые позиции без построения списка из кэша.
+
+        Args:
+            market_names: Список названий рынков для фильтрации (опционально)
+            position_side: Сторона позиции для фильтрации (опционально)
+            use_cache: Использовать кэш WebSocket, если доступен (по умолчанию True)
+
+        Returns:
+            int: Количество открытых позиций
+        """
+        wsm = self._websocket_manager
+        if use_cache and wsm is not None and wsm.is_synced:
+            return wsm.count_cached_positions(
+                market_names=frozenset(market_names) if market_names else None,
+                side=position_side,
+            )
+
+        # Fallback на REST API
+        response = await self._client.account.get_positions(
+            market_names=market_names, position_side=position_side
+        )
+        return len(response.data or ())
+
     async def get_open_orders(
         self,
         market_names: Optional[List[str]] = None,
@@ -119,22 +183,19 @@ class AccountManager:
             WrappedApiResponse[List[OpenOrderModel]]: Список открытых ордеров
         """
         # Проверяем, можно ли использовать кэш WebSocket
-        if use_cache and self._websocket_manager and self._websocket_manager.is_running:
-            cached_orders = self._websocket_manager.get_cached_orders()
-
-            # Применяем фильтры, если указаны
-            filtered_orders = cached_orders
-            if market_names:
-                filtered_orders = [o for o in filtered_orders if o.market in market_names]
-            if order_type:
-                filtered_orders = [o for o in filtered_orders if o.type == order_type]
-            if order_side:
-                filtered_orders = [o for o in filtered_orders if o.side == order_side]
+        wsm = self._websocket_manager
+        if use_cache and wsm is not None and wsm.is_synced:
+            # Список рынков приводим к frozenset один раз: дубликаты схлопываются,
+            # а фильтры применяются по индексам кэша без полного прохода по списку
+            market_filter = frozenset(market_names) if market_names else None
+            filtered_orders = list(
+                wsm.iter_orders(
+                    market_names=market_filter, order_type=order_type, order_side=order_side
+                )
+            )
 
             # Возвращаем кэшированные данные в формате WrappedApiResponse
-            from x10.utils.http import ResponseStatus
-
-            return WrappedApiResponse(status=ResponseStatus.OK, data=filtered_orders)
+            return WrappedApiResponse(status=_OK_STATUS, data=filtered_orders)
 
         # Fallback на REST API
         return await self._client.account.get_open_orders(
@@ -0,0 +1,157 @@
+"""Асинхронный circuit breaker для REST вызовов к бирже."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Optional, TypeVar
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Ошибки транспорта: биржа недоступна или не ответила вовремя
+_TRANSPORT_ERRORS = (
+    asyncio.TimeoutError,
+    ConnectionError,
+    OSError,
+    aiohttp.ClientConnectionError,
+    aiohttp.ServerTimeoutError,
+)
+
+
+def is_transport_failure(error: Exception) -> bool:
+    """
+    Ошибка говорит о недоступности биржи: транспорт, таймаут или HTTP 5xx.
+
+    Отказы по самому запросу (валидация, 4xx, недостаточно маржи) биржей
+    обработаны и breaker не открывают.
+
+    Args:
+        error: Исключение REST вызова
+
+    Returns:
+        True, если ошибка учитывается breaker'ом
+    """
+    if isinstance(error, _TRANSPORT_ERRORS):
+        return True
+    status = getattr(error, "status", None)
+    if status is None:
+        status = getattr(error, "status_code", None)
+    return isinstance(status, int) and status >= 500
+
+
+class CircuitOpenError(RuntimeError):
+    """Вызов отклонён без обращения к бирже: circuit breaker открыт."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker с состояниями closed → open → half-open.
+
+    После failure_threshold ошибок подряд breaker открывается и сразу отклоняет
+    вызовы в течение recovery_timeout секунд. Затем пропускается один пробный
+    вызов (half-open): при успехе breaker закрывается, при ошибке — снова открывается.
+
+    Ошибкой считается только исключение, для которого is_failure возвращает True;
+    остальные исключения пробрасываются, но означают, что биржа ответила, и
+    учитываются как успешный вызов.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        is_failure: Callable[[Exception], bool] = is_transport_failure,
+    ):
+        """
+        Инициализация circuit breaker.
+
+        Args:
+            name: Имя breaker'а для логов (например, название рынка)
+            failure_threshold: Количество ошибок подряд до открытия
+            recovery_timeout: Время в секундах до пробного вызова
+            is_failure: Предикат ошибки, учитываемой breaker'ом
+                (по умолчанию транспорт, таймаут и HTTP 5xx)
+        """
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._is_failure = is_failure
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Текущее состояние: 'closed', 'open' или 'half_open'."""
+        if self._opened_at is None:
+            return "closed"
+        if self._probe_in_flight:
+            return "half_open"
+        return "open"
+
+    async def call(self, func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """
+        Выполнить асинхронный вызов через breaker.
+
+        Args:
+            func: Асинхронная функция (REST вызов)
+            *args: Позиционные аргументы вызова
+            **kwargs: Именованные аргументы вызова
+
+        Returns:
+            Результат вызова func
+
+        Raises:
+            CircuitOpenError: Если breaker открыт и время восстановления не истекло
+        """
+        now = asyncio.get_running_loop().time()
+        is_probe = False
+        if self._opened_at is not None:
+            if self._probe_in_flight or now - self._opened_at < self._recovery_timeout:
+                raise CircuitOpenError(f"Circuit breaker '{self._name}' открыт")
+            self._probe_in_flight = True
+            is_probe = True
+
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            if self._is_failure(e):
+                self._record_failure()
+            else:
+                self._record_success()
+            raise
+        finally:
+            if is_probe:
+                self._probe_in_flight = False
+
+        self._record_success()
+        return result
+
+    def _record_success(self) -> None:
+        """Биржа ответила: сбросить счётчик ошибок и закрыть breaker."""
+        if self._opened_at is not None:
+            logger.info("Circuit breaker '%s' закрыт", self._name)
+        self._failures = 0
+        self._opened_at = None
+
+    def _record_failure(self) -> None:
+        """
+        Учесть ошибку и при необходимости открыть breaker.
+
+        Время открытия берётся в момент ошибки, а не начала вызова: иначе вызов,
+        длившийся дольше recovery_timeout (например, по таймауту), открыл бы breaker
+        с уже истёкшим временем восстановления.
+        """
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self._failure_threshold:
+            if self._opened_at is None:
+                logger.warning(
+                    "Circuit breaker '%s' открыт после %d ошибок подряд",
+                    self._name,
+                    self._failures,
+                )
+            self._opened_at = asyncio.get_running_loop().time()
@@ -1,11 +1,46 @@
 """Инициализация торгового клиента для Extended Exchange."""
 
+import weakref
+from typing import Tuple
+
 from x10.perpetual.accounts import StarkPerpetualAccount
 from x10.perpetual.configuration import EndpointConfig
 from x10.perpetual.trading_client import PerpetualTradingClient
 
 from bot.config import ExtendedBotConfig
 
+# Кэш Stark-аккаунтов: разбор ключей выполняется один раз на набор учётных данных.
+# Ссылки слабые: аккаунт (и ключ с учётными данными) живёт, пока жив использующий его
+# клиент. Сам PerpetualTradingClient не кэшируется — его сессия привязана к event loop.
+_AccountKey = Tuple[int, str, str, str]
+_stark_accounts: weakref.WeakValueDictionary[_AccountKey, StarkPerpetualAccount] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _get_stark_account(config: ExtendedBotConfig) -> StarkPerpetualAccount:
+    """
+    Получить Stark-аккаунт для конфигурации, переиспользуя ранее созданный.
+
+    Args:
+        config: Конфигурация бота с API ключами
+
+    Returns:
+        StarkPerpetualAccount: Аккаунт для подписи ордеров
+    """
+    # Ключ — сами учётные данные: хэши строк кэшируются, поиск дешевле разбора ключей
+    key = (config.vault_id, config.public_key, config.api_key, config.private_key)
+    stark_account = _stark_accounts.get(key)
+    if stark_account is None:
+        stark_account = StarkPerpetualAccount(
+            vault=config.vault_id,
+            private_key=config.private_key,
+            public_key=config.public_key,
+            api_key=config.api_key,
+        )
+        _stark_accounts[key] = stark_account
+    return stark_account
+
 
 def create_trading_client(config: ExtendedBotConfig) -> PerpetualTradingClient:
     """
@@ -17,16 +52,9 @@ def create_trading_client(config: ExtendedBotConfig) -> PerpetualTradingClient:
     Returns:
         PerpetualTradingClient: Инициализированный торговый клиент
     """
-    stark_account = StarkPerpetualAccount(
-        vault=config.vault_id,
-        private_key=config.private_key,
-        public_key=config.public_key,
-        api_key=config.api_key,
-    )
-
     trading_client = PerpetualTradingClient(
         endpoint_config=config.endpoint_config,
-        stark_account=stark_account,
+        stark_account=_get_stark_account(config),
     )
 
     return trading_client
@@ -2,14 +2,21 @@
 
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Literal
 
 from dotenv import load_dotenv
 
 from x10.perpetual.configuration import EndpointConfig, MAINNET_CONFIG, TESTNET_CONFIG
 
+# Конфигурация эндпоинтов по окружению; новые окружения добавляются сюда
+_ENV_CONFIGS: dict[str, EndpointConfig] = {
+    "mainnet": MAINNET_CONFIG,
+    "testnet": TESTNET_CONFIG,
+}
 
-@dataclass
+
+@dataclass(frozen=True)
 class ExtendedBotConfig:
     """Конфигурация для торгового бота."""
 
@@ -19,13 +26,12 @@ class ExtendedBotConfig:
     vault_id: int
     environment: Literal["testnet", "mainnet"] = "testnet"
     builder_id: int | None = None
+    max_inflight_orders: int = 50  # Макс. одновременных REST запросов по ордерам
 
-    @property
+    @cached_property
     def endpoint_config(self) -> EndpointConfig:
-        """Получить конфигурацию эндпоинта в зависимости от окружения."""
-        if self.environment == "mainnet":
-            return MAINNET_CONFIG
-        return TESTNET_CONFIG
+        """Получить конфигурацию эндпоинта в зависимости от окружения (вычисляется один раз)."""
+        return _ENV_CONFIGS[self.environment]
 
     @classmethod
     def from_env(cls, env_file: str | None = None) -> "ExtendedBotConfig":
@@ -46,30 +52,38 @@ class ExtendedBotConfig:
         else:
             load_dotenv()
 
-        api_key = os.getenv("X10_API_KEY")
-        public_key = os.getenv("X10_PUBLIC_KEY")
-        private_key = os.getenv("X10_PRIVATE_KEY")
-        vault_id = os.getenv("X10_VAULT_ID")
-        builder_id = os.getenv("X10_BUILDER_ID")
-        environment = os.getenv("X10_ENVIRONMENT", "testnet").lower()
-
-        if not api_key:
-            raise ValueError("X10_API_KEY is not set in environment variables")
-        if not public_key:
-            raise ValueError("X10_PUBLIC_KEY is not set in environment variables")
-        if not private_key:
-            raise ValueError("X10_PRIVATE_KEY is not set in environment variables")
-        if not vault_id:
-            raise ValueError("X10_VAULT_ID is not set in environment variables")
+        env = os.environ
+        api_key = env.get("X10_API_KEY")
+        public_key = env.get("X10_PUBLIC_KEY")
+        private_key = env.get("X10_PRIVATE_KEY")
+        vault_id = env.get("X10_VAULT_ID")
+        builder_id = env.get("X10_BUILDER_ID")
+        environment = env.get("X10_ENVIRONMENT", "testnet").lower()
+        max_inflight_orders = env.get("X10_MAX_INFLIGHT_ORDERS")
+
+        required = {
+            "X10_API_KEY": api_key,
+            "X10_PUBLIC_KEY": public_key,
+            "X10_PRIVATE_KEY": private_key,
+            "X10_VAULT_ID": vault_id,
+        }
+        missing = [name for name, value in required.items() if not value]
+        if missing:
+            raise ValueError(f"Required environment variables are not set: {', '.join(missing)}")
 
         if not public_key.startswith("0x"):
             raise ValueError("X10_PUBLIC_KEY must be a hex string starting with 0x")
         if not private_key.startswith("0x"):
             raise ValueError("X10_PRIVATE_KEY must be a hex string starting with 0x")
 
-        if environment not in ("testnet", "mainnet"):
+        if environment not in _ENV_CONFIGS:
             raise ValueError(f"X10_ENVIRONMENT must be 'testnet' or 'mainnet', got '{environment}'")
 
+        if max_inflight_orders is not None and (
+            not max_inflight_orders.isdigit() or int(max_inflight_orders) <= 0
+        ):
+            raise ValueError("X10_MAX_INFLIGHT_ORDERS must be a positive integer")
+
         return cls(
             api_key=api_key,
             public_key=public_key,
@@ -77,4 +91,5 @@ class ExtendedBotConfig:
             vault_id=int(vault_id),
             environment=environment,  # type: ignore
             builder_id=int(builder_id) if builder_id else None,
+            max_inflight_orders=int(max_inflight_orders) if max_inflight_orders else 50,
         )
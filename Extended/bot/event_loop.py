@@ -0,0 +1,29 @@
+"""Настройка event loop asyncio для торгового бота."""
+
+import asyncio
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+
+def install_uvloop() -> bool:
+    """
+    Установить uvloop в качестве event loop policy, если он доступен.
+
+    Вызывать до asyncio.run(...). uvloop — опциональная зависимость и не
+    поддерживает Windows; в этих случаях остаётся стандартный event loop.
+
+    Returns:
+        bool: True, если uvloop установлен
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop не установлен, используется стандартный event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -1,6 +1,10 @@
 """Модуль работы с рынками и ордербуком."""
 
-from typing import Dict, Optional
+import asyncio
+import logging
+import sys
+import time
+from typing import Callable, Dict, Optional, Tuple
 
 from x10.perpetual.configuration import EndpointConfig
 from x10.perpetual.markets import MarketModel
@@ -9,22 +13,63 @@ from x10.perpetual.orderbooks import OrderbookUpdateModel
 from x10.perpetual.trading_client import PerpetualTradingClient
 from x10.utils.http import WrappedApiResponse
 
+logger = logging.getLogger(__name__)
+
+BestBidAsk = Tuple[Optional[OrderBookEntry], Optional[OrderBookEntry]]
+
+# За сколько секунд до истечения кэша рынков запускать фоновое обновление
+_MARKETS_REFRESH_AHEAD_SEC = 30.0
+
+
+def _stamp_messages(orderbook: OrderBook, stamp: Callable[[], None]) -> None:
+    """
+    Вызывать stamp перед обработкой каждого сообщения потока ордербука.
+
+    Args:
+        orderbook: Ордербук SDK (ещё не запущенный)
+        stamp: Функция отметки времени сообщения
+    """
+    for attr in ("init_orderbook", "update_orderbook"):
+        handler = getattr(orderbook, attr)
+
+        def stamped(data: OrderbookUpdateModel, _handler=handler):
+            stamp()
+            return _handler(data)
+
+        setattr(orderbook, attr, stamped)
+
 
 class MarketsManager:
     """Менеджер для работы с рынками и ордербуком."""
 
-    def __init__(self, trading_client: PerpetualTradingClient, endpoint_config: EndpointConfig):
+    def __init__(
+        self,
+        trading_client: PerpetualTradingClient,
+        endpoint_config: EndpointConfig,
+        markets_cache_ttl: float = 300.0,
+    ):
         """
         Инициализация менеджера рынков.
 
         Args:
             trading_client: Торговый клиент Extended Exchange
             endpoint_config: Конфигурация эндпоинта
+            markets_cache_ttl: Время жизни кэша рынков в секундах (по умолчанию 300)
         """
         self._client = trading_client
         self._config = endpoint_config
         self._markets_cache: Optional[Dict[str, MarketModel]] = None
+        self._markets_cache_expiry = 0.0
+        self._markets_cache_ttl = markets_cache_ttl
+        self._markets_cache_lock = asyncio.Lock()
+        self._markets_refresh_task: Optional[asyncio.Task] = None
         self._orderbooks: Dict[str, OrderBook] = {}
+        # Предсобранные функции чтения top-of-book по рынку (горячий путь на каждый тик)
+        self._best_bid_ask_fns: Dict[str, Callable[[], BestBidAsk]] = {}
+        # Событие по рынку: устанавливается при первом обновлении top-of-book
+        self._orderbook_ready: Dict[str, asyncio.Event] = {}
+        # Время (time.monotonic) последнего сообщения потока ордербука по рынку
+        self._orderbook_updated_at: Dict[str, float] = {}
 
     async def find_market(self, market_name: str) -> Optional[MarketModel]:
         """
@@ -36,12 +81,40 @@ class MarketsManager:
         Returns:
             Optional[MarketModel]: Модель рынка или None, если не найден
         """
-        if self._markets_cache is None:
-            markets_response = await self._client.markets_info.get_markets_dict()
-            self._markets_cache = markets_response
+        now = time.monotonic()
+        if self._markets_cache is None or now >= self._markets_cache_expiry:
+            await self._refresh_markets()
+        elif (
+            now >= self._markets_cache_expiry - _MARKETS_REFRESH_AHEAD_SEC
+            and self._markets_refresh_task is None
+        ):
+            # Кэш скоро истечёт: обновляем в фоне, чтобы выставление ордера не ждало REST
+            self._markets_refresh_task = asyncio.create_task(self._refresh_markets_ahead())
 
         return self._markets_cache.get(market_name)
 
+    async def _refresh_markets(self) -> None:
+        """Перезагрузить кэш рынков, если он пуст или истёк (конкурентные вызовы схлопываются)."""
+        async with self._markets_cache_lock:
+            # Повторная проверка: кэш мог заполнить конкурентный вызов, пока ждали lock
+            if self._markets_cache is None or time.monotonic() >= self._markets_cache_expiry:
+                markets_response = await self._client.markets_info.get_markets_dict()
+                self._markets_cache = markets_response
+                self._markets_cache_expiry = time.monotonic() + self._markets_cache_ttl
+
+    async def _refresh_markets_ahead(self) -> None:
+        """Фоновое обновление кэша рынков до истечения TTL."""
+        try:
+            async with self._markets_cache_lock:
+                markets_response = await self._client.markets_info.get_markets_dict()
+                self._markets_cache = markets_response
+                self._markets_cache_expiry = time.monotonic() + self._markets_cache_ttl
+        except Exception as e:
+            # Не критично: при истечении TTL find_market обновит кэш синхронно
+            logger.warning("Фоновое обновление кэша рынков не удалось: %s", e)
+        finally:
+            self._markets_refresh_task = None
+
     async def get_market_info(self, market_name: str) -> WrappedApiResponse[MarketModel]:
         """
         Получить информацию о рынке.
@@ -87,18 +160,58 @@ class MarketsManager:
         Returns:
             OrderBook: Объект ордербука для подписки на обновления
         """
+        # Интернируем имя рынка: горячий get_best_bid_ask сравнивает ключи по идентичности
+        market_name = sys.intern(market_name)
+        ready = asyncio.Event()
+        self._orderbook_ready[market_name] = ready
+        updated_at = self._orderbook_updated_at
+
+        async def mark_ready(_entry: Optional[OrderBookEntry]) -> None:
+            ready.set()
+
         orderbook = await OrderBook.create(
             endpoint_config=self._config,
             market_name=market_name,
-            start=start,
+            best_ask_change_callback=mark_ready,
+            best_bid_change_callback=mark_ready,
+            start=False,
             depth=depth,
         )
+
+        def stamp() -> None:
+            updated_at[market_name] = time.monotonic()
+
+        # Callback'и SDK срабатывают только при смене best bid/ask, поэтому время
+        # отмечается на каждом сообщении потока (снимок и дельта): возраст книги
+        # показывает, жив ли поток, а не как давно не менялась вершина книги
+        _stamp_messages(orderbook, stamp)
+        if start:
+            await orderbook.start_orderbook()
         self._orderbooks[market_name] = orderbook
+        self._best_bid_ask_fns[market_name] = lambda ob=orderbook: (ob.best_bid(), ob.best_ask())
         return orderbook
 
-    def get_best_bid_ask(
-        self, market_name: str
-    ) -> tuple[Optional[OrderBookEntry], Optional[OrderBookEntry]]:
+    async def wait_orderbook_ready(self, market_name: str, timeout: float = 5.0) -> bool:
+        """
+        Дождаться первого обновления ордербука после подписки.
+
+        Args:
+            market_name: Название рынка
+            timeout: Максимальное время ожидания в секундах
+
+        Returns:
+            bool: True, если ордербук получил данные; False, если не подписан или истёк таймаут
+        """
+        ready = self._orderbook_ready.get(market_name)
+        if ready is None:
+            return False
+        try:
+            await asyncio.wait_for(ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def get_best_bid_ask(self, market_name: str) -> BestBidAsk:
         """
         Получить лучшие цены bid/ask из активного ордербука.
 
@@ -108,13 +221,26 @@ class MarketsManager:
         Returns:
             tuple: (best_bid, best_ask) или (None, None) если ордербук не подписан
         """
-        orderbook = self._orderbooks.get(market_name)
-        if orderbook is None:
+        fn = self._best_bid_ask_fns.get(market_name)
+        if fn is None:
             return (None, None)
+        return fn()
+
+    def get_orderbook_age(self, market_name: str) -> Optional[float]:
+        """
+        Получить возраст данных активного ордербука.
+
+        Args:
+            market_name: Название рынка
 
-        best_bid = orderbook.best_bid()
-        best_ask = orderbook.best_ask()
-        return (best_bid, best_ask)
+        Returns:
+            Optional[float]: Секунды с последнего сообщения потока ордербука или None,
+            если ордербук не подписан или ещё не получил данных
+        """
+        updated_at = self._orderbook_updated_at.get(market_name)
+        if updated_at is None:
+            return None
+        return time.monotonic() - updated_at
 
     async def close_orderbook(self, market_name: str) -> None:
         """
@@ -123,12 +249,29 @@ class MarketsManager:
         Args:
             market_name: Название рынка
         """
-        orderbook = self._orderbooks.get(market_name)
+        self._best_bid_ask_fns.pop(market_name, None)
+        self._orderbook_ready.pop(market_name, None)
+        self._orderbook_updated_at.pop(market_name, None)
+        orderbook = self._orderbooks.pop(market_name, None)
         if orderbook:
             await orderbook.close()
-            del self._orderbooks[market_name]
+
+    async def close(self) -> None:
+        """Остановить фоновое обновление кэша рынков и закрыть все ордербуки."""
+        refresh_task = self._markets_refresh_task
+        if refresh_task is not None:
+            # Обновление в полёте не должно пережить закрытый клиент
+            refresh_task.cancel()
+            try:
+                await refresh_task
+            except asyncio.CancelledError:
+                pass
+        await self.close_all_orderbooks()
 
     async def close_all_orderbooks(self) -> None:
-        """Закрыть все активные подписки на ордербуки."""
-        for market_name in list(self._orderbooks.keys()):
-            await self.close_orderbook(market_name)
+        """Закрыть все активные подписки на ордербуки (параллельно)."""
+        market_names = list(self._orderbooks.keys())
+        await asyncio.gather(
+            *(self.close_orderbook(market_name) for market_name in market_names),
+            return_exceptions=True,
+        )
@@ -1,8 +1,9 @@
 """Модуль работы с ордерами."""
 
+import asyncio
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from x10.perpetual.order_object import OrderTpslTriggerParam
 from x10.perpetual.orders import (
@@ -14,21 +15,84 @@ from x10.perpetual.orders import (
     TimeInForce,
 )
 from x10.perpetual.trading_client import PerpetualTradingClient
-from x10.utils.http import WrappedApiResponse
+from x10.utils.http import ResponseStatus, WrappedApiResponse
 from x10.utils.model import EmptyModel
 
+from bot.circuit_breaker import CircuitBreaker
+
+# Ключ breaker'а для вызовов, не привязанных к конкретному рынку
+_ANY_MARKET = "*"
+# Макс. количество ID в одном запросе mass_cancel; большие списки режутся на части
+MASS_CANCEL_CHUNK_SIZE = 100
+
+
+class MassCancelError(RuntimeError):
+    """Часть запросов массовой отмены завершилась ошибкой; остальные части выполнены."""
+
+    def __init__(
+        self,
+        errors: Dict[str, Exception],
+        responses: Dict[str, WrappedApiResponse[EmptyModel]],
+    ):
+        """
+        Args:
+            errors: Часть списка (напр. "order_ids[100:200]") -> ошибка её запроса
+            responses: Часть списка -> ответ успешно выполненного запроса
+        """
+        self.errors = errors
+        self.responses = responses
+        details = "; ".join(f"{chunk}: {error}" for chunk, error in errors.items())
+        super().__init__(
+            f"Массовая отмена: ошибка в {len(errors)} из "
+            f"{len(errors) + len(responses)} запросов ({details})"
+        )
+
 
 class OrdersManager:
     """Менеджер для работы с ордерами."""
 
-    def __init__(self, trading_client: PerpetualTradingClient):
+    def __init__(
+        self,
+        trading_client: PerpetualTradingClient,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        max_inflight: int = 50,
+    ):
         """
         Инициализация менеджера ордеров.
 
         Args:
             trading_client: Торговый клиент Extended Exchange
+            failure_threshold: Ошибок подряд до открытия circuit breaker рынка
+            recovery_timeout: Время в секундах до пробного вызова после открытия
+            max_inflight: Макс. количество одновременных REST запросов по ордерам
         """
         self._client = trading_client
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        # Локальный лимит запросов в полёте: всплески не упираются в rate limit биржи
+        self._order_semaphore = asyncio.Semaphore(max_inflight)
+
+    def _breaker(self, market_name: Optional[str]) -> CircuitBreaker:
+        """Получить circuit breaker для рынка (создаётся при первом обращении)."""
+        key = market_name or _ANY_MARKET
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                key,
+                failure_threshold=self._failure_threshold,
+                recovery_timeout=self._recovery_timeout,
+            )
+            self._breakers[key] = breaker
+        return breaker
+
+    async def _call(
+        self, market_name: Optional[str], func: Callable[..., Awaitable[Any]], **kwargs
+    ) -> Any:
+        """Выполнить REST вызов с учётом лимита запросов и circuit breaker рынка."""
+        async with self._order_semaphore:
+            return await self._breaker(market_name).call(func, **kwargs)
 
     async def place_order(
         self,
@@ -67,7 +131,9 @@ class OrdersManager:
         Returns:
             WrappedApiResponse[PlacedOrderModel]: Результат размещения ордера
         """
-        return await self._client.place_order(
+        return await self._call(
+            market_name,
+            self._client.place_order,
             market_name=market_name,
             amount_of_synthetic=amount,
             price=price,
@@ -93,7 +159,7 @@ class OrdersManager:
         Returns:
             WrappedApiResponse[EmptyModel]: Результат отмены ордера
         """
-        return await self._client.orders.cancel_order(order_id=order_id)
+        return await self._call(None, self._client.orders.cancel_order, order_id=order_id)
 
     async def cancel_order_by_external_id(self, external_id: str) -> WrappedApiResponse[EmptyModel]:
         """
@@ -105,7 +171,9 @@ class OrdersManager:
         Returns:
             WrappedApiResponse[EmptyModel]: Результат отмены ордера
         """
-        return await self._client.orders.cancel_order_by_external_id(order_external_id=external_id)
+        return await self._call(
+            None, self._client.orders.cancel_order_by_external_id, order_external_id=external_id
+        )
 
     async def cancel_all_orders(
         self,
@@ -117,6 +185,9 @@ class OrdersManager:
         """
         Закрыть все ордера или ордера по фильтрам.
 
+        Списки длиннее MASS_CANCEL_CHUNK_SIZE режутся на части, которые
+        отправляются параллельно; ответы частей сводятся в один.
+
         Args:
             market_name: Название рынка для фильтрации (опционально)
             order_ids: Список ID ордеров для отмены (опционально)
@@ -124,15 +195,57 @@ class OrdersManager:
             cancel_all: Отменить все ордера (если True)
 
         Returns:
-            WrappedApiResponse[EmptyModel]: Результат массовой отмены
+            WrappedApiResponse[EmptyModel]: Результат отмены
+
+        Raises:
+            MassCancelError: Если часть запросов завершилась ошибкой (успешные
+                части уже выполнены и доступны в responses)
         """
         markets = [market_name] if market_name else None
-        return await self._client.orders.mass_cancel(
-            order_ids=order_ids,
-            external_order_ids=external_order_ids,
-            markets=markets,
-            cancel_all=cancel_all,
-        )
+
+        if cancel_all or (
+            len(order_ids or ()) <= MASS_CANCEL_CHUNK_SIZE
+            and len(external_order_ids or ()) <= MASS_CANCEL_CHUNK_SIZE
+        ):
+            return await self._call(
+                market_name,
+                self._client.orders.mass_cancel,
+                order_ids=order_ids,
+                external_order_ids=external_order_ids,
+                markets=markets,
+                cancel_all=cancel_all,
+            )
+
+        # Большие списки режем на части и отправляем параллельно
+        labels: List[str] = []
+        requests = []
+        for field, ids in (("order_ids", order_ids), ("external_order_ids", external_order_ids)):
+            for start in range(0, len(ids or ()), MASS_CANCEL_CHUNK_SIZE):
+                chunk = ids[start : start + MASS_CANCEL_CHUNK_SIZE]
+                labels.append(f"{field}[{start}:{start + len(chunk)}]")
+                requests.append(
+                    self._call(
+                        market_name,
+                        self._client.orders.mass_cancel,
+                        markets=markets,
+                        **{field: chunk},
+                    )
+                )
+        results = await asyncio.gather(*requests, return_exceptions=True)
+
+        errors: Dict[str, Exception] = {}
+        responses: Dict[str, WrappedApiResponse[EmptyModel]] = {}
+        for label, result in zip(labels, results):
+            if isinstance(result, Exception):
+                errors[label] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                responses[label] = result
+        if errors:
+            raise MassCancelError(errors, responses)
+        # Ответ с ошибкой SDK поднимает исключением — все части выполнены успешно
+        return WrappedApiResponse(status=ResponseStatus.OK, data=EmptyModel())
 
     async def get_order_status(self, order_id: int) -> WrappedApiResponse[OpenOrderModel]:
         """
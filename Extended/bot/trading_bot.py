@@ -1,5 +1,6 @@
 """Основной класс торгового бота для Extended Exchange."""
 
+import asyncio
 from typing import Optional
 
 from bot.account import AccountManager
@@ -7,7 +8,7 @@ from bot.client import create_trading_client
 from bot.config import ExtendedBotConfig
 from bot.markets import MarketsManager
 from bot.orders import OrdersManager
-from bot.websocket_manager import WebSocketManager
+from bot.websocket_manager import WebSocketManager, shared_stream_client
 from x10.perpetual.trading_client import PerpetualTradingClient
 
 
@@ -25,14 +26,19 @@ class ExtendedTradingBot:
         self._client = create_trading_client(config)
         # Инициализация WebSocket менеджера (не запускается автоматически)
         self._websocket_manager: Optional[WebSocketManager] = WebSocketManager(
-            endpoint_config=config.endpoint_config, api_key=config.api_key
+            endpoint_config=config.endpoint_config,
+            api_key=config.api_key,
+            stream_client=shared_stream_client(config.endpoint_config),
         )
         # Передаем WebSocket менеджер в AccountManager
         self._account_manager = AccountManager(
             self._client, websocket_manager=self._websocket_manager
         )
         self._markets_manager = MarketsManager(self._client, config.endpoint_config)
-        self._orders_manager = OrdersManager(self._client)
+        self._orders_manager = OrdersManager(
+            self._client, max_inflight=config.max_inflight_orders
+        )
+        self._closed = False
 
     @property
     def account(self) -> AccountManager:
@@ -86,9 +92,14 @@ class ExtendedTradingBot:
             await self._websocket_manager.stop()
 
     async def close(self) -> None:
-        """Корректно закрыть все соединения и подписки."""
-        # Останавливаем WebSocket, если запущен
+        """Корректно закрыть все соединения и подписки (повторный вызов ничего не делает)."""
+        if self._closed:
+            return
+        self._closed = True
+
+        # WebSocket аккаунта и рынки (ордербуки, фоновое обновление) закрываем параллельно
+        teardown = [self._markets_manager.close()]
         if self._websocket_manager:
-            await self._websocket_manager.stop()
-        await self._markets_manager.close_all_orderbooks()
+            teardown.append(self._websocket_manager.stop())
+        await asyncio.gather(*teardown, return_exceptions=True)
         await self._client.close()
@@ -2,9 +2,20 @@
 
 import asyncio
 import logging
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
-from typing import List, Optional
+import random
+import time
+from collections import defaultdict
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    Set as AbstractSet,
+)
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Dict, List, Optional, Set, Tuple, TypeVar
 
 from x10.perpetual.accounts import (
     AccountStreamDataModel,
@@ -13,6 +24,8 @@ from x10.perpetual.accounts import (
     PositionModel,
 )
 from x10.perpetual.configuration import EndpointConfig
+from x10.perpetual.orders import OrderSide, OrderType
+from x10.perpetual.positions import PositionSide
 from x10.perpetual.stream_client.stream_client import PerpetualStreamClient
 from x10.utils.http import WrappedStreamResponse
 
@@ -20,45 +33,358 @@ logger = logging.getLogger(__name__)
 
 # Типы для callback'ов
 BalanceCallback = Callable[[BalanceModel], Awaitable[None]]
-PositionsCallback = Callable[[List[PositionModel]], Awaitable[None]]
-OrdersCallback = Callable[[List[OpenOrderModel]], Awaitable[None]]
+# Позиции и ордера передаются неизменяемым снапшотом кэша (без копирования)
+PositionsCallback = Callable[[Sequence[PositionModel]], Awaitable[None]]
+OrdersCallback = Callable[[Sequence[OpenOrderModel]], Awaitable[None]]
+StateCallback = Callable[[bool], None]
+
+_Item = TypeVar("_Item", PositionModel, OpenOrderModel)
+# Индекс кэша: значение поля (рынок, сторона, тип) или кортеж значений -> {id: модель}
+_Index = Dict[object, Dict[int, _Item]]
+_Payload = TypeVar("_Payload")
+
+# Тип данных -> поле WebSocketCache с временем последнего обновления
+_UPDATE_TIME_FIELDS = {
+    "balance": "ts_balance",
+    "positions": "ts_positions",
+    "orders": "ts_orders",
+}
+
+# Тип события account stream с полным снапшотом; остальные события инкрементальные
+_SNAPSHOT_EVENT = "SNAPSHOT"
+# Статусы ордеров, после которых ордер удаляется из кэша открытых
+_TERMINAL_ORDER_STATUSES = frozenset({"FILLED", "CANCELLED", "REJECTED", "EXPIRED"})
+
+
+def _build_index(items: Iterable[_Item], *attrs: str) -> _Index:
+    """
+    Построить индекс {ключ: {id: модель}} по списку моделей.
+
+    Args:
+        items: Модели из кэша
+        *attrs: Атрибуты ключа; для нескольких атрибутов ключ — кортеж их значений
+
+    Returns:
+        Индекс моделей по ключу
+    """
+    key = attrgetter(*attrs)
+    index: _Index = defaultdict(dict)
+    for item in items:
+        index[key(item)][item.id] = item
+    return index
+
+
+def _merge_items(
+    current: Tuple[_Item, ...],
+    updates: Iterable[_Item],
+    replace: bool,
+    is_closed: Callable[[_Item], bool],
+) -> Tuple[_Item, ...]:
+    """
+    Применить обновление stream к снапшоту моделей.
+
+    SNAPSHOT заменяет кэш целиком; остальные события несут только изменённые
+    модели, поэтому сливаются по id. Закрытые модели удаляются из кэша.
+
+    Args:
+        current: Текущий снапшот кэша
+        updates: Модели из события
+        replace: Событие — полный снапшот (заменить кэш)
+        is_closed: Признак модели, которую нужно удалить из кэша
+
+    Returns:
+        Новый снапшот
+    """
+    merged: Dict[int, _Item] = {} if replace else {item.id: item for item in current}
+    for item in updates:
+        if is_closed(item):
+            merged.pop(item.id, None)
+        else:
+            merged[item.id] = item
+    return tuple(merged.values())
+
+
+def _position_closed(position: PositionModel) -> bool:
+    """Позиция закрыта: статус CLOSED или нулевой размер."""
+    return position.status == "CLOSED" or not position.size
+
+
+def _order_closed(order: OpenOrderModel) -> bool:
+    """Ордер больше не открыт (исполнен, отменён, отклонён или истёк)."""
+    return order.status in _TERMINAL_ORDER_STATUSES
+
+
+def _iter_matching(candidates: List[Dict[int, _Item]]) -> Iterator[_Item]:
+    """
+    Пересечь выборки из индексов за O(k), где k — размер наименьшей выборки.
+
+    Args:
+        candidates: Выборки {id: модель}, полученные из индексов по каждому фильтру
+
+    Yields:
+        Модели, попавшие во все выборки
+    """
+    candidates.sort(key=len)
+    smallest, rest = candidates[0], candidates[1:]
+    for item_id, item in smallest.items():
+        if all(item_id in c for c in rest):
+            yield item
+
+
+def _market_bucket(index: _Index, market_names: AbstractSet[str]) -> Dict[int, _Item]:
+    """Выборка индекса по одному или нескольким рынкам (без копии для одного рынка)."""
+    buckets = [index[name] for name in market_names if name in index]
+    if len(buckets) == 1:
+        return buckets[0]
+    merged: Dict[int, _Item] = {}
+    for bucket in buckets:
+        merged.update(bucket)
+    return merged
+
+
+# Общие stream-клиенты по stream_url: все менеджеры одного окружения используют один клиент
+_shared_stream_clients: Dict[str, PerpetualStreamClient] = {}
+
+
+def shared_stream_client(endpoint_config: EndpointConfig) -> PerpetualStreamClient:
+    """
+    Получить общий stream-клиент для эндпоинта, создав его при первом обращении.
+
+    Args:
+        endpoint_config: Конфигурация эндпоинта
+
+    Returns:
+        PerpetualStreamClient: Клиент, общий для всех менеджеров с тем же stream_url
+    """
+    stream_url = endpoint_config.stream_url
+    client = _shared_stream_clients.get(stream_url)
+    if client is None:
+        client = PerpetualStreamClient(api_url=stream_url)
+        _shared_stream_clients[stream_url] = client
+    return client
+
+
+class _TokenBucket:
+    """Простой token bucket: не более burst событий сразу и rate событий в секунду в среднем."""
+
+    __slots__ = ("_rate", "_burst", "_tokens", "_updated")
 
+    def __init__(self, rate: float, burst: int):
+        """
+        Инициализация token bucket.
+
+        Args:
+            rate: Скорость пополнения (токенов в секунду)
+            burst: Максимальное количество накопленных токенов
+        """
+        self._rate = rate
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def allow(self) -> bool:
+        """Потратить токен, если он есть."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+class _Coalescer:
+    """
+    Схлопывание частых обновлений перед уведомлением подписчиков.
+
+    За окно max_wait секунд (или до max_items обновлений) по каждому типу
+    сохраняется только последний снапшот, который затем передаётся в flush.
+    """
+
+    __slots__ = ("_on_flush", "_max_wait", "_max_items", "_latest", "_count", "_handle")
+
+    def __init__(
+        self,
+        flush: Callable[[str, object], None],
+        max_wait: float,
+        max_items: int,
+    ):
+        """
+        Инициализация coalescer'а.
+
+        Args:
+            flush: Функция (тип, данные), вызываемая для последнего снапшота каждого типа
+            max_wait: Максимальная задержка уведомления в секундах
+            max_items: Количество обновлений, после которого окно сбрасывается досрочно
+        """
+        self._on_flush = flush
+        self._max_wait = max_wait
+        self._max_items = max_items
+        self._latest: Dict[str, object] = {}
+        self._count = 0
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def submit(self, kind: str, payload: object) -> None:
+        """
+        Добавить обновление в текущее окно.
 
-@dataclass
+        Args:
+            kind: Тип обновления
+            payload: Данные обновления (заменяют предыдущие данные того же типа)
+        """
+        self._latest[kind] = payload
+        self._count += 1
+        if self._count >= self._max_items:
+            self.flush()
+        elif self._handle is None:
+            self._handle = asyncio.get_running_loop().call_later(self._max_wait, self.flush)
+
+    def flush(self) -> None:
+        """Немедленно передать накопленные снапшоты и закрыть окно."""
+        self.cancel()
+        latest, self._latest = self._latest, {}
+        for kind, payload in latest.items():
+            self._on_flush(kind, payload)
+
+    def cancel(self) -> None:
+        """Отменить запланированный сброс окна."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._count = 0
+
+
+@dataclass(slots=True)
 class WebSocketCache:
     """Кэш данных из WebSocket."""
 
     balance: Optional[BalanceModel] = None
-    positions: List[PositionModel] = field(default_factory=list)
-    orders: List[OpenOrderModel] = field(default_factory=list)
-    last_update_time: dict[str, float] = field(default_factory=dict)
+    # Неизменяемые снапшоты: заменяются целиком на каждом обновлении
+    positions: Tuple[PositionModel, ...] = ()
+    orders: Tuple[OpenOrderModel, ...] = ()
+    # Время последнего обновления по типам данных (None — обновлений ещё не было)
+    ts_balance: Optional[float] = None
+    ts_positions: Optional[float] = None
+    ts_orders: Optional[float] = None
     messages_received: int = 0  # Счетчик полученных сообщений
 
 
 class WebSocketManager:
     """Менеджер для управления WebSocket подключениями и кэшированием данных."""
 
-    def __init__(self, endpoint_config: EndpointConfig, api_key: str):
+    __slots__ = (
+        "_config",
+        "_api_key",
+        "_stream_client",
+        "_cache",
+        "_connection_task",
+        "_is_running",
+        "_is_synced",
+        "_reconnect_base_delay",
+        "_reconnect_max_delay",
+        "_reconnect_attempt",
+        "_recv_timeout",
+        "_connection_start_time",
+        "_now",
+        "_positions_by_market",
+        "_positions_by_side",
+        "_positions_by_market_side",
+        "_orders_by_market",
+        "_orders_by_side",
+        "_orders_by_type",
+        "_balance_callbacks",
+        "_positions_callbacks",
+        "_orders_callbacks",
+        "_state_callbacks",
+        "_pending",
+        "_dispatch_tail",
+        "_subscribers",
+        "_coalescer",
+        "_handlers",
+        "_err_budget",
+    )
+
+    def __init__(
+        self,
+        endpoint_config: EndpointConfig,
+        api_key: str,
+        notify_window: float = 0.05,
+        notify_max_items: int = 50,
+        reconnect_base_delay: float = 0.5,
+        reconnect_max_delay: float = 60.0,
+        recv_timeout: Optional[float] = 30.0,
+        *,
+        stream_client: Optional[PerpetualStreamClient] = None,
+    ):
         """
         Инициализация менеджера WebSocket.
 
         Args:
             endpoint_config: Конфигурация эндпоинта
             api_key: API ключ для аутентификации
+            notify_window: Окно схлопывания уведомлений о балансе/позициях/ордерах в секундах
+            notify_max_items: Количество обновлений, после которого окно сбрасывается досрочно
+            reconnect_base_delay: Минимальная задержка переподключения в секундах
+            reconnect_max_delay: Максимальная задержка переподключения в секундах
+            recv_timeout: Время без сообщений в секундах, после которого соединение
+                считается зависшим и переподключается (None — без ограничения)
+            stream_client: Общий stream-клиент (см. shared_stream_client); по умолчанию
+                создаётся собственный
         """
         self._config = endpoint_config
         self._api_key = api_key
-        self._stream_client = PerpetualStreamClient(api_url=endpoint_config.stream_url)
+        self._stream_client = stream_client or PerpetualStreamClient(
+            api_url=endpoint_config.stream_url
+        )
         self._cache = WebSocketCache()
         self._connection_task: Optional[asyncio.Task] = None
         self._is_running = False
-        self._reconnect_delay = 5  # секунд
+        # Кэш совпадает с биржей: поток подключён и после подключения пришёл SNAPSHOT
+        self._is_synced = False
+        self._reconnect_base_delay = reconnect_base_delay
+        self._reconnect_max_delay = reconnect_max_delay
+        # Неудачных попыток подряд; сбрасывается при получении первого события
+        self._reconnect_attempt = 0
+        self._recv_timeout = recv_timeout
         self._connection_start_time: Optional[float] = None
+        # Часы для отметок времени; в start() привязываются к loop.time
+        self._now: Callable[[], float] = time.monotonic
+
+        # Индексы кэша, пересобираются на каждом событии WebSocket
+        self._positions_by_market: _Index = defaultdict(dict)
+        self._positions_by_side: _Index = defaultdict(dict)
+        self._positions_by_market_side: _Index = defaultdict(dict)
+        self._orders_by_market: _Index = defaultdict(dict)
+        self._orders_by_side: _Index = defaultdict(dict)
+        self._orders_by_type: _Index = defaultdict(dict)
 
         # Callback'и для уведомлений об обновлениях
-        self._balance_callbacks: List[BalanceCallback] = []
-        self._positions_callbacks: List[PositionsCallback] = []
-        self._orders_callbacks: List[OrdersCallback] = []
+        # Кортежи пересобираются при подписке (редко) и только итерируются на событиях
+        self._balance_callbacks: Tuple[BalanceCallback, ...] = ()
+        self._positions_callbacks: Tuple[PositionsCallback, ...] = ()
+        self._orders_callbacks: Tuple[OrdersCallback, ...] = ()
+        # Синхронные наблюдатели за готовностью кэша (is_synced)
+        self._state_callbacks: Tuple[StateCallback, ...] = ()
+        # Запущенные callback'и: держим ссылки, чтобы задачи не собрал GC
+        self._pending: Set[asyncio.Task] = set()
+        # Последняя рассылка по типу: следующая ждёт её, чтобы обновления не обгоняли друг друга
+        self._dispatch_tail: Dict[str, asyncio.Task] = {}
+        # Трейсбеки ошибок callback'ов форматируются не чаще ~1 раза в секунду
+        self._err_budget = _TokenBucket(rate=1.0, burst=5)
+        # Баланс, позиции и ордера уведомляются последним снапшотом за окно;
+        # кэш обновляется сразу
+        self._subscribers = {
+            "balance": ("_balance_callbacks", "баланса"),
+            "positions": ("_positions_callbacks", "позиций"),
+            "orders": ("_orders_callbacks", "ордеров"),
+        }
+        self._coalescer = _Coalescer(self._flush_update, notify_window, notify_max_items)
+        # Таблица разбора события: (поле события, поле времени в кэше, обработчик)
+        self._handlers = (
+            ("balance", "ts_balance", self._apply_balance),
+            ("positions", "ts_positions", self._apply_positions),
+            ("orders", "ts_orders", self._apply_orders),
+        )
 
     async def start(self) -> None:
         """
@@ -71,14 +397,18 @@ class WebSocketManager:
             return
 
         self._is_running = True
-        self._connection_start_time = asyncio.get_event_loop().time()
+        self._now = asyncio.get_running_loop().time
+        self._connection_start_time = self._now()
         self._cache.messages_received = 0  # Сброс счетчика при запуске
         self._connection_task = asyncio.create_task(self._run_connection_loop())
         logger.info("WebSocket подключение запущено")
 
     async def stop(self) -> None:
-        """Остановить WebSocket подключение."""
+        """Остановить WebSocket подключение (повторный вызов ничего не делает)."""
+        if not self._is_running and self._connection_task is None:
+            return
         self._is_running = False
+        self._set_synced(False)
         if self._connection_task:
             self._connection_task.cancel()
             try:
@@ -86,6 +416,13 @@ class WebSocketManager:
             except asyncio.CancelledError:
                 pass
             self._connection_task = None
+        self._coalescer.cancel()
+        if self._pending:
+            pending = list(self._pending)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._dispatch_tail.clear()
         logger.info("WebSocket подключение остановлено")
 
     @property
@@ -93,17 +430,162 @@ class WebSocketManager:
         """Проверить, запущен ли WebSocket."""
         return self._is_running
 
+    @property
+    def is_synced(self) -> bool:
+        """
+        Проверить, можно ли читать кэш как актуальное состояние аккаунта.
+
+        is_running остаётся True и пока поток переподключается; в это время кэш
+        устаревает, и до следующего SNAPSHOT данные нужно брать через REST.
+        """
+        return self._is_synced
+
     def get_cached_balance(self) -> Optional[BalanceModel]:
         """Получить кэшированный баланс."""
         return self._cache.balance
 
-    def get_cached_positions(self) -> List[PositionModel]:
-        """Получить кэшированные позиции."""
-        return self._cache.positions.copy()
+    def get_cached_positions(
+        self,
+        market_names: Optional[AbstractSet[str]] = None,
+        side: Optional[PositionSide] = None,
+    ) -> Tuple[PositionModel, ...]:
+        """
+        Получить кэшированные позиции с фильтрацией по индексам.
+
+        Без фильтров возвращается сам снапшот кэша без копирования.
+
+        Args:
+            market_names: Множество названий рынков для фильтрации (опционально)
+            side: Сторона позиции для фильтрации (опционально)
+
+        Returns:
+            Tuple[PositionModel, ...]: Позиции, удовлетворяющие всем фильтрам
+        """
+        if market_names is None and side is None:
+            return self._cache.positions
+        return tuple(self.iter_positions(market_names=market_names, side=side))
+
+    def iter_positions(
+        self,
+        market_names: Optional[AbstractSet[str]] = None,
+        side: Optional[PositionSide] = None,
+    ) -> Iterator[PositionModel]:
+        """
+        Итерироваться по кэшированным позициям, применяя фильтры на лету.
+
+        Args:
+            market_names: Множество названий рынков для фильтрации (опционально)
+            side: Сторона позиции для фильтрации (опционально)
+
+        Yields:
+            PositionModel: Позиции, удовлетворяющие всем фильтрам
+        """
+        if market_names is None and side is None:
+            yield from self._cache.positions
+            return
+
+        if market_names is not None and side is not None:
+            # Составной индекс (рынок, сторона): выборка без пересечения множеств
+            for market_name in market_names:
+                bucket = self._positions_by_market_side.get((market_name, side))
+                if bucket:
+                    yield from bucket.values()
+            return
+
+        candidates: List[Dict[int, PositionModel]] = []
+        if market_names is not None:
+            candidates.append(_market_bucket(self._positions_by_market, market_names))
+        if side is not None:
+            candidates.append(self._positions_by_side.get(side, {}))
+        yield from _iter_matching(candidates)
+
+    def count_cached_positions(
+        self,
+        market_names: Optional[AbstractSet[str]] = None,
+        side: Optional[PositionSide] = None,
+    ) -> int:
+        """
+        Посчитать кэшированные позиции по индексам, не собирая список.
+
+        Args:
+            market_names: Множество названий рынков для фильтрации (опционально)
+            side: Сторона позиции для фильтрации (опционально)
+
+        Returns:
+            int: Количество позиций, удовлетворяющих всем фильтрам
+        """
+        if market_names is None:
+            if side is None:
+                return len(self._cache.positions)
+            return len(self._positions_by_side.get(side, ()))
+        if side is None:
+            index, keys = self._positions_by_market, market_names
+        else:
+            index, keys = self._positions_by_market_side, [(name, side) for name in market_names]
+        return sum(len(index.get(key, ())) for key in keys)
+
+    def has_cached_position(self, market_name: str) -> bool:
+        """Проверить, есть ли в кэше позиция по рынку."""
+        return bool(self._positions_by_market.get(market_name))
+
+    def has_cached_order(self, market_name: str, order_id: int) -> bool:
+        """Проверить, есть ли в кэше открытый ордер рынка с указанным ID."""
+        return order_id in self._orders_by_market.get(market_name, ())
+
+    def get_cached_orders(
+        self,
+        market_names: Optional[AbstractSet[str]] = None,
+        order_type: Optional[OrderType] = None,
+        order_side: Optional[OrderSide] = None,
+    ) -> Tuple[OpenOrderModel, ...]:
+        """
+        Получить кэшированные ордера с фильтрацией по индексам.
+
+        Без фильтров возвращается сам снапшот кэша без копирования.
+
+        Args:
+            market_names: Множество названий рынков для фильтрации (опционально)
+            order_type: Тип ордера для фильтрации (опционально)
+            order_side: Сторона ордера для фильтрации (опционально)
 
-    def get_cached_orders(self) -> List[OpenOrderModel]:
-        """Получить кэшированные ордера."""
-        return self._cache.orders.copy()
+        Returns:
+            Tuple[OpenOrderModel, ...]: Ордера, удовлетворяющие всем фильтрам
+        """
+        if market_names is None and order_type is None and order_side is None:
+            return self._cache.orders
+        return tuple(
+            self.iter_orders(market_names=market_names, order_type=order_type, order_side=order_side)
+        )
+
+    def iter_orders(
+        self,
+        market_names: Optional[AbstractSet[str]] = None,
+        order_type: Optional[OrderType] = None,
+        order_side: Optional[OrderSide] = None,
+    ) -> Iterator[OpenOrderModel]:
+        """
+        Итерироваться по кэшированным ордерам, применяя фильтры на лету.
+
+        Args:
+            market_names: Множество названий рынков для фильтрации (опционально)
+            order_type: Тип ордера для фильтрации (опционально)
+            order_side: Сторона ордера для фильтрации (опционально)
+
+        Yields:
+            OpenOrderModel: Ордера, удовлетворяющие всем фильтрам
+        """
+        if market_names is None and order_type is None and order_side is None:
+            yield from self._cache.orders
+            return
+
+        candidates: List[Dict[int, OpenOrderModel]] = []
+        if market_names is not None:
+            candidates.append(_market_bucket(self._orders_by_market, market_names))
+        if order_type is not None:
+            candidates.append(self._orders_by_type.get(order_type, {}))
+        if order_side is not None:
+            candidates.append(self._orders_by_side.get(order_side, {}))
+        yield from _iter_matching(candidates)
 
     def get_statistics(self) -> dict:
         """
@@ -112,19 +594,23 @@ class WebSocketManager:
         Returns:
             dict: Словарь со статистикой (messages_received, last_updates, uptime и т.д.)
         """
-        import time
-
         stats = {
             "is_running": self._is_running,
+            "is_synced": self._is_synced,
             "messages_received": self._cache.messages_received,
-            "last_updates": self._cache.last_update_time.copy(),
+            "last_updates": {
+                data_type: ts
+                for data_type, attr in _UPDATE_TIME_FIELDS.items()
+                if (ts := getattr(self._cache, attr)) is not None
+            },
             "has_balance": self._cache.balance is not None,
             "positions_count": len(self._cache.positions),
             "orders_count": len(self._cache.orders),
         }
 
-        if self._connection_start_time:
-            stats["uptime_seconds"] = time.time() - self._connection_start_time
+        if self._connection_start_time is not None:
+            # Те же часы, что и при запуске (loop.time), а не time.time()
+            stats["uptime_seconds"] = self._now() - self._connection_start_time
 
         return stats
 
@@ -138,7 +624,8 @@ class WebSocketManager:
         Returns:
             Optional[float]: Время последнего обновления или None
         """
-        return self._cache.last_update_time.get(data_type)
+        attr = _UPDATE_TIME_FIELDS.get(data_type)
+        return getattr(self._cache, attr) if attr is not None else None
 
     def subscribe_to_balance_updates(self, callback: BalanceCallback) -> None:
         """
@@ -147,7 +634,7 @@ class WebSocketManager:
         Args:
             callback: Асинхронная функция, которая будет вызвана при обновлении баланса
         """
-        self._balance_callbacks.append(callback)
+        self._balance_callbacks = (*self._balance_callbacks, callback)
         logger.debug(
             f"Добавлен callback для обновлений баланса. Всего: {len(self._balance_callbacks)}"
         )
@@ -159,7 +646,7 @@ class WebSocketManager:
         Args:
             callback: Асинхронная функция, которая будет вызвана при обновлении позиций
         """
-        self._positions_callbacks.append(callback)
+        self._positions_callbacks = (*self._positions_callbacks, callback)
         logger.debug(
             f"Добавлен callback для обновлений позиций. Всего: {len(self._positions_callbacks)}"
         )
@@ -171,11 +658,94 @@ class WebSocketManager:
         Args:
             callback: Асинхронная функция, которая будет вызвана при обновлении ордеров
         """
-        self._orders_callbacks.append(callback)
+        self._orders_callbacks = (*self._orders_callbacks, callback)
         logger.debug(
             f"Добавлен callback для обновлений ордеров. Всего: {len(self._orders_callbacks)}"
         )
 
+    def subscribe_to_state_changes(self, callback: StateCallback) -> None:
+        """
+        Подписаться на изменение готовности кэша.
+
+        Args:
+            callback: Синхронная функция, получающая новое значение is_synced
+        """
+        self._state_callbacks = (*self._state_callbacks, callback)
+        callback(self._is_synced)
+
+    def _set_synced(self, is_synced: bool) -> None:
+        """Изменить is_synced и уведомить наблюдателей, если значение изменилось."""
+        if self._is_synced == is_synced:
+            return
+        self._is_synced = is_synced
+        for callback in self._state_callbacks:
+            try:
+                callback(is_synced)
+            except Exception as e:
+                self._log_callback_error("состояния WebSocket", e)
+
+    def _spawn_callbacks(
+        self,
+        callbacks: Tuple[Callable[[_Payload], Awaitable[None]], ...],
+        payload: _Payload,
+        kind: str,
+    ) -> None:
+        """
+        Запустить рассылку обновления в отдельной задаче, не блокируя чтение stream.
+
+        Рассылки одного типа выполняются по очереди: более старое обновление
+        не может дойти до подписчиков позже нового.
+
+        Args:
+            callbacks: Подписанные callback'и
+            payload: Данные обновления
+            kind: Тип обновления для логов ошибок
+        """
+        if not callbacks:
+            return
+        previous = self._dispatch_tail.get(kind)
+        task = asyncio.create_task(self._dispatch(callbacks, payload, kind, previous))
+        self._dispatch_tail[kind] = task
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _flush_update(self, kind: str, payload: object) -> None:
+        """Разослать последний снапшот типа kind, накопленный coalescer'ом."""
+        attr, label = self._subscribers[kind]
+        self._spawn_callbacks(getattr(self, attr), payload, label)
+
+    async def _dispatch(
+        self,
+        callbacks: Tuple[Callable[[_Payload], Awaitable[None]], ...],
+        payload: _Payload,
+        kind: str,
+        previous: Optional[asyncio.Task] = None,
+    ) -> None:
+        """
+        Вызвать callback'и одного типа параллельно и залогировать их ошибки.
+
+        Args:
+            callbacks: Подписанные callback'и
+            payload: Данные обновления
+            kind: Тип обновления для логов ошибок
+            previous: Предыдущая рассылка того же типа, которую нужно дождаться
+        """
+        if previous is not None and not previous.done():
+            await asyncio.wait((previous,))
+        results = await asyncio.gather(
+            *(callback(payload) for callback in callbacks), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self._log_callback_error(kind, result)
+
+    def _log_callback_error(self, kind: str, error: Exception) -> None:
+        """Залогировать ошибку callback'а; трейсбек — только в пределах бюджета."""
+        if self._err_budget.allow():
+            logger.error("Ошибка в callback %s: %s", kind, error, exc_info=error)
+        else:
+            logger.error("Ошибка в callback %s: %s", kind, error)
+
     async def _run_connection_loop(self) -> None:
         """Основной цикл подключения с автоматическим переподключением."""
         while self._is_running:
@@ -186,27 +756,106 @@ class WebSocketManager:
                 break
             except Exception as e:
                 logger.error(f"Ошибка в WebSocket подключении: {e}", exc_info=True)
-                if self._is_running:
-                    logger.info(f"Переподключение через {self._reconnect_delay} секунд...")
-                    await asyncio.sleep(self._reconnect_delay)
+            # Закрытие потока и срабатывание watchdog тоже идут через backoff: сервер,
+            # который принимает подключение и молчит, иначе получал бы переподключения подряд
+            if self._is_running:
+                delay = self._next_reconnect_delay()
+                logger.info("Переподключение через %.1f секунд...", delay)
+                await asyncio.sleep(delay)
+
+    def _next_reconnect_delay(self) -> float:
+        """
+        Рассчитать задержку перед следующим переподключением.
+
+        Экспоненциальный рост с ограничением и случайным разбросом, чтобы боты
+        не переподключались синхронно после общего сбоя.
+
+        Returns:
+            float: Задержка в секундах
+        """
+        self._reconnect_attempt += 1
+        base = self._reconnect_base_delay
+        ceiling = min(self._reconnect_max_delay, base * 2 ** (self._reconnect_attempt - 1))
+        return min(self._reconnect_max_delay, random.uniform(base, ceiling * 3))
 
     async def _connect_and_listen(self) -> None:
         """Подключиться к WebSocket и слушать обновления."""
-        async with self._stream_client.subscribe_to_account_updates(
-            self._api_key
-        ) as account_stream:
-            logger.info("✅ Подключено к account_updates stream")
-            async for event in account_stream:
-                if not self._is_running:
-                    break
-                # Увеличиваем счетчик полученных сообщений
-                self._cache.messages_received += 1
-                # Логируем каждое полученное сообщение
-                logger.info(
-                    f"📨 WebSocket: Получено сообщение #{self._cache.messages_received} "
-                    f"(тип: {event.type}, seq: {event.seq})"
-                )
-                await self._handle_stream_event(event)
+        try:
+            async with self._stream_client.subscribe_to_account_updates(
+                self._api_key
+            ) as account_stream:
+                logger.info("✅ Подключено к account_updates stream")
+                info_enabled = logger.isEnabledFor
+                while True:
+                    # Watchdog: полуоткрытый TCP без ошибок иначе блокирует чтение навсегда
+                    try:
+                        event = await asyncio.wait_for(
+                            account_stream.__anext__(), timeout=self._recv_timeout
+                        )
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError:
+                        logger.warning(
+                            "WebSocket: нет сообщений %.0f секунд, переподключение",
+                            self._recv_timeout,
+                        )
+                        break
+                    self._reconnect_attempt = 0
+                    # Увеличиваем счетчик полученных сообщений
+                    self._cache.messages_received += 1
+                    # Логируем каждое полученное сообщение (без форматирования, если INFO выключен)
+                    if info_enabled(logging.INFO):
+                        logger.info(
+                            "📨 WebSocket: Получено сообщение #%d (тип: %s, seq: %s)",
+                            self._cache.messages_received,
+                            event.type,
+                            event.seq,
+                        )
+                    await self._handle_stream_event(event)
+        finally:
+            # Пока поток не подключён заново и не прислал SNAPSHOT, кэш устаревает
+            self._set_synced(False)
+
+    def _apply_balance(self, balance: BalanceModel, replace: bool, log_info: bool) -> None:
+        """Обновить кэш баланса, уведомление идёт через coalescer."""
+        self._cache.balance = balance
+        if log_info:
+            logger.info(
+                "💰 WebSocket: Баланс обновлен - %s %s (доступно: %s)",
+                balance.balance,
+                balance.collateral_name,
+                balance.available_for_trade,
+            )
+        if self._balance_callbacks:
+            self._coalescer.submit("balance", balance)
+
+    def _apply_positions(
+        self, data_positions: List[PositionModel], replace: bool, log_info: bool
+    ) -> None:
+        """Обновить снапшот и индексы позиций, уведомление идёт через coalescer."""
+        positions = _merge_items(self._cache.positions, data_positions, replace, _position_closed)
+        self._cache.positions = positions
+        self._positions_by_market = _build_index(positions, "market")
+        self._positions_by_side = _build_index(positions, "side")
+        self._positions_by_market_side = _build_index(positions, "market", "side")
+        if log_info:
+            logger.info("📊 WebSocket: Позиции обновлены - %d позиций", len(positions))
+        if self._positions_callbacks:
+            self._coalescer.submit("positions", positions)
+
+    def _apply_orders(
+        self, data_orders: List[OpenOrderModel], replace: bool, log_info: bool
+    ) -> None:
+        """Обновить снапшот и индексы ордеров, уведомление идёт через coalescer."""
+        orders = _merge_items(self._cache.orders, data_orders, replace, _order_closed)
+        self._cache.orders = orders
+        self._orders_by_market = _build_index(orders, "market")
+        self._orders_by_side = _build_index(orders, "side")
+        self._orders_by_type = _build_index(orders, "type")
+        if log_info:
+            logger.info("📋 WebSocket: Ордера обновлены - %d ордеров", len(orders))
+        if self._orders_callbacks:
+            self._coalescer.submit("orders", orders)
 
     async def _handle_stream_event(
         self, event: WrappedStreamResponse[AccountStreamDataModel]
@@ -221,46 +870,19 @@ class WebSocketManager:
             return
 
         data = event.data
-
-        # Обновление баланса
-        if data.balance is not None:
-            self._cache.balance = data.balance
-            self._cache.last_update_time["balance"] = asyncio.get_event_loop().time()
-            logger.info(
-                f"💰 WebSocket: Баланс обновлен - {data.balance.balance} {data.balance.collateral_name} "
-                f"(доступно: {data.balance.available_for_trade})"
-            )
-            # Вызвать все callback'и
-            for callback in self._balance_callbacks:
-                try:
-                    await callback(data.balance)
-                except Exception as e:
-                    logger.error(f"Ошибка в callback баланса: {e}", exc_info=True)
-
-        # Обновление позиций
-        if data.positions is not None:
-            self._cache.positions = data.positions
-            self._cache.last_update_time["positions"] = asyncio.get_event_loop().time()
-            logger.info(f"📊 WebSocket: Позиции обновлены - {len(data.positions)} позиций")
-            # Вызвать все callback'и
-            for callback in self._positions_callbacks:
-                try:
-                    await callback(data.positions)
-                except Exception as e:
-                    logger.error(f"Ошибка в callback позиций: {e}", exc_info=True)
-
-        # Обновление ордеров
-        if data.orders is not None:
-            self._cache.orders = data.orders
-            self._cache.last_update_time["orders"] = asyncio.get_event_loop().time()
-            logger.info(f"📋 WebSocket: Ордера обновлены - {len(data.orders)} ордеров")
-            # Вызвать все callback'и
-            for callback in self._orders_callbacks:
-                try:
-                    await callback(data.orders)
-                except Exception as e:
-                    logger.error(f"Ошибка в callback ордеров: {e}", exc_info=True)
+        log_info = logger.isEnabledFor(logging.INFO)
+        now = self._now()
+        replace = event.type == _SNAPSHOT_EVENT
+
+        for field_name, ts_attr, apply in self._handlers:
+            value = getattr(data, field_name)
+            if value is None:
+                continue
+            setattr(self._cache, ts_attr, now)
+            apply(value, replace, log_info)
+        if replace:
+            self._set_synced(True)
 
         # Обновление сделок (trades) - можно использовать для логирования
-        if data.trades is not None and len(data.trades) > 0:
-            logger.info(f"💹 WebSocket: Получены сделки - {len(data.trades)} сделок")
+        if log_info and data.trades:
+            logger.info("💹 WebSocket: Получены сделки - %d сделок", len(data.trades))
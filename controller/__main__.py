@@ -4,16 +4,18 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import dataclasses
 import signal
 import sys
 
 from controller.config import load_config
 from controller.controller import DeltaNeutralController
-from controller.logger import setup_logging
+from controller.event_loop import install_uvloop
+from controller.logger import setup_logging, stop_logging
 from controller.safety import LiveTradingSafetyError, require_live_confirmation
 
 
-def parse_args() -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Delta-Neutral Controller — двухногая работа между выбранными биржами",
     )
@@ -44,7 +46,14 @@ def parse_args() -> argparse.Namespace:
             "Без флага контроллер работает в безопасном режиме."
         ),
     )
-    return parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_args() -> argparse.Namespace:
+    return _PARSER.parse_args()
 
 
 async def main() -> None:
@@ -59,9 +68,9 @@ async def main() -> None:
 
     # Переопределение из CLI
     if args.mode:
-        config.mode = args.mode
+        config = dataclasses.replace(config, mode=args.mode)
     if args.log_level:
-        config.log_level = args.log_level
+        config = dataclasses.replace(config, log_level=args.log_level)
 
     if config.mode == "auto":
         try:
@@ -79,14 +88,27 @@ async def main() -> None:
     # Создание и запуск контроллера
     controller = DeltaNeutralController(config)
 
-    # Обработка сигналов остановки
-    loop = asyncio.get_event_loop()
+    # Обработка сигналов остановки: обработчик только выставляет событие
+    loop = asyncio.get_running_loop()
+    shutdown = asyncio.Event()
     for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(sig, controller.stop)
+        try:
+            loop.add_signal_handler(sig, shutdown.set)
+        except NotImplementedError:
+            # Windows: add_signal_handler не поддерживается
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(shutdown.set))
 
     try:
         await controller.initialize()
-        await controller.run()
+        run_task = asyncio.create_task(controller.run())
+        shutdown_task = asyncio.create_task(shutdown.wait())
+        await asyncio.wait({run_task, shutdown_task}, return_when=asyncio.FIRST_COMPLETED)
+        shutdown_task.cancel()
+        if not run_task.done():
+            # Текущий цикл (в т.ч. выставление ордеров) доходит до конца,
+            # прерывается только пауза до следующего цикла
+            controller.stop()
+        await run_task
     except KeyboardInterrupt:
         controller.stop()
     except Exception as e:
@@ -97,7 +119,9 @@ async def main() -> None:
         sys.exit(1)
     finally:
         await controller.close()
+        stop_logging()
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -5,9 +5,13 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
+from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Literal, cast
+from types import MappingProxyType
+from typing import Any, Callable, Literal, Mapping
 
 import yaml
 
@@ -16,20 +20,32 @@ import yaml
 # ---------------------------------------------------------------------------
 
 
-ExchangeName = Literal["extended", "nado", "variational"]
-_SUPPORTED_EXCHANGES: set[str] = {"extended", "nado", "variational"}
+class Exchange(StrEnum):
+    """Поддерживаемые биржи; члены равны своим строковым значениям и хешируются как они."""
+
+    EXTENDED = "extended"
+    NADO = "nado"
+    VARIATIONAL = "variational"
+
+
+ExchangeName = Exchange
+_SUPPORTED_EXCHANGES: frozenset[str] = frozenset(Exchange)
 _DEFAULT_SECONDARY: dict[ExchangeName, ExchangeName] = {
-    "extended": "variational",
-    "nado": "extended",
-    "variational": "extended",
+    Exchange.EXTENDED: Exchange.VARIATIONAL,
+    Exchange.NADO: Exchange.EXTENDED,
+    Exchange.VARIATIONAL: Exchange.EXTENDED,
 }
+_MODES: frozenset[str] = frozenset(("monitor", "auto"))
+_EXTENDED_NETWORKS: frozenset[str] = frozenset(("mainnet", "testnet"))
+_NADO_NETWORKS: frozenset[str] = frozenset(("mainnet", "testnet", "devnet"))
+_LOG_LEVELS: frozenset[str] = frozenset(("DEBUG", "INFO", "WARNING", "ERROR"))
 
 # ---------------------------------------------------------------------------
 # Instrument mapping
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstrumentConfig:
     """Маппинг одного логического инструмента на биржи."""
 
@@ -44,7 +60,7 @@ class InstrumentConfig:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskLimits:
     """Лимиты риска для дельта-нейтральной стратегии."""
 
@@ -53,6 +69,16 @@ class RiskLimits:
     max_order_size_base: float = 0.05  # Макс. размер одного ордера
     max_position_base: float = 1.0  # Макс. позиция на одну биржу
     min_balance_usd: float = 100.0  # Мин. баланс на бирже для торговли
+    # Гистерезис выравнивания: включается при |delta| > trigger, выключается при |delta| < exit
+    rebalance_trigger_delta: float | None = None  # None → max_delta_base
+    rebalance_exit_delta: float | None = None  # None → rebalance_trigger_delta
+
+    def __post_init__(self) -> None:
+        # frozen: пороги по умолчанию выставляются в обход __setattr__
+        if self.rebalance_trigger_delta is None:
+            object.__setattr__(self, "rebalance_trigger_delta", self.max_delta_base)
+        if self.rebalance_exit_delta is None:
+            object.__setattr__(self, "rebalance_exit_delta", self.rebalance_trigger_delta)
 
 
 # ---------------------------------------------------------------------------
@@ -60,15 +86,19 @@ class RiskLimits:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ControllerConfig:
-    """Конфигурация Delta-Neutral контроллера."""
+    """Конфигурация Delta-Neutral контроллера (неизменяемая; переопределения — dataclasses.replace)."""
 
     # Режим
     mode: Literal["monitor", "auto"] = "monitor"
 
     # Инструменты
     instruments: list[InstrumentConfig] = field(default_factory=list)
+    # Индекс инструментов по symbol (строится в __post_init__)
+    instruments_by_symbol: Mapping[str, InstrumentConfig] = field(
+        init=False, repr=False, compare=False
+    )
 
     # Риски
     risk: RiskLimits = field(default_factory=RiskLimits)
@@ -77,22 +107,30 @@ class ControllerConfig:
     cycle_interval_sec: float = 10.0  # Интервал между циклами
     max_retries: int = 3  # Макс. попыток на один API-вызов
     backoff_base_sec: float = 1.0  # Базовая задержка ретрая
+    rpc_timeout_sec: float = 3.0  # Таймаут одного запроса состояния к бирже
+    # Сколько циклов подряд можно переиспользовать снимок «тихого» инструмента (0 — выкл.)
+    max_quiet_cycles: int = 0
 
     # Extended
-    extended_env_file: str = ""
+    extended_env_file: Path | None = None
     extended_network: str = "mainnet"
+    extended_max_concurrency: int = 8  # Макс. одновременных REST-вызовов
 
     # Nado
-    nado_env_file: str = ""
+    nado_env_file: Path | None = None
     nado_network: str = "mainnet"
     nado_subaccount_name: str = "default"
+    nado_max_concurrency: int = 5
 
     # Variational
-    variational_env_file: str = ""
+    variational_env_file: Path | None = None
+    variational_max_concurrency: int = 4
 
     # Entry pair
-    entry_primary_exchange: ExchangeName = "extended"
-    entry_secondary_exchange: ExchangeName = "variational"
+    entry_primary_exchange: ExchangeName = Exchange.EXTENDED
+    entry_secondary_exchange: ExchangeName = Exchange.VARIATIONAL
+    # Биржи активной пары (строится в __post_init__)
+    active_exchanges: frozenset[ExchangeName] = field(init=False, repr=False, compare=False)
 
     # Логирование
     log_level: str = "INFO"
@@ -102,6 +140,16 @@ class ControllerConfig:
     order_post_only: bool = True
     price_offset_pct: float = 0.01  # Сдвиг цены от ref (% от ref price)
 
+    def __post_init__(self) -> None:
+        # frozen: производные поля выставляются в обход __setattr__
+        by_symbol = MappingProxyType({i.symbol: i for i in self.instruments})
+        object.__setattr__(self, "instruments_by_symbol", by_symbol)
+        object.__setattr__(
+            self,
+            "active_exchanges",
+            _active_exchanges(self.entry_primary_exchange, self.entry_secondary_exchange),
+        )
+
 
 class ConfigValidationError(ValueError):
     """Ошибка валидации конфигурации контроллера."""
@@ -133,12 +181,18 @@ def _as_int(value: Any, field: str) -> int:
         raise ConfigValidationError(f"Поле '{field}' должно быть целым числом") from e
 
 
+def _active_exchanges(primary: ExchangeName, secondary: ExchangeName) -> frozenset[ExchangeName]:
+    """Биржи активной пары (primary + secondary)."""
+    return frozenset((primary, secondary))
+
+
 def _as_exchange_name(value: Any, field: str) -> ExchangeName:
     name = _as_non_empty_string(value, field).lower()
     if name not in _SUPPORTED_EXCHANGES:
         allowed = ", ".join(sorted(_SUPPORTED_EXCHANGES))
         raise ConfigValidationError(f"Поле '{field}' должно быть одним из: {allowed}")
-    return cast(ExchangeName, name)
+    # Имя не интернируется: Exchange(name) возвращает единственный член enum для биржи
+    return Exchange(name)
 
 
 def _resolve_path(path_value: str, dn_root: Path) -> Path:
@@ -180,6 +234,122 @@ def _require_positive(value: float, field: str) -> None:
         raise ConfigValidationError(f"Поле '{field}' должно быть > 0")
 
 
+def _build_instruments(
+    raw_instruments: list[Any],
+    primary: ExchangeName,
+    secondary: ExchangeName,
+) -> list[InstrumentConfig]:
+    """Разобрать секцию 'instruments' сразу в InstrumentConfig.
+
+    Args:
+        raw_instruments: Непустой список из YAML.
+        primary: Основная биржа пары.
+        secondary: Вторая биржа пары.
+
+    Returns:
+        list[InstrumentConfig]: Инструменты в порядке конфига.
+    """
+    instruments: list[InstrumentConfig] = []
+    seen_symbols: set[str] = set()
+    for idx, item in enumerate(raw_instruments):
+        if not isinstance(item, dict):
+            raise ConfigValidationError(f"instruments[{idx}] должен быть mapping (dict)")
+        # Символы сравниваются в каждом цикле — интернируем при загрузке
+        symbol = sys.intern(
+            _as_non_empty_string(item.get("symbol"), f"instruments[{idx}].symbol")
+        )
+        market_name = (
+            _as_optional_non_empty_string(
+                item.get("extended_market_name"),
+                f"instruments[{idx}].extended_market_name",
+            )
+            if "extended_market_name" in item
+            else None
+        )
+        product_id = (
+            _as_int(item.get("nado_product_id"), f"instruments[{idx}].nado_product_id")
+            if "nado_product_id" in item and item.get("nado_product_id") is not None
+            else None
+        )
+        if product_id is not None and product_id <= 0:
+            raise ConfigValidationError(f"instruments[{idx}].nado_product_id должен быть > 0")
+        variational_underlying = (
+            _as_optional_non_empty_string(
+                item.get("variational_underlying"),
+                f"instruments[{idx}].variational_underlying",
+            )
+            if "variational_underlying" in item
+            else None
+        )
+        if symbol in seen_symbols:
+            raise ConfigValidationError(f"Дублирующийся инструмент symbol='{symbol}'")
+        seen_symbols.add(symbol)
+
+        inst = InstrumentConfig(
+            symbol=symbol,
+            extended_market_name=market_name,
+            nado_product_id=product_id,
+            variational_underlying=variational_underlying,
+        )
+        _validate_instrument_mapping(inst, idx, primary, secondary)
+        instruments.append(inst)
+    return instruments
+
+
+_NumericCheck = Callable[[float, str], None]
+
+# Числовые поля: "секция.ключ" (или "ключ" для корня) -> (тип, значение по умолчанию, проверка)
+_NUMERIC_SCHEMA: dict[str, tuple[type, float, _NumericCheck]] = {
+    "risk.max_delta_base": (float, 0.01, _require_non_negative),
+    "risk.max_delta_usd": (float, 1000.0, _require_non_negative),
+    "risk.max_order_size_base": (float, 0.05, _require_positive),
+    "risk.max_position_base": (float, 1.0, _require_positive),
+    "risk.min_balance_usd": (float, 100.0, _require_non_negative),
+    "cycle_interval_sec": (float, 10.0, _require_positive),
+    "max_retries": (int, 3, _require_non_negative),
+    "backoff_base_sec": (float, 1.0, _require_non_negative),
+    "rpc_timeout_sec": (float, 3.0, _require_positive),
+    "max_quiet_cycles": (int, 0, _require_non_negative),
+    "price_offset_pct": (float, 0.01, _require_non_negative),
+    "extended.max_concurrency": (int, 8, _require_positive),
+    "nado.max_concurrency": (int, 5, _require_positive),
+    "variational.max_concurrency": (int, 4, _require_positive),
+}
+
+
+def _extract_numeric(sections: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Привести и проверить все поля _NUMERIC_SCHEMA за один проход.
+
+    Args:
+        sections: Секции YAML по имени ("" — корень документа).
+
+    Returns:
+        dict[str, Any]: Значения по пути поля из схемы.
+    """
+    values: dict[str, Any] = {}
+    for path, (kind, default, check) in _NUMERIC_SCHEMA.items():
+        section, _, key = path.rpartition(".")
+        coerce = _as_int if kind is int else _as_float
+        value = coerce(sections[section].get(key, default), path)
+        check(value, path)
+        values[path] = value
+    return values
+
+
+# libyaml (C) загрузчик, если PyYAML собран с ним; иначе — чистый Python SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _read_yaml(path: str, mtime_ns: int) -> Any:
+    """Разобрать YAML файл; неизменённый файл (тот же mtime) повторно не разбирается.
+
+    Результат общий для всех вызовов и не должен изменяться.
+    """
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 def load_config(config_path: str = "config.yaml") -> ControllerConfig:
     """Загрузить конфигурацию из YAML файла.
 
@@ -196,8 +366,7 @@ def load_config(config_path: str = "config.yaml") -> ControllerConfig:
     if not path.exists():
         raise FileNotFoundError(f"Конфиг не найден: {path}")
 
-    with open(path, encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+    raw = _read_yaml(str(path.resolve()), path.stat().st_mtime_ns) or {}
     if not isinstance(raw, dict):
         raise ConfigValidationError("Корневой YAML-объект должен быть mapping (dict)")
 
@@ -245,10 +414,10 @@ def load_config(config_path: str = "config.yaml") -> ControllerConfig:
     nado_env_path = _resolve_path(nado_env, dn_root)
     variational_env_path = _resolve_path(variational_env, dn_root) if variational_env else None
 
-    active_exchanges = {primary_exchange, secondary_exchange}
-    if "extended" in active_exchanges and not ext_env_path.exists():
+    active_exchanges = _active_exchanges(primary_exchange, secondary_exchange)
+    if Exchange.EXTENDED in active_exchanges and not ext_env_path.exists():
         raise FileNotFoundError(f"Файл окружения Extended не найден: {ext_env_path}")
-    if "nado" in active_exchanges and not nado_env_path.exists():
+    if Exchange.NADO in active_exchanges and not nado_env_path.exists():
         raise FileNotFoundError(f"Файл окружения Nado не найден: {nado_env_path}")
 
     # Инструменты
@@ -256,96 +425,59 @@ def load_config(config_path: str = "config.yaml") -> ControllerConfig:
     if not isinstance(raw_instruments, list) or not raw_instruments:
         raise ConfigValidationError("В конфиге должен быть непустой список 'instruments'")
 
-    instruments: list[InstrumentConfig] = []
-    seen_symbols: set[str] = set()
-    for idx, item in enumerate(raw_instruments):
-        if not isinstance(item, dict):
-            raise ConfigValidationError(f"instruments[{idx}] должен быть mapping (dict)")
-        symbol = _as_non_empty_string(item.get("symbol"), f"instruments[{idx}].symbol")
-        market_name = (
-            _as_optional_non_empty_string(
-                item.get("extended_market_name"),
-                f"instruments[{idx}].extended_market_name",
-            )
-            if "extended_market_name" in item
-            else None
-        )
-        product_id = (
-            _as_int(item.get("nado_product_id"), f"instruments[{idx}].nado_product_id")
-            if "nado_product_id" in item and item.get("nado_product_id") is not None
-            else None
-        )
-        if product_id is not None and product_id <= 0:
-            raise ConfigValidationError(f"instruments[{idx}].nado_product_id должен быть > 0")
-        variational_underlying = (
-            _as_optional_non_empty_string(
-                item.get("variational_underlying"),
-                f"instruments[{idx}].variational_underlying",
-            )
-            if "variational_underlying" in item
-            else None
-        )
-        if symbol in seen_symbols:
-            raise ConfigValidationError(f"Дублирующийся инструмент symbol='{symbol}'")
-        seen_symbols.add(symbol)
-
-        inst = InstrumentConfig(
-            symbol=symbol,
-            extended_market_name=market_name,
-            nado_product_id=product_id,
-            variational_underlying=variational_underlying,
-        )
-        _validate_instrument_mapping(inst, idx, primary_exchange, secondary_exchange)
-        instruments.append(inst)
+    instruments = _build_instruments(raw_instruments, primary_exchange, secondary_exchange)
 
     # Риски
     risk_raw = raw.get("risk", {})
     if not isinstance(risk_raw, dict):
         raise ConfigValidationError("Секция 'risk' должна быть mapping (dict)")
 
-    max_delta_base = _as_float(risk_raw.get("max_delta_base", 0.01), "risk.max_delta_base")
-    max_delta_usd = _as_float(risk_raw.get("max_delta_usd", 1000.0), "risk.max_delta_usd")
-    max_order_size_base = _as_float(
-        risk_raw.get("max_order_size_base", 0.05),
-        "risk.max_order_size_base",
-    )
-    max_position_base = _as_float(
-        risk_raw.get("max_position_base", 1.0),
-        "risk.max_position_base",
+    numeric = _extract_numeric(
+        {
+            "": raw,
+            "risk": risk_raw,
+            "extended": extended_raw,
+            "nado": nado_raw,
+            "variational": variational_raw,
+        }
     )
-    min_balance_usd = _as_float(risk_raw.get("min_balance_usd", 100.0), "risk.min_balance_usd")
 
-    _require_non_negative(max_delta_base, "risk.max_delta_base")
-    _require_non_negative(max_delta_usd, "risk.max_delta_usd")
-    _require_positive(max_order_size_base, "risk.max_order_size_base")
-    _require_positive(max_position_base, "risk.max_position_base")
-    _require_non_negative(min_balance_usd, "risk.min_balance_usd")
+    # Пороги гистерезиса по умолчанию выводятся из max_delta_base, поэтому не в _NUMERIC_SCHEMA
+    trigger_delta = _as_float(
+        risk_raw.get("rebalance_trigger_delta", numeric["risk.max_delta_base"]),
+        "risk.rebalance_trigger_delta",
+    )
+    _require_non_negative(trigger_delta, "risk.rebalance_trigger_delta")
+    exit_delta = _as_float(
+        risk_raw.get("rebalance_exit_delta", trigger_delta),
+        "risk.rebalance_exit_delta",
+    )
+    _require_non_negative(exit_delta, "risk.rebalance_exit_delta")
+    if exit_delta > trigger_delta:
+        raise ConfigValidationError(
+            "risk.rebalance_exit_delta не может быть больше risk.rebalance_trigger_delta"
+        )
 
     risk = RiskLimits(
-        max_delta_base=max_delta_base,
-        max_delta_usd=max_delta_usd,
-        max_order_size_base=max_order_size_base,
-        max_position_base=max_position_base,
-        min_balance_usd=min_balance_usd,
+        max_delta_base=numeric["risk.max_delta_base"],
+        max_delta_usd=numeric["risk.max_delta_usd"],
+        max_order_size_base=numeric["risk.max_order_size_base"],
+        max_position_base=numeric["risk.max_position_base"],
+        min_balance_usd=numeric["risk.min_balance_usd"],
+        rebalance_trigger_delta=trigger_delta,
+        rebalance_exit_delta=exit_delta,
     )
 
     mode = str(raw.get("mode", "monitor")).lower()
-    if mode not in ("monitor", "auto"):
+    if mode not in _MODES:
         raise ConfigValidationError("mode должен быть 'monitor' или 'auto'")
 
-    cycle_interval_sec = _as_float(raw.get("cycle_interval_sec", 10.0), "cycle_interval_sec")
-    max_retries = _as_int(raw.get("max_retries", 3), "max_retries")
-    backoff_base_sec = _as_float(raw.get("backoff_base_sec", 1.0), "backoff_base_sec")
-    _require_positive(cycle_interval_sec, "cycle_interval_sec")
-    _require_non_negative(float(max_retries), "max_retries")
-    _require_non_negative(backoff_base_sec, "backoff_base_sec")
-
     ext_network = str(extended_raw.get("network", "mainnet")).lower()
-    if ext_network not in ("mainnet", "testnet"):
+    if ext_network not in _EXTENDED_NETWORKS:
         raise ConfigValidationError("extended.network должен быть 'mainnet' или 'testnet'")
 
     nado_network = str(nado_raw.get("network", "mainnet")).lower()
-    if nado_network not in ("mainnet", "testnet", "devnet"):
+    if nado_network not in _NADO_NETWORKS:
         raise ConfigValidationError("nado.network должен быть 'mainnet', 'testnet' или 'devnet'")
 
     nado_subaccount_name = _as_non_empty_string(
@@ -354,14 +486,12 @@ def load_config(config_path: str = "config.yaml") -> ControllerConfig:
     )
 
     log_level = str(raw.get("log_level", "INFO")).upper()
-    if log_level not in {"DEBUG", "INFO", "WARNING", "ERROR"}:
+    if log_level not in _LOG_LEVELS:
         raise ConfigValidationError("log_level должен быть одним из: DEBUG, INFO, WARNING, ERROR")
 
     order_post_only = raw.get("order_post_only", True)
     if not isinstance(order_post_only, bool):
         raise ConfigValidationError("order_post_only должен быть bool")
-    price_offset_pct = _as_float(raw.get("price_offset_pct", 0.01), "price_offset_pct")
-    _require_non_negative(price_offset_pct, "price_offset_pct")
 
     log_file = raw.get("log_file")
     if log_file is not None and not isinstance(log_file, str):
@@ -371,21 +501,26 @@ def load_config(config_path: str = "config.yaml") -> ControllerConfig:
         mode=mode,  # type: ignore[arg-type]
         instruments=instruments,
         risk=risk,
-        cycle_interval_sec=cycle_interval_sec,
-        max_retries=max_retries,
-        backoff_base_sec=backoff_base_sec,
-        extended_env_file=str(ext_env_path),
+        cycle_interval_sec=numeric["cycle_interval_sec"],
+        max_retries=numeric["max_retries"],
+        backoff_base_sec=numeric["backoff_base_sec"],
+        rpc_timeout_sec=numeric["rpc_timeout_sec"],
+        max_quiet_cycles=numeric["max_quiet_cycles"],
+        extended_env_file=ext_env_path,
         extended_network=ext_network,
-        nado_env_file=str(nado_env_path),
+        extended_max_concurrency=numeric["extended.max_concurrency"],
+        nado_env_file=nado_env_path,
         nado_network=nado_network,
         nado_subaccount_name=nado_subaccount_name,
-        variational_env_file=str(variational_env_path) if variational_env_path else "",
+        nado_max_concurrency=numeric["nado.max_concurrency"],
+        variational_env_file=variational_env_path,
+        variational_max_concurrency=numeric["variational.max_concurrency"],
         entry_primary_exchange=primary_exchange,
         entry_secondary_exchange=secondary_exchange,
         log_level=log_level,
         log_file=log_file,
         order_post_only=order_post_only,
-        price_offset_pct=price_offset_pct,
+        price_offset_pct=numeric["price_offset_pct"],
     )
 
     return cfg
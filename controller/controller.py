@@ -7,19 +7,104 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import logging
 import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
 
-from controller.config import ControllerConfig, ExchangeName
+from controller.config import ControllerConfig, Exchange, ExchangeName
 from controller.delta_engine import DeltaEngine, DeltaDecision, RebalanceAction
 from controller.extended_adapter import ExtendedAdapter
 from controller.interface import ExchangeAdapter
-from controller.models import DeltaSnapshot, ExchangeState
+from controller.models import DeltaSnapshot, ExchangeState, LimitOrderRequest
 from controller.nado_adapter import NadoAdapter
 from controller.variational_adapter import VariationalAdapter
 
 logger = logging.getLogger("dn.controller")
 
+_T = TypeVar("_T")
+
+
+def _is_quiet(last_price: float, price: float | Exception) -> bool:
+    """Ref price получена и сдвинулась относительно прошлой меньше _QUIET_REF_EPSILON."""
+    if isinstance(price, Exception) or last_price <= 0 or price <= 0:
+        return False
+    return abs(price - last_price) / last_price < _QUIET_REF_EPSILON
+
+
+async def _settled(aw: Awaitable[_T]) -> _T | Exception:
+    """Дождаться awaitable и вернуть исключение как значение (аналог return_exceptions=True)."""
+    try:
+        return await aw
+    except Exception as exc:
+        return exc
+
+# Число запросов на одну биржу/инструмент в _state_requests
+_STATE_REQUESTS_PER_EXCHANGE = 4
+# TTL кэша reference price: цена меняется быстро, переиспользуем только в пределах цикла
+_REF_PRICE_TTL_SEC = 0.2
+# Относительное изменение ref price, ниже которого инструмент считается «тихим»
+_QUIET_REF_EPSILON = 1e-4
+
+
+# -- Фабрики адаптеров -------------------------------------------------------
+
+
+def _build_extended(config: ControllerConfig) -> ExchangeAdapter:
+    ext_map: dict[str, str] = {}
+    for inst in config.instruments:
+        if not inst.extended_market_name:
+            raise ValueError(
+                "Для Extended в runtime-контроллере нужен "
+                f"instruments[].extended_market_name (symbol={inst.symbol})"
+            )
+        ext_map[inst.symbol] = inst.extended_market_name
+    return ExtendedAdapter(
+        env_file=config.extended_env_file,
+        instrument_map=ext_map,
+    )
+
+
+def _build_nado(config: ControllerConfig) -> ExchangeAdapter:
+    nado_map: dict[str, int] = {}
+    for inst in config.instruments:
+        if inst.nado_product_id is None:
+            raise ValueError(
+                "Для Nado в runtime-контроллере нужен "
+                f"instruments[].nado_product_id (symbol={inst.symbol})"
+            )
+        nado_map[inst.symbol] = inst.nado_product_id
+    return NadoAdapter(
+        env_file=config.nado_env_file,
+        instrument_map=nado_map,
+        network=config.nado_network,
+        subaccount_name=config.nado_subaccount_name,
+    )
+
+
+def _build_variational(config: ControllerConfig) -> ExchangeAdapter:
+    variational_map: dict[str, str] = {}
+    for inst in config.instruments:
+        if not inst.variational_underlying:
+            raise ValueError(
+                "Для Variational в runtime-контроллере нужен "
+                f"instruments[].variational_underlying (symbol={inst.symbol})"
+            )
+        variational_map[inst.symbol] = inst.variational_underlying
+    return VariationalAdapter(
+        env_file=config.variational_env_file or "Variational/.env",
+        instrument_map=variational_map,
+    )
+
+
+# Биржа -> фабрика адаптера; новая биржа добавляется одной записью
+_ADAPTER_FACTORIES: dict[str, Callable[[ControllerConfig], ExchangeAdapter]] = {
+    Exchange.EXTENDED: _build_extended,
+    Exchange.NADO: _build_nado,
+    Exchange.VARIATIONAL: _build_variational,
+}
+
 
 class DeltaNeutralController:
     """Контроллер дельта-нейтральной стратегии."""
@@ -28,6 +113,8 @@ class DeltaNeutralController:
         self._config = config
         self._engine = DeltaEngine(config)
         self._running = False
+        # Выставляется stop(): прерывает паузу между циклами, но не текущий цикл
+        self._stop_event = asyncio.Event()
         self._cycle_count = 0
 
         # Активная торговая пара из конфига
@@ -36,55 +123,22 @@ class DeltaNeutralController:
 
         # Инициализированные адаптеры по имени биржи
         self._adapters: dict[str, ExchangeAdapter] = {}
+        # Ограничение одновременных REST-вызовов на биржу (по имени адаптера)
+        self._sem: dict[str, asyncio.Semaphore] = {}
+        # (биржа, инструмент, запрос) -> (monotonic-время истечения, задача запроса)
+        self._cache: dict[tuple[str, str, str], tuple[float, asyncio.Task]] = {}
+        # Последние полные снимки инструментов без открытых ордеров и ошибок сбора
+        # и число циклов подряд, на которых они переиспользованы (max_quiet_cycles)
+        self._last_states: dict[str, tuple[ExchangeState, ExchangeState]] = {}
+        self._quiet_streak: dict[str, int] = {}
 
     # -- Инициализация -------------------------------------------------------
 
     def _build_adapter(self, exchange: ExchangeName) -> ExchangeAdapter:
-        if exchange == "extended":
-            ext_map: dict[str, str] = {}
-            for inst in self._config.instruments:
-                if not inst.extended_market_name:
-                    raise ValueError(
-                        "Для Extended в runtime-контроллере нужен "
-                        f"instruments[].extended_market_name (symbol={inst.symbol})"
-                    )
-                ext_map[inst.symbol] = inst.extended_market_name
-            return ExtendedAdapter(
-                env_file=self._config.extended_env_file,
-                instrument_map=ext_map,
-            )
-
-        if exchange == "nado":
-            nado_map: dict[str, int] = {}
-            for inst in self._config.instruments:
-                if inst.nado_product_id is None:
-                    raise ValueError(
-                        "Для Nado в runtime-контроллере нужен "
-                        f"instruments[].nado_product_id (symbol={inst.symbol})"
-                    )
-                nado_map[inst.symbol] = inst.nado_product_id
-            return NadoAdapter(
-                env_file=self._config.nado_env_file,
-                instrument_map=nado_map,
-                network=self._config.nado_network,
-                subaccount_name=self._config.nado_subaccount_name,
-            )
-
-        if exchange == "variational":
-            variational_map: dict[str, str] = {}
-            for inst in self._config.instruments:
-                if not inst.variational_underlying:
-                    raise ValueError(
-                        "Для Variational в runtime-контроллере нужен "
-                        f"instruments[].variational_underlying (symbol={inst.symbol})"
-                    )
-                variational_map[inst.symbol] = inst.variational_underlying
-            return VariationalAdapter(
-                env_file=self._config.variational_env_file or "Variational/.env",
-                instrument_map=variational_map,
-            )
-
-        raise ValueError(f"Неподдерживаемая биржа: {exchange}")
+        factory = _ADAPTER_FACTORIES.get(exchange)
+        if factory is None:
+            raise ValueError(f"Неподдерживаемая биржа: {exchange}")
+        return factory(self._config)
 
     async def initialize(self) -> None:
         """Создать и инициализировать адаптеры активной пары из конфига."""
@@ -100,125 +154,326 @@ class DeltaNeutralController:
         logger.info("=" * 60)
 
         self._adapters.clear()
-        for exchange in (self._primary_exchange, self._secondary_exchange):
-            if exchange in self._adapters:
-                continue
-            adapter = self._build_adapter(exchange)
-            await adapter.initialize()
-            self._adapters[exchange] = adapter
+        self._sem = {
+            "extended": asyncio.Semaphore(self._config.extended_max_concurrency),
+            "nado": asyncio.Semaphore(self._config.nado_max_concurrency),
+            "variational": asyncio.Semaphore(self._config.variational_max_concurrency),
+        }
+        pending = {
+            exchange: self._build_adapter(exchange)
+            for exchange in self._config.active_exchanges
+        }
+        # Адаптеры независимы — инициализируем параллельно
+        results = await asyncio.gather(
+            *(adapter.initialize() for adapter in pending.values()),
+            return_exceptions=True,
+        )
+        errors: list[BaseException] = []
+        for (exchange, adapter), result in zip(pending.items(), results):
+            if isinstance(result, BaseException):
+                errors.append(result)
+            else:
+                # Успешно инициализированные регистрируем, чтобы close() их закрыл
+                self._adapters[exchange] = adapter
+        if errors:
+            raise errors[0]
+
+        # Потоки данных — оптимизация: при ошибке адаптер остаётся на REST
+        adapters = list(self._adapters.values())
+        stream_results = await asyncio.gather(
+            *(adapter.start_stream() for adapter in adapters),
+            return_exceptions=True,
+        )
+        for adapter, result in zip(adapters, stream_results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "%s: поток данных не запущен, работаем через REST: %s", adapter.name, result
+                )
 
         logger.info("Инициализировано адаптеров: %s", sorted(self._adapters.keys()))
 
     async def close(self) -> None:
         """Корректно закрыть все инициализированные адаптеры."""
         self._running = False
-        for adapter in self._adapters.values():
-            try:
-                await adapter.close()
-            except Exception as e:
-                logger.warning("Ошибка закрытия адаптера %s: %s", adapter.name, e)
+        adapters = list(self._adapters.values())
+        results = await asyncio.gather(
+            *(adapter.close() for adapter in adapters),
+            return_exceptions=True,
+        )
+        for adapter, result in zip(adapters, results):
+            if isinstance(result, Exception):
+                logger.warning("Ошибка закрытия адаптера %s: %s", adapter.name, result)
         logger.info("Контроллер остановлен")
 
     # -- Сбор состояния ------------------------------------------------------
 
-    async def _collect_state(
+    async def _limited(
+        self,
+        adapter: ExchangeAdapter,
+        call: Awaitable[_T],
+        timeout: float | None = None,
+    ) -> _T:
+        """Выполнить вызов адаптера под семафором его биржи (опционально с таймаутом)."""
+        async with self._sem[adapter.name]:
+            if timeout is None:
+                return await call
+            try:
+                return await asyncio.wait_for(call, timeout=timeout)
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError(f"нет ответа за {timeout:.1f} сек") from None
+
+    def _request(self, adapter: ExchangeAdapter, call: Awaitable[_T]) -> Awaitable[_T]:
+        """Обернуть запрос состояния семафором биржи и таймаутом rpc_timeout_sec."""
+        # Таймаут превращает зависший вызов в TimeoutError в результатах сбора
+        return self._limited(adapter, call, self._config.rpc_timeout_sec)
+
+    def _cached_request(
         self,
+        key: tuple[str, str, str],
+        ttl: float,
+        adapter: ExchangeAdapter,
+        make_call: Callable[[], Awaitable[_T]],
+    ) -> asyncio.Task[_T]:
+        """Вернуть задачу из кэша, пока не истёк TTL, иначе запустить новый запрос.
+
+        Кэшируется сама задача, поэтому одновременные запросы по одному ключу
+        (например, баланс для нескольких инструментов одной биржи в одном цикле)
+        разделяют один REST-вызов. Задачи, завершившиеся ошибкой, не переиспользуются.
+        """
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None:
+            expires_at, task = cached
+            failed = task.done() and (task.cancelled() or task.exception() is not None)
+            if now < expires_at and not failed:
+                return task
+        task = asyncio.create_task(self._request(adapter, make_call()))
+        self._cache[key] = (now + ttl, task)
+        return task
+
+    def _state_requests(self, adapter: ExchangeAdapter, instrument: str) -> list[Awaitable[Any]]:
+        """Запросы состояния одной биржи по инструменту (баланс, позиция, ордера, ref)."""
+        name = adapter.name
+        return [
+            # Баланс общий для всех инструментов биржи и почти не меняется между циклами
+            self._cached_request(
+                (name, "", "balance"),
+                self._config.cycle_interval_sec / 2,
+                adapter,
+                adapter.get_balance,
+            ),
+            # Позиции и ордера — всегда свежие
+            self._request(adapter, adapter.get_position(instrument)),
+            self._request(adapter, adapter.get_open_orders(instrument)),
+            self._ref_price_request(adapter, instrument),
+        ]
+
+    def _ref_price_request(self, adapter: ExchangeAdapter, instrument: str) -> asyncio.Task[float]:
+        """Запрос ref price с коротким TTL (общий для проверки «тихих» инструментов и сбора)."""
+        return self._cached_request(
+            (adapter.name, instrument, "ref_price"),
+            _REF_PRICE_TTL_SEC,
+            adapter,
+            lambda: adapter.get_reference_price(instrument),
+        )
+
+    @staticmethod
+    def _build_state(
         adapter: ExchangeAdapter,
         instrument: str,
+        timestamp: float,
+        results: Sequence[Any],
     ) -> ExchangeState:
-        """Собрать полное состояние одной биржи по одному инструменту."""
-        ts = time.time()
+        """Собрать ExchangeState из результатов _state_requests (ошибки логируются)."""
         state = ExchangeState(
             exchange=adapter.name,
             instrument=instrument,
-            timestamp=ts,
+            timestamp=timestamp,
         )
 
-        try:
-            # Параллельный сбор данных
-            balance_task = asyncio.create_task(adapter.get_balance())
-            position_task = asyncio.create_task(adapter.get_position(instrument))
-            orders_task = asyncio.create_task(adapter.get_open_orders(instrument))
-            ref_price_task = asyncio.create_task(adapter.get_reference_price(instrument))
+        if not isinstance(results[0], Exception):
+            state.balance = results[0]
+        else:
+            logger.error("%s: ошибка получения баланса: %s", adapter.name, results[0])
 
-            results = await asyncio.gather(
-                balance_task,
-                position_task,
-                orders_task,
-                ref_price_task,
-                return_exceptions=True,
-            )
+        if not isinstance(results[1], Exception):
+            state.position = results[1]
+        else:
+            logger.error("%s: ошибка получения позиции: %s", adapter.name, results[1])
 
-            # Обрабатываем результаты
-            if not isinstance(results[0], Exception):
-                state.balance = results[0]
-            else:
-                logger.error("%s: ошибка получения баланса: %s", adapter.name, results[0])
+        if not isinstance(results[2], Exception):
+            state.open_orders = results[2]
+        else:
+            logger.error("%s: ошибка получения ордеров: %s", adapter.name, results[2])
 
-            if not isinstance(results[1], Exception):
-                state.position = results[1]
-            else:
-                logger.error("%s: ошибка получения позиции: %s", adapter.name, results[1])
+        if not isinstance(results[3], Exception):
+            state.reference_price = results[3]
+        else:
+            logger.error("%s: ошибка получения ref price: %s", adapter.name, results[3])
 
-            if not isinstance(results[2], Exception):
-                state.open_orders = results[2]
-            else:
-                logger.error("%s: ошибка получения ордеров: %s", adapter.name, results[2])
+        return state
 
-            if not isinstance(results[3], Exception):
-                state.reference_price = results[3]
-            else:
-                logger.error("%s: ошибка получения ref price: %s", adapter.name, results[3])
+    async def _reuse_quiet_states(
+        self,
+        primary: ExchangeAdapter,
+        secondary: ExchangeAdapter,
+        instruments: list[str],
+        timestamp: float,
+    ) -> dict[str, tuple[ExchangeState, ExchangeState]]:
+        """Переиспользовать прошлые снимки инструментов, у которых не сдвинулась ref price.
+
+        Кандидаты — инструменты с сохранённым снимком (без открытых ордеров, без
+        ошибок сбора, без действий в прошлом цикле), переиспользованные меньше
+        max_quiet_cycles раз подряд. Для них запрашивается только ref price.
+        """
+        max_quiet = self._config.max_quiet_cycles
+        candidates = [
+            inst
+            for inst in instruments
+            if inst in self._last_states and self._quiet_streak.get(inst, 0) < max_quiet
+        ]
+        if not candidates:
+            return {}
+
+        async with asyncio.TaskGroup() as tg:
+            probes = [
+                tg.create_task(_settled(self._ref_price_request(adapter, inst)))
+                for inst in candidates
+                for adapter in (primary, secondary)
+            ]
+        prices = [probe.result() for probe in probes]
+
+        reused: dict[str, tuple[ExchangeState, ExchangeState]] = {}
+        for i, inst in enumerate(candidates):
+            last_pair = self._last_states[inst]
+            new_prices = prices[2 * i : 2 * i + 2]
+            if not all(
+                _is_quiet(state.reference_price, price)
+                for state, price in zip(last_pair, new_prices)
+            ):
+                continue
+            ext_state, nado_state = (
+                dataclasses.replace(state, reference_price=price, timestamp=timestamp)
+                for state, price in zip(last_pair, new_prices)
+            )
+            reused[inst] = (ext_state, nado_state)
+            self._quiet_streak[inst] = self._quiet_streak.get(inst, 0) + 1
+        return reused
 
-        except Exception as e:
-            logger.error("%s: критическая ошибка сбора состояния: %s", adapter.name, e)
+    async def _collect_states(
+        self,
+        primary: ExchangeAdapter,
+        secondary: ExchangeAdapter,
+    ) -> list[tuple[ExchangeState, ExchangeState]]:
+        """Собрать состояние обеих бирж по всем инструментам в одной TaskGroup."""
+        instruments = [inst_cfg.symbol for inst_cfg in self._config.instruments]
+        ts = time.time()
 
-        return state
+        reused = await self._reuse_quiet_states(primary, secondary, instruments, ts)
+        fresh = [inst for inst in instruments if inst not in reused]
+        pairs = [(adapter, inst) for inst in fresh for adapter in (primary, secondary)]
+
+        # Ошибки запросов возвращаются как значения (_settled), поэтому группа
+        # прерывается только отменой — и тогда отменяет все незавершённые запросы
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(_settled(request))
+                for adapter, inst in pairs
+                for request in self._state_requests(adapter, inst)
+            ]
+        results = [task.result() for task in tasks]
+
+        step = _STATE_REQUESTS_PER_EXCHANGE
+        collected = dict(reused)
+        for j, inst in enumerate(fresh):
+            chunk = results[2 * j * step : 2 * (j + 1) * step]
+            ext_state = self._build_state(primary, inst, ts, chunk[:step])
+            nado_state = self._build_state(secondary, inst, ts, chunk[step:])
+            collected[inst] = (ext_state, nado_state)
+
+            # Переиспользовать можно только полный снимок без ошибок и открытых ордеров
+            self._quiet_streak[inst] = 0
+            clean = not any(isinstance(result, Exception) for result in chunk)
+            if self._config.max_quiet_cycles and clean and not (
+                ext_state.open_orders or nado_state.open_orders
+            ):
+                self._last_states[inst] = (ext_state, nado_state)
+            else:
+                self._last_states.pop(inst, None)
+
+        return [collected[inst] for inst in instruments]
 
     # -- Исполнение действий -------------------------------------------------
 
-    async def _execute_action(self, action: RebalanceAction) -> bool:
-        """Исполнить одно действие по выравниванию."""
-        adapter = self._adapters.get(action.exchange)
+    async def _execute_batch(self, exchange: str, actions: list[RebalanceAction]) -> None:
+        """Исполнить действия одной биржи пакетом (или по ордеру под семафором биржи)."""
+        adapter = self._adapters.get(exchange)
         if adapter is None:
-            logger.error("Адаптер %s не инициализирован", action.exchange)
-            return False
-
-        logger.info(
-            "EXECUTE: %s %s %.6f %s @ %.2f на %s | %s",
-            action.side.value.upper(),
-            action.amount,
-            action.amount,
-            action.instrument,
-            action.price,
-            action.exchange.upper(),
-            action.reason,
-        )
-
-        result = await adapter.place_limit_order(
-            instrument=action.instrument,
-            side=action.side,
-            price=action.price,
-            amount=action.amount,
-            post_only=self._config.order_post_only,
-        )
+            logger.error("Адаптер %s не инициализирован", exchange)
+            return
+
+        for action in actions:
+            logger.info(
+                "EXECUTE: %s %.6f %s @ %.2f на %s | %s",
+                action.side.value.upper(),
+                action.amount,
+                action.instrument,
+                action.price,
+                action.exchange.upper(),
+                action.reason,
+            )
 
-        if result.success:
-            logger.info("  → Ордер выставлен: %s", result.id)
+        orders = [
+            LimitOrderRequest(
+                instrument=action.instrument,
+                side=action.side,
+                price=action.price,
+                amount=action.amount,
+                post_only=self._config.order_post_only,
+            )
+            for action in actions
+        ]
+        if type(adapter).place_limit_orders is ExchangeAdapter.place_limit_orders:
+            # Базовая реализация шлёт по запросу на ордер — каждый под своим
+            # разрешением семафора, чтобы соблюдать *_max_concurrency
+            results = await asyncio.gather(
+                *(
+                    self._limited(
+                        adapter,
+                        adapter.place_limit_order(
+                            instrument=order.instrument,
+                            side=order.side,
+                            price=order.price,
+                            amount=order.amount,
+                            post_only=order.post_only,
+                            reduce_only=order.reduce_only,
+                            external_id=order.external_id,
+                        ),
+                    )
+                    for order in orders
+                )
+            )
         else:
-            logger.error("  → Ошибка: %s", result.error)
+            # Пакетный эндпоинт биржи — один запрос на весь пакет
+            results = await self._limited(adapter, adapter.place_limit_orders(orders))
 
-        return result.success
+        for action, result in zip(actions, results):
+            if result.success:
+                logger.info("  → %s: ордер выставлен: %s", action.instrument, result.id)
+            else:
+                logger.error("  → %s: ошибка: %s", action.instrument, result.error)
+        if any(result.success for result in results):
+            # Ордер резервирует маржу — следующий цикл должен перечитать баланс
+            self._cache.pop((exchange, "", "balance"), None)
 
     # -- Один цикл -----------------------------------------------------------
 
     async def _run_cycle(self) -> None:
         """Один цикл: сбор → расчёт → решение → (исполнение)."""
         self._cycle_count += 1
-        cycle_start = time.time()
+        cycle_start = time.monotonic()
 
-        logger.info("─" * 50)
-        logger.info("Цикл #%d", self._cycle_count)
+        logger.info("%s\nЦикл #%d", "─" * 50, self._cycle_count)
         primary_adapter = self._adapters.get(self._primary_exchange)
         secondary_adapter = self._adapters.get(self._secondary_exchange)
         if primary_adapter is None or secondary_adapter is None:
@@ -227,14 +482,13 @@ class DeltaNeutralController:
                 f"{self._primary_exchange}, {self._secondary_exchange}"
             )
 
-        for inst_cfg in self._config.instruments:
-            instrument = inst_cfg.symbol
+        # 1. Сбор состояния с обеих бирж по всем инструментам (один проход)
+        states = await self._collect_states(primary_adapter, secondary_adapter)
 
-            # 1. Сбор состояния с обеих бирж (параллельно)
-            ext_state, nado_state = await asyncio.gather(
-                self._collect_state(primary_adapter, instrument),
-                self._collect_state(secondary_adapter, instrument),
-            )
+        # Действия всех инструментов, сгруппированные по бирже
+        batches: dict[str, list[RebalanceAction]] = {}
+        for inst_cfg, (ext_state, nado_state) in zip(self._config.instruments, states):
+            instrument = inst_cfg.symbol
 
             # 2. Формируем снимок
             snapshot = DeltaSnapshot(
@@ -262,64 +516,84 @@ class DeltaNeutralController:
                         nado_state.reference_price,
                     )
                     continue
-
                 for action in decision.actions:
-                    success = await self._execute_action(action)
-                    if not success:
-                        logger.warning("Действие не удалось, пропускаем остальные")
-                        break
+                    batches.setdefault(action.exchange, []).append(action)
+                # После ордеров позиции могут измениться — следующий цикл собирает полностью
+                self._last_states.pop(instrument, None)
+
+        # Один пакетный запрос на биржу; биржи исполняются параллельно
+        if batches:
+            exchanges = list(batches)
+            results = await asyncio.gather(
+                *(self._execute_batch(exchange, batches[exchange]) for exchange in exchanges),
+                return_exceptions=True,
+            )
+            for exchange, result in zip(exchanges, results):
+                if isinstance(result, Exception):
+                    logger.error("Ошибка исполнения на %s: %s", exchange, result, exc_info=result)
 
-        elapsed = time.time() - cycle_start
+        elapsed = time.monotonic() - cycle_start
         logger.info("Цикл #%d завершён за %.2f сек", self._cycle_count, elapsed)
 
     def _log_decision(self, snapshot: DeltaSnapshot, decision: DeltaDecision) -> None:
         """Вывести результаты анализа в лог."""
-        ext = snapshot.extended_state
-        nado = snapshot.nado_state
-
-        status = "OK" if decision.within_tolerance else "IMBALANCE"
-        logger.info(
-            "[%s] %s | delta=%.6f (%.2f USD) | "
-            "%s_pos=%.6f %s_pos=%.6f | "
-            "%s_ref=%.2f %s_ref=%.2f | "
-            "%s_bal=%.2f %s_bal=%.2f | "
-            "%s_orders=%d %s_orders=%d",
-            status,
-            decision.instrument,
-            decision.net_delta,
-            decision.net_delta_usd,
-            ext.exchange,
-            snapshot.extended_position,
-            nado.exchange,
-            snapshot.nado_position,
-            ext.exchange,
-            ext.reference_price,
-            nado.exchange,
-            nado.reference_price,
-            ext.exchange,
-            ext.balance.equity,
-            nado.exchange,
-            nado.balance.equity,
-            ext.exchange,
-            len(ext.open_orders),
-            nado.exchange,
-            len(nado.open_orders),
-        )
+        # Сводка на ~20 аргументов и свойства снимка вычисляются только при включённом INFO
+        info = logger.isEnabledFor(logging.INFO)
+        if info:
+            ext = snapshot.extended_state
+            nado = snapshot.nado_state
+
+            status = "OK" if decision.within_tolerance else "IMBALANCE"
+            logger.info(
+                "[%s] %s | delta=%.6f (%.2f USD) | "
+                "%s_pos=%.6f %s_pos=%.6f | "
+                "%s_ref=%.2f %s_ref=%.2f | "
+                "%s_bal=%.2f %s_bal=%.2f | "
+                "%s_orders=%d %s_orders=%d",
+                status,
+                decision.instrument,
+                decision.net_delta,
+                decision.net_delta_usd,
+                ext.exchange,
+                snapshot.extended_position,
+                nado.exchange,
+                snapshot.nado_position,
+                ext.exchange,
+                ext.reference_price,
+                nado.exchange,
+                nado.reference_price,
+                ext.exchange,
+                ext.balance.equity,
+                nado.exchange,
+                nado.balance.equity,
+                ext.exchange,
+                len(ext.open_orders),
+                nado.exchange,
+                len(nado.open_orders),
+            )
 
-        for warn in decision.warnings:
-            logger.warning("  ⚠ %s", warn)
+        if decision.warnings and logger.isEnabledFor(logging.WARNING):
+            for warn in decision.warnings:
+                logger.warning("  ⚠ %s", warn)
 
+        if not info:
+            return
         if decision.actions:
-            for action in decision.actions:
-                logger.info(
-                    "  → ACTION: %s %.6f %s @ %.2f on %s (%s)",
-                    action.side.value.upper(),
-                    action.amount,
-                    action.instrument,
-                    action.price,
-                    action.exchange.upper(),
-                    action.reason,
+            # Все действия — одной записью лога, а не записью на каждое
+            logger.info(
+                "\n".join(
+                    "  → ACTION: %s %.6f %s @ %.2f on %s (%s)"
+                    % (
+                        action.side.value.upper(),
+                        action.amount,
+                        action.instrument,
+                        action.price,
+                        action.exchange.upper(),
+                        action.reason,
+                    )
+                    for action in decision.actions
                 )
+            )
         elif not decision.within_tolerance and self._config.mode == "monitor":
             logger.info("  → Режим monitor: действий не предпринимается")
 
@@ -328,8 +602,12 @@ class DeltaNeutralController:
     async def run(self) -> None:
         """Запустить основной цикл контроллера."""
         self._running = True
+        self._stop_event.clear()
         logger.info("Контроллер запущен (интервал %.1f сек)", self._config.cycle_interval_sec)
 
+        interval = self._config.cycle_interval_sec
+        # Циклы стартуют по сетке next_tick, чтобы время работы цикла не добавлялось к периоду
+        next_tick = time.monotonic() + interval
         try:
             while self._running:
                 try:
@@ -337,14 +615,29 @@ class DeltaNeutralController:
                 except Exception as e:
                     logger.error("Ошибка в цикле #%d: %s", self._cycle_count, e, exc_info=True)
 
-                # Пауза между циклами
-                await asyncio.sleep(self._config.cycle_interval_sec)
+                # Пауза до следующего тика; пропущенные тики не догоняем
+                now = time.monotonic()
+                if now > next_tick:
+                    missed = int((now - next_tick) // interval) + 1
+                    logger.warning(
+                        "Цикл #%d превысил интервал %.1f сек, пропущено тиков: %d",
+                        self._cycle_count,
+                        interval,
+                        missed,
+                    )
+                    next_tick += missed * interval
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), next_tick - now)
+                except asyncio.TimeoutError:
+                    pass
+                next_tick += interval
         except asyncio.CancelledError:
             logger.info("Контроллер отменён")
         finally:
             await self.close()
 
     def stop(self) -> None:
-        """Остановить контроллер."""
+        """Остановить контроллер после завершения текущего цикла."""
         self._running = False
+        self._stop_event.set()
         logger.info("Запрошена остановка контроллера")
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from controller.config import ControllerConfig
 from controller.models import (
@@ -16,13 +17,22 @@ from controller.models import (
 
 logger = logging.getLogger("dn.engine")
 
+# Дельта меньше этого значения считается нулевой (нечего выравнивать)
+_DELTA_EPSILON = 1e-12
+
+
+@lru_cache(maxsize=None)
+def _display_name(exchange: str) -> str:
+    """Имя биржи для предупреждений (напр. 'Extended'); кэшируется, набор бирж мал."""
+    return exchange.capitalize()
+
 
 # ---------------------------------------------------------------------------
 # Action models
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RebalanceAction:
     """Одно действие по выравниванию дельты."""
 
@@ -34,7 +44,7 @@ class RebalanceAction:
     reason: str  # Человекочитаемое обоснование
 
 
-@dataclass
+@dataclass(slots=True)
 class DeltaDecision:
     """Результат анализа дельты по одному инструменту."""
 
@@ -56,7 +66,19 @@ class DeltaEngine:
 
     def __init__(self, config: ControllerConfig):
         self._config = config
-        self._risk = config.risk
+        # ControllerConfig неизменяем — лимиты читаются один раз, а не на каждый analyze
+        risk = config.risk
+        self._monitor_only = config.mode == "monitor"
+        self._max_delta_base = float(risk.max_delta_base)
+        self._max_delta_usd = float(risk.max_delta_usd)
+        self._trigger_delta = float(risk.rebalance_trigger_delta)
+        self._exit_delta = float(risk.rebalance_exit_delta)
+        self._min_balance_usd = float(risk.min_balance_usd)
+        self._max_order_size_base = float(risk.max_order_size_base)
+        self._max_position_base = float(risk.max_position_base)
+        self._offset_factor = float(config.price_offset_pct) / 100
+        # Инструменты, по которым идёт выравнивание (гистерезис trigger/exit)
+        self._armed: dict[str, bool] = {}
 
     def analyze(self, snapshot: DeltaSnapshot) -> DeltaDecision:
         """Анализировать снимок и решить, нужно ли выравнивание.
@@ -73,8 +95,8 @@ class DeltaEngine:
         ref_price = snapshot.mid_reference_price
 
         # Проверяем допуски
-        within_base = abs(delta) <= self._risk.max_delta_base
-        within_usd = abs(delta_usd) <= self._risk.max_delta_usd
+        within_base = abs(delta) <= self._max_delta_base
+        within_usd = abs(delta_usd) <= self._max_delta_usd
         within_tolerance = within_base and within_usd
 
         decision = DeltaDecision(
@@ -87,8 +109,14 @@ class DeltaEngine:
         # Проверки безопасности
         self._check_safety(snapshot, decision)
 
-        # Если в допуске или только мониторинг — возвращаем без действий
-        if within_tolerance or self._config.mode == "monitor":
+        # Гистерезис: выравнивание включается при выходе за trigger (или USD-лимит)
+        # и продолжается, пока дельта не опустится ниже exit
+        abs_delta = abs(delta)
+        armed = self._update_armed(instrument, abs_delta, within_usd)
+
+        # Если не взведено, только мониторинг или выравнивать нечего — возвращаем без действий
+        # ref_price <= 0 уже отражён в decision.warnings через _check_safety
+        if not armed or self._monitor_only or abs_delta < _DELTA_EPSILON or ref_price <= 0:
             return decision
 
         # Генерируем действия по выравниванию
@@ -97,12 +125,22 @@ class DeltaEngine:
 
         return decision
 
+    def _update_armed(self, instrument: str, abs_delta: float, within_usd: bool) -> bool:
+        """Обновить и вернуть состояние гистерезиса выравнивания по инструменту."""
+        armed = self._armed.get(instrument, False)
+        if abs_delta > self._trigger_delta or not within_usd:
+            armed = True
+        elif abs_delta < self._exit_delta:
+            armed = False
+        self._armed[instrument] = armed
+        return armed
+
     def _check_safety(self, snapshot: DeltaSnapshot, decision: DeltaDecision) -> None:
         """Проверки безопасности: балансы, доступность данных."""
         ext = snapshot.extended_state
         nado = snapshot.nado_state
-        ext_name = ext.exchange.capitalize()
-        nado_name = nado.exchange.capitalize()
+        ext_name = _display_name(ext.exchange)
+        nado_name = _display_name(nado.exchange)
 
         # Проверяем наличие ref-цены
         if ext.reference_price <= 0:
@@ -111,13 +149,13 @@ class DeltaEngine:
             decision.warnings.append(f"{nado_name}: ref price = 0 для {snapshot.instrument}")
 
         # Проверяем минимальный баланс
-        if ext.balance.available < self._risk.min_balance_usd:
+        if ext.balance.available < self._min_balance_usd:
             decision.warnings.append(
-                f"{ext_name}: баланс {ext.balance.available:.2f} < мин. {self._risk.min_balance_usd}"
+                f"{ext_name}: баланс {ext.balance.available:.2f} < мин. {self._min_balance_usd}"
             )
-        if nado.balance.available < self._risk.min_balance_usd:
+        if nado.balance.available < self._min_balance_usd:
             decision.warnings.append(
-                f"{nado_name}: баланс {nado.balance.available:.2f} < мин. {self._risk.min_balance_usd}"
+                f"{nado_name}: баланс {nado.balance.available:.2f} < мин. {self._min_balance_usd}"
             )
 
         # Проверяем расхождение цен между биржами
@@ -141,115 +179,49 @@ class DeltaEngine:
         Стратегия: уменьшаем позицию на стороне с большей экспозицией,
         при необходимости увеличиваем на противоположной.
         """
-        if ref_price <= 0:
-            logger.warning("Ref price = 0, невозможно рассчитать ордера")
-            return []
-
-        actions: list[RebalanceAction] = []
         instrument = snapshot.instrument
 
         # delta > 0: суммарно long → нужно sell/сократить
         # delta < 0: суммарно short → нужно buy/увеличить
-        rebalance_amount = min(abs(delta), self._risk.max_order_size_base)
-
-        if rebalance_amount <= 0:
-            return []
+        # ref_price > 0 и |delta| >= _DELTA_EPSILON гарантирует analyze
+        rebalance_amount = min(abs(delta), self._max_order_size_base)
 
         # Определяем, на какой бирже действовать
         ext_pos = snapshot.extended_position
         nado_pos = snapshot.nado_position
-        ext_exchange = snapshot.extended_state.exchange
-        nado_exchange = snapshot.nado_state.exchange
-
-        offset = ref_price * self._config.price_offset_pct / 100
-
-        if delta > 0:
-            # Нужно sell для уменьшения дельты
-            # Продаём на бирже с большей long-позицией
-            if ext_pos >= nado_pos:
-                # Extended имеет больше long → продаём там
-                actions.append(
-                    RebalanceAction(
-                        exchange=ext_exchange,
-                        instrument=instrument,
-                        side=Side.SELL,
-                        amount=rebalance_amount,
-                        price=ref_price - offset,  # чуть ниже mid для maker
-                        reason=f"Reduce delta: sell on {ext_exchange} (pos={ext_pos:.6f})",
-                    )
-                )
-            else:
-                # Nado имеет больше long → продаём там
-                actions.append(
-                    RebalanceAction(
-                        exchange=nado_exchange,
-                        instrument=instrument,
-                        side=Side.SELL,
-                        amount=rebalance_amount,
-                        price=ref_price - offset,
-                        reason=f"Reduce delta: sell on {nado_exchange} (pos={nado_pos:.6f})",
-                    )
-                )
-        else:
-            # Нужно buy для уменьшения дельты
-            if ext_pos <= nado_pos:
-                # Extended имеет больше short → покупаем там
-                actions.append(
-                    RebalanceAction(
-                        exchange=ext_exchange,
-                        instrument=instrument,
-                        side=Side.BUY,
-                        amount=rebalance_amount,
-                        price=ref_price + offset,
-                        reason=f"Reduce delta: buy on {ext_exchange} (pos={ext_pos:.6f})",
-                    )
-                )
-            else:
-                actions.append(
-                    RebalanceAction(
-                        exchange=nado_exchange,
-                        instrument=instrument,
-                        side=Side.BUY,
-                        amount=rebalance_amount,
-                        price=ref_price + offset,
-                        reason=f"Reduce delta: buy on {nado_exchange} (pos={nado_pos:.6f})",
-                    )
-                )
-
-        # Валидация: не превышаем лимит позиции
-        actions = self._validate_actions(actions, snapshot)
 
-        return actions
+        # delta > 0: продаём на бирже с большей long-позицией, чуть ниже mid для maker;
+        # delta < 0: покупаем на бирже с большей short-позицией, чуть выше mid.
+        # При равных позициях действуем на Extended-стороне.
+        selling = delta > 0
+        use_ext = ext_pos >= nado_pos if selling else ext_pos <= nado_pos
+        if use_ext:
+            exchange, pos = snapshot.extended_state.exchange, ext_pos
+        else:
+            exchange, pos = snapshot.nado_state.exchange, nado_pos
+        side = Side.SELL if selling else Side.BUY
+
+        # Лимит позиции проверяем до создания действия
+        current = abs(pos)
+        if current + rebalance_amount > self._max_position_base:
+            logger.warning(
+                "Action skipped: %s on %s would exceed max_position_base (%.4f + %.4f > %.4f)",
+                side.value,
+                exchange,
+                current,
+                rebalance_amount,
+                self._max_position_base,
+            )
+            return []
 
-    def _validate_actions(
-        self,
-        actions: list[RebalanceAction],
-        snapshot: DeltaSnapshot,
-    ) -> list[RebalanceAction]:
-        """Отфильтровать действия, которые нарушают лимиты."""
-        validated = []
-        for action in actions:
-            # Проверяем, не превысим ли макс. позицию
-            if action.exchange == snapshot.extended_state.exchange:
-                current = abs(snapshot.extended_position)
-            elif action.exchange == snapshot.nado_state.exchange:
-                current = abs(snapshot.nado_position)
-            else:
-                logger.warning(
-                    "Action skipped: exchange '%s' not found in current snapshot",
-                    action.exchange,
-                )
-                continue
-
-            if current + action.amount > self._risk.max_position_base:
-                logger.warning(
-                    "Action skipped: %s on %s would exceed max_position_base (%.4f + %.4f > %.4f)",
-                    action.side.value,
-                    action.exchange,
-                    current,
-                    action.amount,
-                    self._risk.max_position_base,
-                )
-                continue
-            validated.append(action)
-        return validated
+        offset = ref_price * self._offset_factor
+        return [
+            RebalanceAction(
+                exchange=exchange,
+                instrument=instrument,
+                side=side,
+                amount=rebalance_amount,
+                price=ref_price - offset if selling else ref_price + offset,
+                reason=f"Reduce delta: {side.value} on {exchange} (pos={pos:.6f})",
+            )
+        ]
@@ -0,0 +1,29 @@
+"""Выбор event loop для точек входа контроллера.
+
+Реализация общая с ботом Extended (Extended/bot/event_loop.py). Модуль
+загружается по пути файла, а не через пакет bot: bot/__init__ импортирует
+x10 SDK, который не нужен контроллеру без Extended.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+_EVENT_LOOP_PATH = Path(__file__).resolve().parent.parent / "Extended" / "bot" / "event_loop.py"
+_MODULE_NAME = "_dn_extended_event_loop"
+
+
+def _load_event_loop_module():
+    """Загрузить Extended/bot/event_loop.py как отдельный модуль (один раз на процесс)."""
+    module = sys.modules.get(_MODULE_NAME)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(_MODULE_NAME, _EVENT_LOOP_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules[_MODULE_NAME] = module
+    return module
+
+
+install_uvloop = _load_event_loop_module().install_uvloop
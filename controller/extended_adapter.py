@@ -6,23 +6,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import logging
 import sys
+from collections.abc import Sequence
 from decimal import Decimal
 from pathlib import Path
 from typing import Optional
 
-# Добавляем Extended в sys.path для импорта
+# Добавляем Extended в конец sys.path, чтобы не затенять stdlib/site-packages.
+# Локальный SDK нужен, только если x10 не установлен (pip install -e python_sdk).
 _EXTENDED_ROOT = Path(__file__).resolve().parent.parent / "Extended"
-if str(_EXTENDED_ROOT) not in sys.path:
-    sys.path.insert(0, str(_EXTENDED_ROOT))
-_EXTENDED_SDK = _EXTENDED_ROOT / "python_sdk"
-if str(_EXTENDED_SDK) not in sys.path:
-    sys.path.insert(0, str(_EXTENDED_SDK))
+_EXTENDED_ROOT_STR = str(_EXTENDED_ROOT)
+_EXTENDED_SDK_STR = str(_EXTENDED_ROOT / "python_sdk")
+if _EXTENDED_ROOT_STR not in sys.path:
+    sys.path.append(_EXTENDED_ROOT_STR)
+# Дешёвая проверка sys.path первой: find_spec обходит файловую систему
+if _EXTENDED_SDK_STR not in sys.path and importlib.util.find_spec("x10") is None:
+    sys.path.append(_EXTENDED_SDK_STR)
 
 from bot.config import ExtendedBotConfig
 from bot.trading_bot import ExtendedTradingBot
-from x10.perpetual.orders import OrderSide
+from x10.perpetual.markets import MarketModel
+from x10.perpetual.orders import OpenOrderModel, OrderSide
 from x10.perpetual.positions import PositionSide
 
 from controller.interface import ExchangeAdapter
@@ -37,6 +44,18 @@ from controller.models import (
 
 logger = logging.getLogger("dn.extended")
 
+# Префикс id ордеров Extended в NormalizedOrder / PlacedOrderResult
+_ID_PREFIX = "ext:"
+# Ожидание первого снимка позиций/ордеров из WebSocket в start_stream
+_STREAM_READY_TIMEOUT_SEC = 10.0
+_STREAM_READY_POLL_SEC = 0.1
+# Срок, за который post-only ордер должен появиться в потоке ордеров WebSocket
+_POST_ONLY_CONFIRM_SEC = 0.5
+# Максимальное время без сообщений потока ордербука, при котором mid идёт в ref price
+# без REST. Дельта приходит на изменение любого уровня книги, а не только best bid/ask,
+# поэтому такая пауза на подписанном рынке означает, что поток остановился.
+_BOOK_MAX_AGE_SEC = 5.0
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -47,16 +66,29 @@ def _decimal_to_float(v: Decimal | None) -> float:
     return float(v) if v is not None else 0.0
 
 
-def _side_to_enum(side: OrderSide) -> Side:
-    return Side.BUY if side == OrderSide.BUY else Side.SELL
+_ORDER_SIDE: dict[OrderSide, Side] = {OrderSide.BUY: Side.BUY, OrderSide.SELL: Side.SELL}
+
+
+_POS_DIR: dict[PositionSide, PositionDirection] = {
+    PositionSide.LONG: PositionDirection.LONG,
+    PositionSide.SHORT: PositionDirection.SHORT,
+}
+
+
+def _round_to_market(market: MarketModel, price: float, amount: float) -> tuple[Decimal, Decimal]:
+    """Округлить цену и объём ордера правилами SDK (round_price / round_order_size).
+
+    Float переводится в Decimal через str, чтобы округлялось десятичное значение
+    (1.005), а не его двоичное приближение (1.00499…).
+    """
+    tc = market.trading_config
+    return tc.round_price(Decimal(str(price))), tc.round_order_size(Decimal(str(amount)))
 
 
 def _position_direction(side: PositionSide | None, size: float) -> PositionDirection:
-    if size == 0 or side is None:
+    if not size or side is None:
         return PositionDirection.FLAT
-    if side == PositionSide.LONG:
-        return PositionDirection.LONG
-    return PositionDirection.SHORT
+    return _POS_DIR.get(side, PositionDirection.SHORT)
 
 
 # ---------------------------------------------------------------------------
@@ -69,7 +101,7 @@ class ExtendedAdapter(ExchangeAdapter):
 
     def __init__(
         self,
-        env_file: str | None = None,
+        env_file: str | Path | None = None,
         instrument_map: dict[str, str] | None = None,
     ):
         """
@@ -78,9 +110,16 @@ class ExtendedAdapter(ExchangeAdapter):
             instrument_map: Маппинг логических символов → market_name.
                             Напр. {"BTC-PERP": "BTC-USD"}.
         """
-        self._env_file = env_file or str(_EXTENDED_ROOT / ".env")
+        self._env_file = str(env_file or _EXTENDED_ROOT / ".env")
         self._instrument_map = instrument_map or {}
+        # Пустые market_name отбрасываем сразу, чтобы горячий путь был одним обращением к dict
+        self._market_by_instrument: dict[str, str] = {
+            symbol: market for symbol, market in self._instrument_map.items() if market
+        }
         self._bot: Optional[ExtendedTradingBot] = None
+        # Post-only ордера, ещё не увиденные в потоке ордеров: order_id -> дедлайн (loop.time)
+        self._pending_post_only: dict[str, float] = {}
+        self._pending_reaper: Optional[asyncio.Task[None]] = None
 
     # -- Properties ----------------------------------------------------------
 
@@ -98,22 +137,69 @@ class ExtendedAdapter(ExchangeAdapter):
 
     def _to_market_name(self, instrument: str) -> str:
         """Логический символ → market_name на Extended."""
-        market = self._instrument_map.get(instrument)
-        if not market:
+        try:
+            return self._market_by_instrument[instrument]
+        except KeyError:
             raise ValueError(
                 f"Инструмент '{instrument}' не найден в instrument_map. "
                 f"Доступные: {list(self._instrument_map.keys())}"
-            )
-        return market
+            ) from None
 
     # -- Жизненный цикл ------------------------------------------------------
 
     async def initialize(self) -> None:
         config = ExtendedBotConfig.from_env(env_file=self._env_file)
         self._bot = ExtendedTradingBot(config)
+        if self._bot.websocket is not None:
+            self._bot.websocket.subscribe_to_orders_updates(self._on_orders_update)
         logger.info("Extended adapter initialized (env=%s)", self._env_file)
 
+    async def start_stream(self) -> None:
+        """Подписаться на ордербуки рынков и запустить WebSocket аккаунта.
+
+        Позиции и ордера читаются из кэша WebSocket (use_cache=True), пока поток
+        синхронизирован (is_synced); на время переподключения — через REST.
+        Если первый снимок не пришёл за _STREAM_READY_TIMEOUT_SEC, WebSocket
+        аккаунта останавливается и адаптер продолжает работать через REST.
+        """
+        bot = self.bot
+        markets = sorted(set(self._market_by_instrument.values()))
+        # Прогреваем кэш рынков (tick/size), чтобы первый place_limit_order не ждал REST
+        warmup = bot.markets.find_market(markets[0]) if markets else asyncio.sleep(0)
+        warmup_result, *results = await asyncio.gather(
+            warmup,
+            *(bot.markets.subscribe_orderbook(market, start=True) for market in markets),
+            return_exceptions=True,
+        )
+        if isinstance(warmup_result, Exception):
+            logger.warning("Extended: не удалось загрузить рынки заранее: %s", warmup_result)
+        for market, result in zip(markets, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Extended: ордербук %s недоступен, ref price через REST: %s", market, result
+                )
+
+        await bot.start_websocket()
+        wsm = bot.websocket
+        if wsm is None:
+            return
+        deadline = asyncio.get_running_loop().time() + _STREAM_READY_TIMEOUT_SEC
+        while not wsm.is_synced:
+            if asyncio.get_running_loop().time() >= deadline:
+                logger.warning(
+                    "Extended: нет снимка аккаунта из WebSocket за %.0f сек, используем REST",
+                    _STREAM_READY_TIMEOUT_SEC,
+                )
+                await bot.stop_websocket()
+                return
+            await asyncio.sleep(_STREAM_READY_POLL_SEC)
+        logger.info("Extended: WebSocket аккаунта и ордербуки (%d) запущены", len(markets))
+
     async def close(self) -> None:
+        if self._pending_reaper is not None:
+            self._pending_reaper.cancel()
+            self._pending_reaper = None
+        self._pending_post_only.clear()
         if self._bot:
             await self._bot.close()
             logger.info("Extended adapter closed")
@@ -163,33 +249,34 @@ class ExtendedAdapter(ExchangeAdapter):
     async def get_open_orders(self, instrument: str) -> list[NormalizedOrder]:
         market_name = self._to_market_name(instrument)
         resp = await self.bot.account.get_open_orders(market_names=[market_name], use_cache=True)
-        orders = resp.data or []
-        result = []
-        for o in orders:
-            result.append(
-                NormalizedOrder(
-                    id=f"ext:{o.id}",
-                    instrument=instrument,
-                    side=_side_to_enum(o.side),
-                    price=_decimal_to_float(o.price),
-                    amount=_decimal_to_float(o.qty),
-                    filled=_decimal_to_float(o.filled_qty),
-                    post_only=o.post_only,
-                    reduce_only=o.reduce_only,
-                )
+        # Конверсия без вызова хелперов на каждое поле: get_open_orders — самый частый опрос
+        _f = float
+        side_of = _ORDER_SIDE.get
+        return [
+            NormalizedOrder(
+                id=_ID_PREFIX + str(o.id),
+                instrument=instrument,
+                side=side_of(o.side, Side.SELL),
+                price=_f(o.price) if o.price is not None else 0.0,
+                amount=_f(o.qty) if o.qty is not None else 0.0,
+                filled=_f(o.filled_qty) if o.filled_qty is not None else 0.0,
+                post_only=o.post_only,
+                reduce_only=o.reduce_only,
             )
-        return result
+            for o in resp.data or ()
+        ]
 
     # -- Референсная цена ----------------------------------------------------
 
     async def get_reference_price(self, instrument: str) -> float:
-        """Mid price из ордербука или mark price из статистики рынка."""
-        bid, ask = await self.get_best_bid_ask(instrument)
-        if bid > 0 and ask > 0:
+        """Mid price из свежего ордербука или mark price из статистики рынка."""
+        market_name = self._to_market_name(instrument)
+        bid, ask, age = self._book_best_bid_ask(market_name)
+        if bid > 0 and ask > 0 and age < _BOOK_MAX_AGE_SEC:
             return (bid + ask) / 2
 
-        market_name = self._to_market_name(instrument)
-        # Fallback: mark price из статистики рынка
+        # Ордербук устарел или не подписан: mark price из статистики рынка.
+        # Fallback на позицию убран: такая цена слишком стара для решений.
         try:
             resp = await self.bot.client.markets_info.get_market_statistics(market_name=market_name)
             if resp.data and resp.data.mark_price:
@@ -197,23 +284,31 @@ class ExtendedAdapter(ExchangeAdapter):
         except Exception as e:
             logger.warning("Failed to get market statistics for %s: %s", market_name, e)
 
-        # Fallback: mark price из позиции
-        pos = await self.get_position(instrument)
-        if pos.mark_price > 0:
-            return pos.mark_price
-
         return 0.0
 
-    async def get_best_bid_ask(self, instrument: str) -> tuple[float, float]:
-        """Лучшие bid/ask из websocket orderbook или REST snapshot."""
-        market_name = self._to_market_name(instrument)
+    def _book_best_bid_ask(self, market_name: str) -> tuple[float, float, float]:
+        """Лучшие bid/ask из websocket orderbook и возраст top-of-book в секундах.
+
+        Returns:
+            (bid, ask, age); (0.0, 0.0, inf), если ордербук не подписан или пуст.
+        """
+        markets = self.bot.markets
         try:
-            # Пробуем из живого ордербука (если подписан)
-            best_bid, best_ask = self.bot.markets.get_best_bid_ask(market_name)
-            if best_bid and best_ask:
-                return _decimal_to_float(best_bid.price), _decimal_to_float(best_ask.price)
+            best_bid, best_ask = markets.get_best_bid_ask(market_name)
+            age = markets.get_orderbook_age(market_name)
+            if best_bid and best_ask and age is not None:
+                return _decimal_to_float(best_bid.price), _decimal_to_float(best_ask.price), age
         except Exception:
             pass
+        return 0.0, 0.0, float("inf")
+
+    async def get_best_bid_ask(self, instrument: str) -> tuple[float, float]:
+        """Лучшие bid/ask из websocket orderbook или REST snapshot."""
+        market_name = self._to_market_name(instrument)
+        # Пробуем из живого ордербука (если подписан)
+        bid, ask, _ = self._book_best_bid_ask(market_name)
+        if bid > 0 and ask > 0:
+            return bid, ask
 
         # Fallback: REST orderbook snapshot
         try:
@@ -254,15 +349,8 @@ class ExtendedAdapter(ExchangeAdapter):
                     error=f"Market {market_name} not found",
                 )
 
-            # Округляем цену до допустимой точности (tick size)
-            price_decimal = Decimal(str(price))
-            rounded_price = market_info.trading_config.round_price(price_decimal)
-
-            # Округляем объём до шага min_order_size_change
-            tc = market_info.trading_config
-            amount_decimal = Decimal(str(amount))
-            rounded_amount = tc.round_order_size(amount_decimal)
-            amount = float(rounded_amount)
+            # Округляем цену до tick size и объём до шага min_order_size_change
+            rounded_price, rounded_amount = _round_to_market(market_info, price, amount)
 
             resp = await self.bot.orders.place_order(
                 market_name=market_name,
@@ -273,45 +361,75 @@ class ExtendedAdapter(ExchangeAdapter):
                 reduce_only=reduce_only,
                 external_id=external_id,
             )
-            order_data = resp.data
-            order_id = f"ext:{order_data.id}"
-            # Для post-only ордера проверяем, что он действительно появился в open orders.
-            # Это надёжнее, чем дергать отдельный status endpoint, который может флапать.
+            order_id = _ID_PREFIX + str(resp.data.id)
+            # Ответ place_order считаем подтверждением; появление post-only ордера
+            # в книге сверяем асинхронно по потоку ордеров WebSocket.
             if post_only:
-                open_orders = await self.get_open_orders(instrument)
-                if not any(o.id == order_id for o in open_orders):
-                    error = "Extended post-only order not visible in open orders right after placement"
-                    logger.error(
-                        "Order not visible on Extended after placement: %s %s %s @ %s, id=%s",
-                        side.value,
-                        amount,
-                        instrument,
-                        price,
-                        order_id,
-                    )
-                    return PlacedOrderResult(id="", success=False, error=error)
-
-            logger.info(
-                "Order placed on Extended: %s %s %s @ %s, id=%s",
-                side.value,
-                amount,
-                instrument,
-                price,
-                order_id,
-            )
+                self._track_post_only(market_name, resp.data.id)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Order placed on Extended: %s %s %s @ %s, id=%s",
+                    side.value,
+                    float(rounded_amount),
+                    instrument,
+                    price,
+                    order_id,
+                )
             return PlacedOrderResult(id=order_id, success=True)
         except Exception as e:
             logger.error("Failed to place order on Extended: %s", e)
             return PlacedOrderResult(id="", success=False, error=str(e))
 
+    # -- Сверка post-only ордеров по WebSocket -------------------------------
+
+    def _track_post_only(self, market_name: str, raw_id: int) -> None:
+        """Поставить post-only ордер в ожидание подтверждения из потока ордеров."""
+        wsm = self.bot.websocket
+        if wsm is None or not wsm.is_synced:
+            return
+        # Обновление ордеров из потока могло прийти раньше ответа REST
+        if wsm.has_cached_order(market_name, raw_id):
+            return
+        loop = asyncio.get_running_loop()
+        self._pending_post_only[_ID_PREFIX + str(raw_id)] = loop.time() + _POST_ONLY_CONFIRM_SEC
+        if self._pending_reaper is None or self._pending_reaper.done():
+            self._pending_reaper = loop.create_task(self._reap_unconfirmed())
+
+    async def _on_orders_update(self, orders: Sequence[OpenOrderModel]) -> None:
+        """Снять с ожидания post-only ордера, появившиеся в снапшоте ордеров."""
+        pending = self._pending_post_only
+        if not pending:
+            return
+        for order in orders:
+            pending.pop(_ID_PREFIX + str(order.id), None)
+
+    async def _reap_unconfirmed(self) -> None:
+        """Логировать post-only ордера, не появившиеся в потоке до дедлайна."""
+        loop = asyncio.get_running_loop()
+        pending = self._pending_post_only
+        while pending:
+            await asyncio.sleep(max(0.0, min(pending.values()) - loop.time()))
+            now = loop.time()
+            for order_id, deadline in list(pending.items()):
+                if deadline <= now:
+                    del pending[order_id]
+                    logger.warning(
+                        "Extended: post-only ордер %s не появился в потоке ордеров за %.1f сек "
+                        "(отклонён или сразу исполнен)",
+                        order_id,
+                        _POST_ONLY_CONFIRM_SEC,
+                    )
+
     # -- Отмена ордера -------------------------------------------------------
 
     async def cancel_order(self, instrument: str, order_id: str) -> bool:
         try:
             # order_id имеет формат "ext:12345"
-            raw_id = int(order_id.replace("ext:", ""))
+            raw_id = int(order_id.removeprefix(_ID_PREFIX))
             await self.bot.orders.cancel_order(order_id=raw_id)
-            logger.info("Order cancelled on Extended: %s", order_id)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Order cancelled on Extended: %s", order_id)
             return True
         except Exception as e:
             logger.error("Failed to cancel order %s on Extended: %s", order_id, e)
@@ -324,7 +442,8 @@ class ExtendedAdapter(ExchangeAdapter):
             orders = await self.get_open_orders(instrument)
             count = len(orders)
             await self.bot.orders.cancel_all_orders(market_name=market_name)
-            logger.info("Cancelled %d orders on Extended for %s", count, instrument)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Cancelled %d orders on Extended for %s", count, instrument)
             return count
         except Exception as e:
             logger.error("Failed to cancel all orders on Extended: %s", e)
@@ -6,9 +6,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from controller.models import (
+    LimitOrderRequest,
     NormalizedBalance,
     NormalizedOrder,
     NormalizedPosition,
@@ -79,6 +81,38 @@ class ExchangeAdapter(ABC):
             PlacedOrderResult с id ордера и статусом.
         """
 
+    async def place_limit_orders(
+        self,
+        orders: list[LimitOrderRequest],
+    ) -> list[PlacedOrderResult]:
+        """Выставить несколько лимитных ордеров.
+
+        Базовая реализация параллельно вызывает place_limit_order; адаптеры
+        биржи с пакетным эндпоинтом переопределяют метод одним запросом.
+
+        Args:
+            orders: Параметры ордеров.
+
+        Returns:
+            PlacedOrderResult для каждого ордера в том же порядке.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.place_limit_order(
+                        instrument=order.instrument,
+                        side=order.side,
+                        price=order.price,
+                        amount=order.amount,
+                        post_only=order.post_only,
+                        reduce_only=order.reduce_only,
+                        external_id=order.external_id,
+                    )
+                    for order in orders
+                )
+            )
+        )
+
     @abstractmethod
     async def cancel_order(self, instrument: str, order_id: str) -> bool:
         """Отменить ордер по ID. Возвращает True если отменён."""
@@ -93,6 +127,14 @@ class ExchangeAdapter(ABC):
     async def initialize(self) -> None:
         """Инициализация адаптера (подключение, кэши и т.д.)."""
 
+    async def start_stream(self) -> None:
+        """Запустить фоновые потоки данных (WebSocket), если биржа их поддерживает.
+
+        После запуска get_position / get_open_orders / get_reference_price могут
+        отвечать из кэша, наполняемого потоком. По умолчанию адаптер работает
+        только через REST и метод ничего не делает.
+        """
+
     @abstractmethod
     async def close(self) -> None:
         """Корректное закрытие соединений."""
@@ -2,11 +2,32 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Фоновый поток, пишущий записи из очереди в консоль и файл
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def stop_logging() -> None:
+    """Остановить поток логирования, дописав оставшиеся в очереди записи.
+
+    Повторный вызов ничего не делает. Регистрируется в atexit, поэтому точке
+    входа достаточно вызвать setup_logging.
+    """
+    global _listener
+    if _listener is not None:
+        listener, _listener = _listener, None
+        listener.stop()
+
+
+atexit.register(stop_logging)
+
 
 def setup_logging(
     level: str = "INFO",
@@ -14,10 +35,17 @@ def setup_logging(
 ) -> None:
     """Настроить логирование контроллера.
 
+    Логгер dn пишет записи в очередь, а вывод в консоль и файл выполняет
+    QueueListener в отдельном потоке — event loop не блокируется на I/O.
+    Очередь дописывается при выходе из процесса (atexit) или по stop_logging().
+
     Args:
         level: Уровень логирования (DEBUG, INFO, WARNING, ERROR).
         log_file: Путь к файлу лога (опционально).
     """
+    global _listener
+    stop_logging()
+
     log_format = "%(asctime)s | %(levelname)-7s | %(name)-16s | %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
 
@@ -36,12 +64,15 @@ def setup_logging(
         file_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
         handlers.append(file_handler)
 
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
     # Настраиваем корневой логгер для dn.*
     root_logger = logging.getLogger("dn")
     root_logger.setLevel(getattr(logging, level.upper(), logging.INFO))
     root_logger.handlers.clear()
-    for handler in handlers:
-        root_logger.addHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     # Подавляем слишком подробные логи от SDK
     logging.getLogger("nado_grid").setLevel(logging.WARNING)
@@ -30,7 +30,7 @@ class PositionDirection(StrEnum):
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NormalizedBalance:
     """Баланс на бирже."""
 
@@ -39,7 +39,7 @@ class NormalizedBalance:
     currency: str = "USD"  # Валюта баланса
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NormalizedPosition:
     """Позиция по инструменту."""
 
@@ -56,7 +56,7 @@ class NormalizedPosition:
         return abs(self.size) * self.mark_price if self.mark_price else 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NormalizedOrder:
     """Открытый ордер на бирже."""
 
@@ -74,7 +74,20 @@ class NormalizedOrder:
         return self.amount - self.filled
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class LimitOrderRequest:
+    """Параметры лимитного ордера для пакетного выставления."""
+
+    instrument: str  # Логический символ
+    side: Side
+    price: float
+    amount: float  # Объём в базовом активе (> 0)
+    post_only: bool = True
+    reduce_only: bool = False
+    external_id: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
 class PlacedOrderResult:
     """Результат выставления ордера."""
 
@@ -83,7 +96,7 @@ class PlacedOrderResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExchangeState:
     """Полное состояние одной биржи по одному инструменту."""
 
@@ -98,7 +111,7 @@ class ExchangeState:
     timestamp: float = 0.0  # UNIX timestamp сбора
 
 
-@dataclass
+@dataclass(slots=True)
 class DeltaSnapshot:
     """Снимок дельты по одному инструменту."""
 
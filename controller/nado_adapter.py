@@ -21,13 +21,18 @@ _NADO_ROOT = _REPO_ROOT / "Nado"
 _LEGACY_NADO_GRID_ROOT = _REPO_ROOT / "legacy" / "Nado_grid_bot"
 
 _NADO_ROOT_STR = str(_NADO_ROOT.resolve())  # Абсолютный путь
-if _NADO_ROOT_STR not in sys.path:
-    sys.path.insert(0, _NADO_ROOT_STR)
-
 _NADO_SDK = _NADO_ROOT / "nado-python-sdk"
 _NADO_SDK_STR = str(_NADO_SDK.resolve())  # Абсолютный путь
-if _NADO_SDK_STR not in sys.path:
-    sys.path.insert(0, _NADO_SDK_STR)
+
+
+def _ensure_nado_paths() -> None:
+    """Добавить Nado и его SDK в начало sys.path одной операцией, пропуская уже добавленные."""
+    missing = [p for p in (_NADO_SDK_STR, _NADO_ROOT_STR) if p not in sys.path]
+    if missing:
+        sys.path[:0] = missing
+
+
+_ensure_nado_paths()
 
 # Runtime SDK patching intentionally removed.
 
@@ -86,7 +91,7 @@ class NadoAdapter(ExchangeAdapter):
 
     def __init__(
         self,
-        env_file: str | None = None,
+        env_file: str | Path | None = None,
         config_path: str | None = None,
         instrument_map: dict[str, int] | None = None,
         network: str = "mainnet",
@@ -103,7 +108,7 @@ class NadoAdapter(ExchangeAdapter):
             private_key: Приватный ключ (если не из .env).
             subaccount_name: Имя субаккаунта.
         """
-        self._env_file = env_file or str(_NADO_ROOT / ".env")
+        self._env_file = str(env_file or _NADO_ROOT / ".env")
         self._config_path = config_path
         self._instrument_map = instrument_map or {}
         self._network = network
@@ -141,10 +146,7 @@ class NadoAdapter(ExchangeAdapter):
         from dotenv import load_dotenv
 
         # Убеждаемся, что Nado в sys.path (на случай, если модуль перезагружался)
-        if _NADO_ROOT_STR not in sys.path:
-            sys.path.insert(0, _NADO_ROOT_STR)
-        if _NADO_SDK_STR not in sys.path:
-            sys.path.insert(0, _NADO_SDK_STR)
+        _ensure_nado_paths()
 
         # Загружаем .env для секретов
         load_dotenv(self._env_file)
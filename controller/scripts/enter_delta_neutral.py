@@ -31,6 +31,7 @@ if str(_DN_ROOT) not in sys.path:
     sys.path.insert(0, str(_DN_ROOT))
 
 from controller.config import ControllerConfig, load_config
+from controller.event_loop import install_uvloop
 from controller.interface import ExchangeAdapter
 from controller.models import Side
 
@@ -385,7 +386,7 @@ async def main() -> None:
     if hedge_retry_max_slippage_pct <= 0:
         hedge_retry_max_slippage_pct = 1.0
 
-    inst_cfg = next((i for i in cfg.instruments if i.symbol == symbol), None)
+    inst_cfg = cfg.instruments_by_symbol.get(symbol)
     if not inst_cfg:
         known = ", ".join(i.symbol for i in cfg.instruments) or "нет инструментов в config.yaml"
         raise SystemExit(f"Инструмент {symbol} не найден в config.yaml (доступно: {known})")
@@ -1289,6 +1290,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -79,9 +79,10 @@ if str(_DN_ROOT) not in sys.path:
     sys.path.insert(0, str(_DN_ROOT))
 
 from controller.config import load_config, ControllerConfig
+from controller.event_loop import install_uvloop
 from controller.extended_adapter import ExtendedAdapter
 from controller.interface import ExchangeAdapter
-from controller.models import Side
+from controller.models import NormalizedOrder, Side
 from controller.nado_adapter import NadoAdapter
 from controller.safety import LiveTradingSafetyError, require_live_confirmation
 from controller.variational_adapter import VariationalAdapter
@@ -380,6 +381,29 @@ async def _run_dry_run(
     )
 
 
+async def _wait_open_orders(
+    adapter: ExchangeAdapter,
+    instrument: str,
+    order_id: str,
+    present: bool,
+    timeout: float = 3.0,
+    interval: float = 0.25,
+) -> list[NormalizedOrder]:
+    """Опрашивать get_open_orders, пока ордер не появится (present) или не исчезнет.
+
+    Возвращается сразу, как только условие выполнено, вместо фиксированной паузы.
+
+    Returns:
+        list[NormalizedOrder]: Последний полученный список открытых ордеров.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        orders = await adapter.get_open_orders(instrument)
+        if any(o.id == order_id for o in orders) == present or time.monotonic() >= deadline:
+            return orders
+        await asyncio.sleep(interval)
+
+
 async def _run_live(
     adapter: ExchangeAdapter,
     instrument: str,
@@ -471,10 +495,9 @@ async def _run_live(
     placed_id = result.id
 
     # ── Проверяем, что ордер виден в get_open_orders ────────────────────
-    await asyncio.sleep(1)  # даём бирже время обработать
     t0 = time.monotonic()
     try:
-        orders_after = await adapter.get_open_orders(instrument)
+        orders_after = await _wait_open_orders(adapter, instrument, placed_id, present=True)
         dt = (time.monotonic() - t0) * 1000
         found = any(o.id == placed_id for o in orders_after)
         report.add(
@@ -548,10 +571,9 @@ async def _run_live(
         return
 
     # ── Проверяем, что ордер исчез из get_open_orders ───────────────────
-    await asyncio.sleep(1)
     t0 = time.monotonic()
     try:
-        orders_final = await adapter.get_open_orders(instrument)
+        orders_final = await _wait_open_orders(adapter, instrument, placed_id, present=False)
         dt = (time.monotonic() - t0) * 1000
         still_there = any(o.id == placed_id for o in orders_final)
         report.add(
@@ -1027,6 +1049,7 @@ async def _main() -> None:
 
 def main() -> None:
     """Точка входа (синхронная обёртка)."""
+    install_uvloop()
     asyncio.run(_main())
 
 
@@ -161,7 +161,17 @@ class VariationalClient:
             )
         elif aiohttp is not None:
             timeout = aiohttp.ClientTimeout(total=30)
-            self._session = aiohttp.ClientSession(headers=headers, timeout=timeout)
+            # Keep-alive пул: параллельные запросы цикла переиспользуют TCP/TLS соединения
+            connector = aiohttp.TCPConnector(
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=headers,
+                timeout=timeout,
+                connector=connector,
+            )
             logger.warning("curl_cffi not installed; using aiohttp fallback session for Variational")
         else:
             raise RuntimeError(
@@ -341,10 +351,10 @@ class VariationalAdapter(ExchangeAdapter):
 
     def __init__(
         self,
-        env_file: str | None = None,
+        env_file: str | Path | None = None,
         instrument_map: dict[str, str] | None = None,
     ):
-        self._env_file = env_file or "Variational/.env"
+        self._env_file = str(env_file or "Variational/.env")
         self._instrument_map = instrument_map or {}
         self._client: VariationalClient | None = None
         self._min_qty_cache: dict[str, float] = {}
@@ -0,0 +1,11 @@
+"""Общие настройки pytest: пути импорта пакетов репозитория."""
+
+import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# controller.* импортируется из корня репозитория, bot.* — из каталога Extended
+for _path in (_REPO_ROOT, _REPO_ROOT / "Extended"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
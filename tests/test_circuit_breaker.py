@@ -0,0 +1,149 @@
+"""Circuit breaker REST вызовов Extended: переходы состояний и учёт ошибок."""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+# Модуль загружается по пути: пакет bot при импорте тянет x10 SDK
+_PATH = Path(__file__).resolve().parent.parent / "Extended" / "bot" / "circuit_breaker.py"
+_spec = importlib.util.spec_from_file_location("extended_circuit_breaker", _PATH)
+circuit_breaker = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(circuit_breaker)
+
+CircuitBreaker = circuit_breaker.CircuitBreaker
+CircuitOpenError = circuit_breaker.CircuitOpenError
+is_transport_failure = circuit_breaker.is_transport_failure
+
+RECOVERY = 0.05
+
+
+class HttpError(Exception):
+    def __init__(self, status: int):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+async def _ok():
+    return "ok"
+
+
+async def _raise(error: Exception):
+    raise error
+
+
+async def _fail(breaker: CircuitBreaker, error: Exception, times: int) -> None:
+    for _ in range(times):
+        with pytest.raises(type(error)):
+            await breaker.call(_raise, error)
+
+
+def test_closed_open_half_open_closed():
+    async def scenario():
+        breaker = CircuitBreaker("BTC-USD", failure_threshold=3, recovery_timeout=RECOVERY)
+        assert breaker.state == "closed"
+
+        await _fail(breaker, ConnectionError("reset"), 3)
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(_ok)
+
+        await asyncio.sleep(RECOVERY * 2)
+        probe_started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_probe():
+            probe_started.set()
+            await release.wait()
+            return "probe"
+
+        probe = asyncio.create_task(breaker.call(slow_probe))
+        await probe_started.wait()
+        assert breaker.state == "half_open"
+        # Пока идёт пробный вызов, остальные отклоняются
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(_ok)
+
+        release.set()
+        assert await probe == "probe"
+        assert breaker.state == "closed"
+        assert await breaker.call(_ok) == "ok"
+
+    asyncio.run(scenario())
+
+
+def test_failed_probe_reopens():
+    async def scenario():
+        breaker = CircuitBreaker("BTC-USD", failure_threshold=2, recovery_timeout=RECOVERY)
+        await _fail(breaker, asyncio.TimeoutError(), 2)
+        await asyncio.sleep(RECOVERY * 2)
+
+        await _fail(breaker, asyncio.TimeoutError(), 1)
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(_ok)
+
+    asyncio.run(scenario())
+
+
+def test_request_errors_do_not_open_breaker():
+    async def scenario():
+        breaker = CircuitBreaker("BTC-USD", failure_threshold=2, recovery_timeout=RECOVERY)
+        await _fail(breaker, HttpError(400), 5)
+        await _fail(breaker, ValueError("insufficient margin"), 5)
+        assert breaker.state == "closed"
+        assert await breaker.call(_ok) == "ok"
+
+    asyncio.run(scenario())
+
+
+def test_request_error_resets_failure_streak():
+    async def scenario():
+        breaker = CircuitBreaker("BTC-USD", failure_threshold=2, recovery_timeout=RECOVERY)
+        await _fail(breaker, HttpError(503), 1)
+        await _fail(breaker, HttpError(422), 1)
+        await _fail(breaker, HttpError(503), 1)
+        assert breaker.state == "closed"
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (asyncio.TimeoutError(), True),
+        (ConnectionResetError(), True),
+        (HttpError(500), True),
+        (HttpError(503), True),
+        (HttpError(400), False),
+        (HttpError(429), False),
+        (ValueError("bad order"), False),
+    ],
+)
+def test_is_transport_failure(error, expected):
+    assert is_transport_failure(error) is expected
+
+
+def test_slow_failure_starts_cooldown_when_it_fails():
+    async def slow_timeout():
+        await asyncio.sleep(RECOVERY * 2)
+        raise asyncio.TimeoutError()
+
+    async def scenario():
+        breaker = CircuitBreaker("BTC-USD", failure_threshold=1, recovery_timeout=RECOVERY)
+        with pytest.raises(asyncio.TimeoutError):
+            await breaker.call(slow_timeout)
+
+        # Вызов длился дольше recovery_timeout, но отсчёт начинается с момента ошибки
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(_ok)
+
+        await asyncio.sleep(RECOVERY * 2)
+        assert await breaker.call(_ok) == "ok"
+        assert breaker.state == "closed"
+
+    asyncio.run(scenario())
@@ -0,0 +1,105 @@
+"""Загрузка config.yaml: числовая схема, гистерезис и активная пара бирж."""
+
+import pytest
+import yaml
+
+from controller.config import ConfigValidationError, Exchange, load_config
+
+
+@pytest.fixture
+def write_config(tmp_path):
+    env_file = tmp_path / "extended.env"
+    env_file.write_text("")
+
+    def write(**overrides):
+        raw = {
+            "entry": {"primary_exchange": "extended", "secondary_exchange": "variational"},
+            "extended": {"env_file": str(env_file)},
+            "variational": {"env_file": None},
+            "instruments": [
+                {
+                    "symbol": "BTC-PERP",
+                    "extended_market_name": "BTC-USD",
+                    "variational_underlying": "BTC",
+                }
+            ],
+        }
+        for section, values in overrides.items():
+            if isinstance(values, dict):
+                raw.setdefault(section, {}).update(values)
+            else:
+                raw[section] = values
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.safe_dump(raw))
+        return str(path)
+
+    return write
+
+
+def test_defaults(write_config):
+    config = load_config(write_config())
+
+    assert config.cycle_interval_sec == 10.0
+    assert config.max_retries == 3
+    assert config.max_quiet_cycles == 0
+    assert config.extended_max_concurrency == 8
+    assert config.risk.max_delta_base == 0.01
+    assert config.active_exchanges == frozenset((Exchange.EXTENDED, Exchange.VARIATIONAL))
+    assert config.instruments_by_symbol["BTC-PERP"].extended_market_name == "BTC-USD"
+
+
+def test_numeric_values_are_coerced(write_config):
+    config = load_config(
+        write_config(
+            cycle_interval_sec="2.5",
+            max_quiet_cycles=3,
+            risk={"max_position_base": "2"},
+            extended={"max_concurrency": "4"},
+        )
+    )
+
+    assert config.cycle_interval_sec == 2.5
+    assert config.max_quiet_cycles == 3
+    assert config.risk.max_position_base == 2.0
+    assert config.extended_max_concurrency == 4
+    assert isinstance(config.extended_max_concurrency, int)
+
+
+@pytest.mark.parametrize(
+    "overrides, field",
+    [
+        ({"cycle_interval_sec": 0}, "cycle_interval_sec"),
+        ({"max_retries": -1}, "max_retries"),
+        ({"rpc_timeout_sec": "soon"}, "rpc_timeout_sec"),
+        ({"risk": {"max_order_size_base": 0}}, "risk.max_order_size_base"),
+        ({"risk": {"max_delta_usd": -5}}, "risk.max_delta_usd"),
+        ({"nado": {"max_concurrency": 0}}, "nado.max_concurrency"),
+    ],
+)
+def test_invalid_numeric_value_names_field(write_config, overrides, field):
+    with pytest.raises(ConfigValidationError, match=f"'{field}'"):
+        load_config(write_config(**overrides))
+
+
+def test_hysteresis_defaults_follow_max_delta_base(write_config):
+    config = load_config(write_config(risk={"max_delta_base": 0.2}))
+
+    assert config.risk.rebalance_trigger_delta == 0.2
+    assert config.risk.rebalance_exit_delta == 0.2
+
+
+def test_hysteresis_exit_above_trigger_is_rejected(write_config):
+    with pytest.raises(ConfigValidationError, match="rebalance_exit_delta"):
+        load_config(
+            write_config(risk={"rebalance_trigger_delta": 0.05, "rebalance_exit_delta": 0.1})
+        )
+
+
+def test_same_primary_and_secondary_is_rejected(write_config):
+    with pytest.raises(ConfigValidationError):
+        load_config(write_config(entry={"secondary_exchange": "extended"}))
+
+
+def test_missing_env_file_of_active_exchange(write_config, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_config(write_config(extended={"env_file": str(tmp_path / "missing.env")}))
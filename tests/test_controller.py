@@ -0,0 +1,222 @@
+"""DeltaNeutralController: переиспользование «тихих» снимков, исполнение и остановка."""
+
+import asyncio
+
+import pytest
+
+controller_module = pytest.importorskip("controller.controller")
+
+from controller.config import ControllerConfig, InstrumentConfig
+from controller.delta_engine import RebalanceAction
+from controller.interface import ExchangeAdapter
+from controller.models import (
+    NormalizedBalance,
+    NormalizedOrder,
+    NormalizedPosition,
+    PlacedOrderResult,
+    PositionDirection,
+    Side,
+)
+
+DeltaNeutralController = controller_module.DeltaNeutralController
+
+
+class FakeAdapter(ExchangeAdapter):
+    """Адаптер в памяти: считает вызовы и отдаёт заданные цену и ордера."""
+
+    def __init__(self, name: str, price: float = 100.0):
+        self._name = name
+        self.price = price
+        self.open_orders: list[NormalizedOrder] = []
+        self.calls = {"position": 0, "ref": 0}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def get_balance(self) -> NormalizedBalance:
+        return NormalizedBalance(equity=1000.0, available=1000.0)
+
+    async def get_position(self, instrument: str) -> NormalizedPosition:
+        self.calls["position"] += 1
+        return NormalizedPosition(instrument, 0.0, PositionDirection.FLAT)
+
+    async def get_open_orders(self, instrument: str) -> list[NormalizedOrder]:
+        return list(self.open_orders)
+
+    async def get_reference_price(self, instrument: str) -> float:
+        self.calls["ref"] += 1
+        return self.price
+
+    async def get_best_bid_ask(self, instrument: str) -> tuple[float, float]:
+        return self.price, self.price
+
+    async def place_limit_order(self, instrument, side, price, amount, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return PlacedOrderResult(id=f"{self._name}:1", success=True)
+
+    async def cancel_order(self, instrument: str, order_id: str) -> bool:
+        return True
+
+    async def cancel_all_orders(self, instrument: str) -> int:
+        return 0
+
+    async def initialize(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+def _controller(**overrides) -> DeltaNeutralController:
+    config = ControllerConfig(instruments=[InstrumentConfig(symbol="BTC-PERP")], **overrides)
+    return DeltaNeutralController(config)
+
+
+def _collect_cycles(controller, primary, secondary, cycles, before_cycle=None):
+    """Прогнать несколько сборов состояния, как в последовательных циклах."""
+
+    async def run():
+        controller._sem = {
+            primary.name: asyncio.Semaphore(4),
+            secondary.name: asyncio.Semaphore(4),
+        }
+        results = []
+        for cycle in range(cycles):
+            # TTL кэша запросов короче цикла — каждый цикл читает заново
+            controller._cache.clear()
+            if before_cycle is not None:
+                before_cycle(cycle)
+            results.append(await controller._collect_states(primary, secondary))
+        return results
+
+    return asyncio.run(run())
+
+
+def test_quiet_instrument_reuses_snapshot_up_to_limit():
+    controller = _controller(max_quiet_cycles=2)
+    primary, secondary = FakeAdapter("extended"), FakeAdapter("variational")
+
+    _collect_cycles(controller, primary, secondary, cycles=4)
+
+    # Цикл 1 — полный сбор, 2 и 3 — переиспользование, 4 — снова полный сбор
+    assert primary.calls["position"] == 2
+    assert secondary.calls["position"] == 2
+
+
+def test_price_move_forces_full_collection():
+    controller = _controller(max_quiet_cycles=5)
+    primary, secondary = FakeAdapter("extended"), FakeAdapter("variational")
+
+    def move_price(cycle):
+        if cycle == 1:
+            primary.price = 101.0
+
+    results = _collect_cycles(controller, primary, secondary, cycles=2, before_cycle=move_price)
+
+    assert primary.calls["position"] == 2
+    assert results[1][0][0].reference_price == 101.0
+
+
+def test_reuse_disabled_by_default():
+    controller = _controller()
+    primary, secondary = FakeAdapter("extended"), FakeAdapter("variational")
+
+    _collect_cycles(controller, primary, secondary, cycles=3)
+
+    assert primary.calls["position"] == 3
+
+
+def test_open_orders_prevent_reuse():
+    controller = _controller(max_quiet_cycles=5)
+    primary, secondary = FakeAdapter("extended"), FakeAdapter("variational")
+    primary.open_orders = [NormalizedOrder("o1", "BTC-PERP", Side.BUY, 99.0, 0.01)]
+
+    _collect_cycles(controller, primary, secondary, cycles=3)
+
+    assert primary.calls["position"] == 3
+
+
+def test_reused_snapshot_carries_fresh_price_and_timestamp():
+    controller = _controller(max_quiet_cycles=5)
+    primary, secondary = FakeAdapter("extended"), FakeAdapter("variational")
+
+    def nudge_price(cycle):
+        if cycle == 1:
+            primary.price = 100.001
+
+    results = _collect_cycles(controller, primary, secondary, cycles=2, before_cycle=nudge_price)
+
+    assert primary.calls["position"] == 1
+    reused = results[1][0][0]
+    assert reused.reference_price == 100.001
+    assert reused.timestamp >= results[0][0][0].timestamp
+
+
+def test_execute_batch_respects_exchange_concurrency():
+    controller = _controller()
+    adapter = FakeAdapter("extended")
+    controller._adapters = {"extended": adapter}
+    actions = [
+        RebalanceAction(
+            exchange="extended",
+            instrument="BTC-PERP",
+            side=Side.BUY,
+            amount=0.01,
+            price=100.0,
+            reason="test",
+        )
+        for _ in range(6)
+    ]
+
+    async def run():
+        controller._sem = {"extended": asyncio.Semaphore(2)}
+        await controller._execute_batch("extended", actions)
+
+    asyncio.run(run())
+    assert adapter.max_in_flight == 2
+
+
+def test_stop_interrupts_pause_between_cycles():
+    controller = _controller(cycle_interval_sec=60.0)
+    cycles = []
+
+    async def run_cycle():
+        cycles.append(len(cycles))
+
+    controller._run_cycle = run_cycle
+
+    async def run():
+        task = asyncio.create_task(controller.run())
+        await asyncio.sleep(0.01)
+        controller.stop()
+        await asyncio.wait_for(task, 1.0)
+
+    asyncio.run(run())
+    assert cycles == [0]
+
+
+def test_stop_lets_current_cycle_finish():
+    controller = _controller(cycle_interval_sec=60.0)
+    started, finished = [], []
+
+    async def run_cycle():
+        started.append(True)
+        await asyncio.sleep(0.05)
+        finished.append(True)
+
+    controller._run_cycle = run_cycle
+
+    async def run():
+        task = asyncio.create_task(controller.run())
+        await asyncio.sleep(0.01)
+        controller.stop()
+        await asyncio.wait_for(task, 1.0)
+
+    asyncio.run(run())
+    assert started == finished == [True]
@@ -0,0 +1,127 @@
+"""DeltaEngine: гистерезис выравнивания и лимит позиции."""
+
+import pytest
+
+from controller.config import ControllerConfig, RiskLimits
+from controller.delta_engine import DeltaEngine
+from controller.models import (
+    DeltaSnapshot,
+    ExchangeState,
+    NormalizedBalance,
+    NormalizedPosition,
+    PositionDirection,
+    Side,
+)
+
+REF_PRICE = 100.0
+
+
+def _state(exchange: str, size: float) -> ExchangeState:
+    direction = PositionDirection.LONG if size > 0 else PositionDirection.SHORT
+    return ExchangeState(
+        exchange=exchange,
+        instrument="BTC-PERP",
+        balance=NormalizedBalance(equity=1000.0, available=1000.0),
+        position=NormalizedPosition("BTC-PERP", size, direction if size else PositionDirection.FLAT),
+        reference_price=REF_PRICE,
+    )
+
+
+def _snapshot(ext_size: float, other_size: float) -> DeltaSnapshot:
+    return DeltaSnapshot(
+        instrument="BTC-PERP",
+        extended_state=_state("extended", ext_size),
+        nado_state=_state("variational", other_size),
+    )
+
+
+def _engine(mode: str = "auto", **risk) -> DeltaEngine:
+    limits = {
+        "max_delta_base": 0.1,
+        "max_delta_usd": 1e9,
+        "rebalance_trigger_delta": 0.1,
+        "rebalance_exit_delta": 0.02,
+        **risk,
+    }
+    return DeltaEngine(ControllerConfig(mode=mode, risk=RiskLimits(**limits)))
+
+
+def test_below_trigger_does_not_arm():
+    engine = _engine()
+    decision = engine.analyze(_snapshot(0.55, -0.5))
+    assert decision.within_tolerance
+    assert decision.actions == []
+
+
+def test_hysteresis_keeps_rebalancing_until_exit():
+    engine = _engine()
+
+    # Выход за trigger взводит выравнивание
+    armed = engine.analyze(_snapshot(0.65, -0.5))
+    assert len(armed.actions) == 1
+
+    # Между exit и trigger выравнивание продолжается
+    between = engine.analyze(_snapshot(0.55, -0.5))
+    assert len(between.actions) == 1
+    assert between.actions[0].amount == pytest.approx(0.05)
+
+    # Ниже exit — выключается; повторно в той же зоне не взводится
+    assert engine.analyze(_snapshot(0.51, -0.5)).actions == []
+    assert engine.analyze(_snapshot(0.55, -0.5)).actions == []
+
+
+def test_usd_limit_arms_below_trigger():
+    engine = _engine(max_delta_usd=1.0)
+    decision = engine.analyze(_snapshot(0.55, -0.5))
+    assert not decision.within_tolerance
+    assert len(decision.actions) == 1
+
+
+def test_hysteresis_is_per_instrument():
+    engine = _engine()
+    engine.analyze(_snapshot(0.65, -0.5))
+
+    other = _snapshot(0.55, -0.5)
+    other.instrument = "ETH-PERP"
+    assert engine.analyze(other).actions == []
+
+
+def test_action_side_price_and_exchange():
+    engine = _engine()
+
+    sell = engine.analyze(_snapshot(0.7, -0.5)).actions[0]
+    assert sell.side is Side.SELL
+    assert sell.exchange == "extended"
+    assert sell.price < REF_PRICE
+
+    engine = _engine()
+    buy = engine.analyze(_snapshot(0.5, -0.7)).actions[0]
+    assert buy.side is Side.BUY
+    assert buy.exchange == "variational"
+    assert buy.price > REF_PRICE
+
+
+def test_monitor_mode_never_acts():
+    engine = _engine(mode="monitor")
+    decision = engine.analyze(_snapshot(0.9, -0.5))
+    assert not decision.within_tolerance
+    assert decision.actions == []
+
+
+def test_position_cap_skips_action():
+    engine = _engine(max_position_base=0.5)
+    decision = engine.analyze(_snapshot(0.0, -0.49))
+    assert decision.actions == []
+
+
+def test_risk_limits_hysteresis_defaults_follow_max_delta_base():
+    limits = RiskLimits(max_delta_base=0.05)
+    assert limits.rebalance_trigger_delta == 0.05
+    assert limits.rebalance_exit_delta == 0.05
+
+    limits = RiskLimits(max_delta_base=0.05, rebalance_trigger_delta=0.08)
+    assert limits.rebalance_exit_delta == 0.08
+
+    engine = DeltaEngine(ControllerConfig(mode="auto", risk=RiskLimits(max_delta_base=0.05)))
+    # 0.03 < max_delta_base: выравнивание не взводится
+    assert engine.analyze(_snapshot(0.53, -0.5)).actions == []
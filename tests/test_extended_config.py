@@ -0,0 +1,76 @@
+"""ExtendedBotConfig.from_env: проверка обязательных переменных окружения."""
+
+import pytest
+
+pytest.importorskip("x10")
+
+from bot.config import ExtendedBotConfig
+
+_VARS = (
+    "X10_API_KEY",
+    "X10_PUBLIC_KEY",
+    "X10_PRIVATE_KEY",
+    "X10_VAULT_ID",
+    "X10_BUILDER_ID",
+    "X10_ENVIRONMENT",
+    "X10_MAX_INFLIGHT_ORDERS",
+)
+
+
+@pytest.fixture
+def env(monkeypatch, tmp_path):
+    for name in _VARS:
+        monkeypatch.delenv(name, raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text("")
+
+    def load(**values):
+        for name, value in values.items():
+            monkeypatch.setenv(name, value)
+        return ExtendedBotConfig.from_env(env_file=str(env_file))
+
+    return load
+
+
+def _valid(**overrides):
+    values = {
+        "X10_API_KEY": "key",
+        "X10_PUBLIC_KEY": "0xabc",
+        "X10_PRIVATE_KEY": "0xdef",
+        "X10_VAULT_ID": "7",
+    }
+    values.update(overrides)
+    return values
+
+
+def test_all_missing_vars_are_reported_together(env):
+    with pytest.raises(ValueError) as exc_info:
+        env(X10_API_KEY="key")
+
+    message = str(exc_info.value)
+    for name in ("X10_PUBLIC_KEY", "X10_PRIVATE_KEY", "X10_VAULT_ID"):
+        assert name in message
+    assert "X10_API_KEY" not in message
+
+
+def test_valid_env(env):
+    config = env(**_valid(X10_MAX_INFLIGHT_ORDERS="10"))
+
+    assert config.vault_id == 7
+    assert config.environment == "testnet"
+    assert config.builder_id is None
+    assert config.max_inflight_orders == 10
+
+
+@pytest.mark.parametrize(
+    "overrides, match",
+    [
+        ({"X10_PUBLIC_KEY": "abc"}, "X10_PUBLIC_KEY"),
+        ({"X10_PRIVATE_KEY": "def"}, "X10_PRIVATE_KEY"),
+        ({"X10_ENVIRONMENT": "devnet"}, "X10_ENVIRONMENT"),
+        ({"X10_MAX_INFLIGHT_ORDERS": "0"}, "X10_MAX_INFLIGHT_ORDERS"),
+    ],
+)
+def test_invalid_values(env, overrides, match):
+    with pytest.raises(ValueError, match=match):
+        env(**_valid(**overrides))
@@ -0,0 +1,75 @@
+"""MarketsManager Extended: возраст ордербука и закрытие."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("x10")
+
+from bot import markets
+
+
+class _Book:
+    """Ордербук с обработчиками сообщений как в SDK; top-of-book не меняется."""
+
+    def __init__(self):
+        self.handled = []
+
+    async def init_orderbook(self, data):
+        self.handled.append(("init", data))
+
+    async def update_orderbook(self, data):
+        self.handled.append(("update", data))
+
+
+def test_every_stream_message_is_stamped():
+    book = _Book()
+    stamps = []
+    markets._stamp_messages(book, lambda: stamps.append(len(book.handled)))
+
+    async def run():
+        await book.init_orderbook("snapshot")
+        await book.update_orderbook("delta-1")
+        await book.update_orderbook("delta-2")
+
+    asyncio.run(run())
+    # Отметка ставится перед обработкой каждого сообщения, даже без смены best bid/ask
+    assert stamps == [0, 1, 2]
+    assert book.handled == [("init", "snapshot"), ("update", "delta-1"), ("update", "delta-2")]
+
+
+def test_orderbook_age(monkeypatch):
+    manager = markets.MarketsManager(SimpleNamespace(), SimpleNamespace())
+    monkeypatch.setattr(markets.time, "monotonic", lambda: 100.0)
+
+    assert manager.get_orderbook_age("BTC-USD") is None
+    manager._orderbook_updated_at["BTC-USD"] = 97.5
+    assert manager.get_orderbook_age("BTC-USD") == 2.5
+
+
+def test_close_cancels_background_refresh():
+    started = []
+
+    async def get_markets_dict():
+        started.append(True)
+        await asyncio.sleep(10)
+        return {}
+
+    client = SimpleNamespace(markets_info=SimpleNamespace(get_markets_dict=get_markets_dict))
+    manager = markets.MarketsManager(client, SimpleNamespace())
+
+    async def run():
+        manager._markets_cache = {"BTC-USD": "market"}
+        # Кэш скоро истечёт: find_market запускает фоновое обновление
+        manager._markets_cache_expiry = markets.time.monotonic() + 1.0
+        assert await manager.find_market("BTC-USD") == "market"
+        refresh_task = manager._markets_refresh_task
+        await asyncio.sleep(0)
+        assert started
+
+        await manager.close()
+        assert refresh_task.cancelled()
+        assert manager._markets_refresh_task is None
+
+    asyncio.run(run())
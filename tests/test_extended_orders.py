@@ -0,0 +1,70 @@
+"""Массовая отмена ордеров Extended: разбиение на части, сводный ответ и ошибки частей."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("x10")
+
+from x10.utils.http import ResponseStatus
+
+from bot.orders import MASS_CANCEL_CHUNK_SIZE, MassCancelError, OrdersManager
+
+
+def _manager(mass_cancel) -> OrdersManager:
+    client = SimpleNamespace(orders=SimpleNamespace(mass_cancel=mass_cancel))
+    return OrdersManager(client)
+
+
+def test_short_list_is_one_request():
+    calls = []
+
+    async def mass_cancel(**kwargs):
+        calls.append(kwargs)
+        return "ok"
+
+    manager = _manager(mass_cancel)
+    result = asyncio.run(manager.cancel_all_orders(market_name="BTC-USD", order_ids=[1, 2]))
+
+    assert result == "ok"
+    assert len(calls) == 1
+    assert calls[0]["order_ids"] == [1, 2]
+
+
+def test_long_list_is_aggregated_into_one_response():
+    calls = []
+
+    async def mass_cancel(**kwargs):
+        calls.append(kwargs)
+        return "ok"
+
+    order_ids = list(range(2 * MASS_CANCEL_CHUNK_SIZE + 1))
+    manager = _manager(mass_cancel)
+    result = asyncio.run(manager.cancel_all_orders(order_ids=order_ids))
+
+    assert result.status == ResponseStatus.OK
+    assert len(calls) == 3
+    assert sorted(id_ for call in calls for id_ in call["order_ids"]) == order_ids
+
+
+def test_failed_chunk_is_reported_with_successful_responses():
+    async def mass_cancel(order_ids=None, **kwargs):
+        if order_ids[0] == MASS_CANCEL_CHUNK_SIZE:
+            raise ValueError("boom")
+        return "ok"
+
+    order_ids = list(range(3 * MASS_CANCEL_CHUNK_SIZE))
+    manager = _manager(mass_cancel)
+    with pytest.raises(MassCancelError) as exc_info:
+        asyncio.run(manager.cancel_all_orders(order_ids=order_ids))
+
+    error = exc_info.value
+    chunk = f"order_ids[{MASS_CANCEL_CHUNK_SIZE}:{2 * MASS_CANCEL_CHUNK_SIZE}]"
+    assert list(error.errors) == [chunk]
+    assert isinstance(error.errors[chunk], ValueError)
+    assert error.responses == {
+        f"order_ids[0:{MASS_CANCEL_CHUNK_SIZE}]": "ok",
+        f"order_ids[{2 * MASS_CANCEL_CHUNK_SIZE}:{3 * MASS_CANCEL_CHUNK_SIZE}]": "ok",
+    }
+    assert chunk in str(error)
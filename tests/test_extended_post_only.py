@@ -0,0 +1,64 @@
+"""Сверка post-only ордеров Extended по потоку ордеров WebSocket."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("x10")
+
+from bot.websocket_manager import WebSocketManager
+
+from controller.extended_adapter import ExtendedAdapter
+
+
+def _order(id_, market="BTC-USD"):
+    return SimpleNamespace(id=id_, market=market, side="BUY", type="LIMIT", status="NEW")
+
+
+def _adapter():
+    manager = WebSocketManager(
+        SimpleNamespace(stream_url="wss://example"), "api-key", stream_client=object()
+    )
+    adapter = ExtendedAdapter(instrument_map={"BTC-PERP": "BTC-USD"})
+    adapter._bot = SimpleNamespace(websocket=manager)
+    return adapter, manager
+
+
+async def _snapshot(manager, orders):
+    data = SimpleNamespace(balance=None, positions=None, orders=orders, trades=None)
+    await manager._handle_stream_event(SimpleNamespace(type="SNAPSHOT", seq=1, data=data))
+
+
+def test_order_seen_in_stream_before_rest_response_is_not_tracked():
+    adapter, manager = _adapter()
+
+    async def run():
+        # Поток ордеров опередил ответ place_order
+        await _snapshot(manager, [_order(42)])
+        adapter._track_post_only("BTC-USD", 42)
+
+    asyncio.run(run())
+    assert adapter._pending_post_only == {}
+    assert manager.has_cached_order("BTC-USD", 42)
+    assert not manager.has_cached_order("ETH-USD", 42)
+
+
+def test_order_not_yet_in_stream_is_tracked_until_update():
+    adapter, manager = _adapter()
+
+    async def run():
+        await _snapshot(manager, [])
+        adapter._track_post_only("BTC-USD", 42)
+        assert list(adapter._pending_post_only) == ["ext:42"]
+        await adapter._on_orders_update([_order(42)])
+        adapter._pending_reaper.cancel()
+
+    asyncio.run(run())
+    assert adapter._pending_post_only == {}
+
+
+def test_unsynced_stream_does_not_track():
+    adapter, _ = _adapter()
+    adapter._track_post_only("BTC-USD", 42)
+    assert adapter._pending_post_only == {}
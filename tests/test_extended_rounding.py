@@ -0,0 +1,67 @@
+"""Округление цены и объёма ордера Extended правилами SDK."""
+
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("x10")
+
+from x10.perpetual.markets import MarketModel, TradingConfigModel
+
+from controller.extended_adapter import _round_to_market
+
+TICK = Decimal("0.01")
+SIZE_STEP = Decimal("0.001")
+
+
+@pytest.fixture
+def market() -> MarketModel:
+    trading_config = TradingConfigModel.model_construct(
+        min_price_change=TICK,
+        min_order_size_change=SIZE_STEP,
+    )
+    return MarketModel.model_construct(trading_config=trading_config)
+
+
+@pytest.mark.parametrize(
+    "price, literal",
+    [
+        (1.005, "1.005"),
+        (0.015, "0.015"),
+        (2.675, "2.675"),
+        (65000.125, "65000.125"),
+    ],
+)
+def test_half_tick_price_rounds_like_decimal_literal(market, price, literal):
+    """На границе тика округляется десятичное значение, а не двоичное приближение float."""
+    rounded_price, _ = _round_to_market(market, price, 1.0)
+    assert rounded_price == market.trading_config.round_price(Decimal(literal))
+    assert rounded_price % TICK == 0
+
+
+@pytest.mark.parametrize(
+    "amount, literal",
+    [
+        (0.0015, "0.0015"),
+        (0.0025, "0.0025"),
+        (1.2345, "1.2345"),
+    ],
+)
+def test_half_step_amount_rounds_like_decimal_literal(market, amount, literal):
+    _, rounded_amount = _round_to_market(market, 100.0, amount)
+    assert rounded_amount == market.trading_config.round_order_size(Decimal(literal))
+    assert rounded_amount % SIZE_STEP == 0
+
+
+@pytest.mark.parametrize(
+    "price, amount",
+    [
+        (65000.1, 0.3),
+        (0.07, 0.001),
+        (123.45, 12.345),
+    ],
+)
+def test_values_on_grid_are_unchanged(market, price, amount):
+    rounded_price, rounded_amount = _round_to_market(market, price, amount)
+    assert rounded_price == Decimal(str(price))
+    assert rounded_amount == Decimal(str(amount))
@@ -0,0 +1,308 @@
+"""Кэш позиций и ордеров WebSocket: снапшоты, инкрементальные обновления и синхронизация."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("x10")
+
+from bot import websocket_manager
+from bot.account import AccountManager
+from bot.websocket_manager import WebSocketManager
+
+
+def _manager() -> WebSocketManager:
+    return WebSocketManager(
+        SimpleNamespace(stream_url="wss://example"), "api-key", stream_client=object()
+    )
+
+
+def _position(id_, market, size, status="OPENED"):
+    return SimpleNamespace(id=id_, market=market, side="LONG", size=size, status=status)
+
+
+def _order(id_, market, status="NEW"):
+    return SimpleNamespace(id=id_, market=market, side="BUY", type="LIMIT", status=status)
+
+
+def _event(type_, positions=None, orders=None):
+    data = SimpleNamespace(balance=None, positions=positions, orders=orders, trades=None)
+    return SimpleNamespace(type=type_, seq=1, data=data)
+
+
+def _apply(manager, *events):
+    async def run():
+        for event in events:
+            await manager._handle_stream_event(event)
+
+    asyncio.run(run())
+
+
+def test_incremental_position_update_keeps_other_positions():
+    manager = _manager()
+    _apply(
+        manager,
+        _event("SNAPSHOT", positions=[_position(1, "BTC-USD", 1), _position(2, "ETH-USD", 5)]),
+        _event("POSITION", positions=[_position(2, "ETH-USD", 7)]),
+    )
+
+    positions = {p.id: p.size for p in manager.get_cached_positions()}
+    assert positions == {1: 1, 2: 7}
+    assert manager.has_cached_position("BTC-USD")
+
+
+def test_closed_position_is_removed():
+    manager = _manager()
+    _apply(
+        manager,
+        _event("SNAPSHOT", positions=[_position(1, "BTC-USD", 1), _position(2, "ETH-USD", 5)]),
+        _event("POSITION", positions=[_position(1, "BTC-USD", 0, status="CLOSED")]),
+    )
+
+    assert [p.id for p in manager.get_cached_positions()] == [2]
+    assert not manager.has_cached_position("BTC-USD")
+
+
+def test_snapshot_replaces_cache():
+    manager = _manager()
+    _apply(
+        manager,
+        _event("SNAPSHOT", positions=[_position(1, "BTC-USD", 1)]),
+        _event("SNAPSHOT", positions=[_position(3, "SOL-USD", 2)]),
+    )
+
+    assert [p.id for p in manager.get_cached_positions()] == [3]
+
+
+def test_incremental_order_update_merges_and_drops_terminal():
+    manager = _manager()
+    _apply(
+        manager,
+        _event("SNAPSHOT", orders=[_order(10, "BTC-USD"), _order(11, "BTC-USD")]),
+        _event("ORDER", orders=[_order(10, "BTC-USD", status="FILLED"), _order(12, "ETH-USD")]),
+    )
+
+    assert {o.id for o in manager.get_cached_orders()} == {11, 12}
+
+
+
+class _Stream:
+    """Account stream, отдающий заданные события и затем закрывающийся."""
+
+    def __init__(self, events, on_event=None):
+        self._events = iter(events)
+        self._on_event = on_event
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._on_event is not None:
+            self._on_event()
+        try:
+            return next(self._events)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def test_cache_is_synced_only_between_snapshot_and_disconnect():
+    seen = []
+    states = []
+    manager = _manager()
+    manager.subscribe_to_state_changes(states.append)
+    events = [_event("POSITION", positions=[]), _event("SNAPSHOT", positions=[]), _event("ORDER")]
+    manager._stream_client = SimpleNamespace(
+        subscribe_to_account_updates=lambda api_key: _Stream(
+            events, on_event=lambda: seen.append(manager.is_synced)
+        )
+    )
+
+    asyncio.run(manager._connect_and_listen())
+
+    # Инкрементальное событие не синхронизирует кэш; после SNAPSHOT — синхронизирован
+    assert seen == [False, False, True, True]
+    # Поток закрылся: до следующего SNAPSHOT кэш не используется
+    assert not manager.is_synced
+    assert states == [False, True, False]
+
+
+
+def test_account_manager_uses_rest_until_snapshot():
+    rest_calls = []
+
+    async def get_positions(**kwargs):
+        rest_calls.append(kwargs)
+        return SimpleNamespace(data=["rest"])
+
+    manager = _manager()
+    manager._is_running = True
+    client = SimpleNamespace(account=SimpleNamespace(get_positions=get_positions))
+    account = AccountManager(client, manager)
+
+    async def run():
+        stale = await account.get_positions(market_names=["BTC-USD"])
+        await manager._handle_stream_event(
+            _event("SNAPSHOT", positions=[_position(1, "BTC-USD", 1)])
+        )
+        cached = await account.get_positions(market_names=["BTC-USD"])
+        return stale, cached
+
+    stale, cached = asyncio.run(run())
+    assert stale.data == ["rest"]
+    assert [p.id for p in cached.data] == [1]
+    assert len(rest_calls) == 1
+
+
+
+def test_balance_updates_reach_subscribers_in_order():
+    manager = WebSocketManager(
+        SimpleNamespace(stream_url="wss://example"),
+        "api-key",
+        notify_window=0.001,
+        stream_client=object(),
+    )
+    received = []
+
+    async def on_balance(balance):
+        # Первое обновление обрабатывается дольше второго
+        await asyncio.sleep(0.05 if balance.balance == 1 else 0)
+        received.append(balance.balance)
+
+    manager.subscribe_to_balance_updates(on_balance)
+
+    def balance_event(value):
+        data = SimpleNamespace(
+            balance=SimpleNamespace(balance=value, collateral_name="USD", available_for_trade=0),
+            positions=None,
+            orders=None,
+            trades=None,
+        )
+        return SimpleNamespace(type="BALANCE", seq=value, data=data)
+
+    async def run():
+        await manager._handle_stream_event(balance_event(1))
+        await asyncio.sleep(0.01)  # окно coalescer'а закрылось, рассылка 1 ещё идёт
+        await manager._handle_stream_event(balance_event(2))
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+    assert received == [1, 2]
+    assert manager.get_cached_balance().balance == 2
+
+
+# -- Вспомогательные механизмы ------------------------------------------------
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_burst_then_rate(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(websocket_manager.time, "monotonic", clock)
+    bucket = websocket_manager._TokenBucket(rate=2.0, burst=3)
+
+    assert [bucket.allow() for _ in range(4)] == [True, True, True, False]
+
+    clock.now = 0.5  # +1 токен
+    assert bucket.allow()
+    assert not bucket.allow()
+
+    clock.now = 100.0  # накопление ограничено burst
+    assert [bucket.allow() for _ in range(4)] == [True, True, True, False]
+
+
+def test_coalescer_keeps_latest_payload_per_kind():
+    flushed = []
+
+    async def scenario():
+        coalescer = websocket_manager._Coalescer(
+            lambda kind, payload: flushed.append((kind, payload)), max_wait=0.01, max_items=100
+        )
+        coalescer.submit("positions", 1)
+        coalescer.submit("orders", "a")
+        coalescer.submit("positions", 2)
+        assert flushed == []
+        await asyncio.sleep(0.05)
+
+    asyncio.run(scenario())
+    assert sorted(flushed) == [("orders", "a"), ("positions", 2)]
+
+
+def test_coalescer_flushes_early_on_max_items():
+    flushed = []
+
+    async def scenario():
+        coalescer = websocket_manager._Coalescer(
+            lambda kind, payload: flushed.append((kind, payload)), max_wait=10.0, max_items=3
+        )
+        for payload in range(3):
+            coalescer.submit("positions", payload)
+        assert flushed == [("positions", 2)]
+
+        # Окно закрыто: следующее обновление открывает новое
+        coalescer.submit("positions", 3)
+        coalescer.cancel()
+
+    asyncio.run(scenario())
+    assert flushed == [("positions", 2)]
+
+
+def test_reconnect_delay_grows_with_jitter_and_cap():
+    manager = WebSocketManager(
+        SimpleNamespace(stream_url="wss://example"),
+        "api-key",
+        reconnect_base_delay=0.5,
+        reconnect_max_delay=8.0,
+        stream_client=object(),
+    )
+
+    delays = [manager._next_reconnect_delay() for _ in range(10)]
+    for attempt, delay in enumerate(delays, start=1):
+        ceiling = min(8.0, 0.5 * 2 ** (attempt - 1))
+        assert 0.5 <= delay <= min(8.0, ceiling * 3)
+
+    # После успешного события попытки считаются заново
+    manager._reconnect_attempt = 0
+    assert manager._next_reconnect_delay() <= 1.5
+
+
+def test_silent_server_reconnects_with_backoff():
+    manager = WebSocketManager(
+        SimpleNamespace(stream_url="wss://example"),
+        "api-key",
+        reconnect_base_delay=0.001,
+        reconnect_max_delay=0.001,
+        recv_timeout=0.01,
+        stream_client=object(),
+    )
+    attempts = []
+
+    class _SilentStream(_Stream):
+        async def __anext__(self):
+            await asyncio.sleep(1)
+
+    def subscribe(api_key):
+        attempts.append(manager._reconnect_attempt)
+        if len(attempts) == 3:
+            manager._is_running = False
+        return _SilentStream([])
+
+    manager._stream_client = SimpleNamespace(subscribe_to_account_updates=subscribe)
+    manager._is_running = True
+
+    asyncio.run(manager._run_connection_loop())
+
+    # Каждый таймаут watchdog проходит через backoff: счётчик попыток растёт
+    assert attempts == [0, 1, 2]